@@ -0,0 +1,92 @@
+import hashlib
+import os
+import pickle
+from typing import Any
+
+
+def fingerprint(*parts: Any) -> str:
+    """
+    Function is utilized to compute the hash of the provided inputs and configuration values
+    :param parts: values which define the result (strings, numbers and containers of them)
+    :return: hexadecimal SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(repr(part).encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+def file_fingerprint(path: str) -> str:
+    """
+    Function is utilized to compute the hash of the file content
+    :param path: path to the file
+    :return: hexadecimal SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as data:
+        for chunk in iter(lambda: data.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class StageArtifact:
+    """
+    Class is utilized to store the result of the pipeline stage along with the hash of its inputs and configuration.
+    Result is reused only if the hash matches, and per-row results are reused as long as configuration is the same, so
+    that only changed rows are recomputed
+    """
+    def __init__(self, path: str):
+        """
+        Method is utilized as an initializer of the class
+        :param path: path to the artifact file
+        """
+        self.path = path
+        self.stored = None
+
+    def read(self) -> dict:
+        """
+        Method is utilized to read the stored artifact (only once)
+        :return: dictionary of the artifact or empty dictionary if there is no (valid) artifact
+        """
+        if self.stored is None:
+            self.stored = dict()
+            if os.path.exists(self.path):
+                with open(self.path, 'rb') as data:
+                    stored = pickle.load(data)
+                if isinstance(stored, dict) and 'key' in stored:
+                    self.stored = stored
+        return self.stored
+
+    def load(self, key: str) -> Any:
+        """
+        Method is utilized to load the result of the stage
+        :param key: hash of the current inputs and configuration of the stage
+        :return: stored result if it was computed for the same key, otherwise None
+        """
+        stored = self.read()
+        return stored['value'] if stored.get('key') == key else None
+
+    def rows(self, config: str) -> dict:
+        """
+        Method is utilized to load per-row results of the previous run
+        :param config: hash of the current configuration of the stage
+        :return: dictionary of per-row results if they were computed with the same configuration, otherwise empty dict
+        """
+        stored = self.read()
+        return stored.get('rows', dict()) if stored.get('config') == config else dict()
+
+    def save(self, key: str, config: str, value: Any, rows: dict) -> None:
+        """
+        Method is utilized to store the result of the stage atomically
+        :param key: hash of the inputs and configuration of the stage
+        :param config: hash of the configuration of the stage
+        :param value: result of the stage
+        :param rows: per-row results which can be reused by the next run
+        :return: None
+        """
+        self.stored = {'key': key, 'config': config, 'value': value, 'rows': rows}
+        temporary_path = f'{self.path}.tmp'
+        with open(temporary_path, 'wb') as data:
+            pickle.dump(self.stored, data)
+        os.replace(temporary_path, self.path)
@@ -0,0 +1,545 @@
+import argparse
+import gzip
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Iterator
+
+from local_wiki import LocalWiki
+from metrics import Metrics
+from pipeline import PipelineContext
+from records import FactTable
+from utilities import collect_parameters
+
+PEOPLE = ['Albert Einstein', 'Marie Curie', 'Isaac Newton', 'Ada Lovelace', 'Alan Turing', 'Niels Bohr',
+          'Max Planck', 'Enrico Fermi', 'Leo Tolstoy', 'Jane Austen', 'Charles Darwin', 'Nikola Tesla']
+OBJECTS = {
+    'honour': ['Nobel Prize in Physics', 'Copley Medal', 'Royal Medal'],
+    'birth place': ['Ulm', 'Warsaw', 'London', 'Smiljan', 'Moscow'],
+    'death place': ['Princeton', 'Paris', 'Berlin', 'New York City'],
+    'spouse': ['Mileva Marić', 'Pierre Curie', 'Emma Darwin', 'Sophia Tolstaya'],
+    'team': ['Real Madrid', 'Chelsea F.C.', 'FC Barcelona'],
+    'author': ['War and Peace', 'Pride and Prejudice', 'On the Origin of Species']
+}
+SIZES = [1000, 4000, 16000]
+
+
+def collect_arguments() -> argparse.Namespace:
+    """
+    Function is utilized to collect arguments of the benchmark suite
+    :return: Namespace object that includes all arguments
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', default=SIZES, nargs='+', required=False, type=int)
+    parser.add_argument('--fixtures', default=None, required=False, type=str)
+    parser.add_argument('--dataset', default=None, required=False, type=str)
+    parser.add_argument('--record', default=None, required=False, type=str)
+    parser.add_argument('--output', default='benchmark_results.json', required=False, type=str)
+    parser.add_argument('--baseline', default=None, required=False, type=str)
+    parser.add_argument('--save_baseline', default=False, required=False, action='store_true')
+    parser.add_argument('--tolerance', default=0.25, required=False, type=float)
+    parser.add_argument('--memory', default=True, required=False, action=argparse.BooleanOptionalAction)
+    parser.add_argument('--min_match_rate', default=0.5, required=False, type=float)
+    return parser.parse_args()
+
+
+def synthetic_fixtures() -> dict:
+    """
+    Function is utilized to generate wikipedia fixtures of the synthetic dataset: search results and html pages (with
+    infobox and paragraphs) of all entities
+    :return: dictionary that contains search results and pages
+    """
+    pages = dict()
+    for idx, person in enumerate(PEOPLE):
+        facts = {category: objects[idx % len(objects)] for category, objects in OBJECTS.items()}
+        rows = ''.join(f'<tr><th>{category.capitalize()}</th><td>{value}</td></tr>'
+                       for category, value in facts.items())
+        paragraphs = ''.join(f'<p>{person} is known for the {category} {value}, as the sources report.</p>'
+                             for category, value in facts.items())
+        pages[person] = f'<html><body><table class="infobox">{rows}</table>{paragraphs}</body></html>'
+    for objects in OBJECTS.values():
+        for each in objects:
+            pages[each] = f'<html><body><p>{each} is mentioned in many articles.</p></body></html>'
+    return {'search': {title: [title] for title in pages}, 'pages': pages}
+
+
+def synthetic_rows(size: int, seed: int = 0) -> list:
+    """
+    Function is utilized to generate synthetic facts in both sentence structures of the dataset
+    :param size: number of facts
+    :param seed: seed of the random generator
+    :return: list of (id, sentence, label) tuples
+    """
+    generator = random.Random(seed)
+    rows = list()
+    for idx in range(size):
+        category = generator.choice(list(OBJECTS))
+        person = generator.choice(PEOPLE)
+        value = generator.choice(OBJECTS[category])
+        if generator.random() < 0.6:
+            sentence = f"{person}'s {category} is {value}."
+        else:
+            sentence = f"{value} is {person}'s {category}."
+        rows.append((str(3000000 + idx), sentence, generator.choice(['1.0', '0.0'])))
+    return rows
+
+
+def dataset_rows(path: str, size: int) -> list:
+    """
+    Function is utilized to read the recorded dataset, which is repeated if it is smaller than the requested size
+    :param path: path to the dataset (tsv file)
+    :param size: number of facts
+    :return: list of (id, sentence, label) tuples
+    """
+    with open(path, 'r') as dataset_file:
+        rows = [tuple(each_line.rstrip('\n').split('\t')) for each_line in dataset_file if each_line.strip()]
+    return [rows[idx % len(rows)] for idx in range(size)]
+
+
+def dataset_sentences(path: str) -> list:
+    """
+    Function is utilized to read all distinct sentences of the recorded dataset
+    :param path: path to the dataset (tsv file)
+    :return: list of sentences in the order of their first occurrence
+    """
+    with open(path, 'r') as dataset_file:
+        return list(dict.fromkeys(each_line.split('\t')[1] for each_line in dataset_file if each_line.strip()))
+
+
+def load_fixtures(path: str) -> dict:
+    """
+    Function is utilized to read the recorded fixtures
+    :param path: path to the fixtures file (gzip compressed json)
+    :return: dictionary that contains search results and pages
+    """
+    with gzip.open(path, 'rt', encoding='utf-8') as fixtures_file:
+        return json.load(fixtures_file)
+
+
+def record_fixtures(dataset: str, path: str) -> None:
+    """
+    Function is utilized to record search results and pages of all entities of the dataset from live wikipedia, so
+    that benchmarks can replay them offline
+    :param dataset: path to the dataset (tsv file)
+    :param path: path to the fixtures file (gzip compressed json)
+    :return: None
+    """
+    output_dir = tempfile.mkdtemp(prefix='record_')
+    try:
+        shutil.copy(dataset, os.path.join(output_dir, 'training.tsv'))
+        parameters = collect_parameters([])
+        parameters.update({'input_dir': output_dir, 'output_dir': output_dir, 'fact_set': 'training'})
+        context = PipelineContext(parameters)
+        fetcher = context.backend.configuration['fetcher']
+        queries = list(dict.fromkeys(info for each_data in context.sentences
+                                     for info in (each_data['main_info'], each_data['secondary_info'])))
+        search = dict(zip(queries, fetcher.map(fetcher.search, queries)))
+        titles = list(dict.fromkeys(results[0] for results in search.values() if results))
+        pages = dict(zip(titles, fetcher.map(context.backend.fetch_page, titles)))
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+    with gzip.open(path, 'wt', encoding='utf-8') as fixtures_file:
+        json.dump({'search': search, 'pages': pages}, fixtures_file)
+
+
+def percentiles(latencies: list) -> dict:
+    """
+    Function is utilized to compute latency percentiles (nearest-rank method)
+    :param latencies: list of latencies in seconds
+    :return: dictionary of p50, p95 and p99 latencies in milliseconds
+    """
+    latencies = sorted(latencies)
+    return {f'p{rank}_ms': round(Metrics.percentile(latencies, rank) * 1000, 4) for rank in [50, 95, 99]}
+
+
+class BenchmarkSuite:
+    """
+    Class is utilized to benchmark all stages of the project offline: recorded (or synthetic) wikipedia fixtures are
+    replayed through the local stand-in server and each stage is measured separately at several dataset sizes
+    """
+    def __init__(self, arguments: argparse.Namespace):
+        """
+        Method is utilized as an initializer of the class
+        :param arguments: arguments of the benchmark suite
+        """
+        self.configuration = self.set_configuration(arguments)
+        self.fixtures = load_fixtures(arguments.fixtures) if arguments.fixtures else synthetic_fixtures()
+        self.wiki = LocalWiki(self.fixtures['search'], self.fixtures['pages'])
+        self.results = {'sizes': dict(), 'extraction': dict(), 'tokenizer': dict(), 'refresh': dict(),
+                        'startup': dict(), 'match_rate': dict()}
+
+    @staticmethod
+    def set_configuration(arguments: argparse.Namespace) -> dict:
+        """
+        Method is utilized to extract benchmark-specific parameters according to the provided arguments
+        :param arguments: arguments of the benchmark suite
+        :return: configuration dictionary that contains required parameters for the benchmark
+        """
+        return {
+            'sizes': arguments.sizes,
+            'dataset': arguments.dataset,
+            'memory': arguments.memory
+        }
+
+    def get_rows(self, size: int) -> list:
+        """
+        Method is utilized to collect the facts of the requested size
+        :param size: number of facts
+        :return: list of (id, sentence, label) tuples
+        """
+        if self.configuration['dataset']:
+            return dataset_rows(self.configuration['dataset'], size)
+        return synthetic_rows(size)
+
+    def get_parameters(self, work_dir: str) -> dict:
+        """
+        Method is utilized to generate project parameters, so that all stages run on the local stand-in server
+        :param work_dir: directory of the dataset and all outputs (caches are empty, i.e., every run is cold)
+        :return: all required parameters for the project
+        """
+        parameters = collect_parameters([])
+        parameters.update({
+            'input_dir': work_dir,
+            'output_dir': os.path.join(work_dir, 'output'),
+            'fact_set': 'training',
+            'wiki_url': self.wiki.url,
+            'rate_limit': 0,
+            'cache_ttl': 0
+        })
+        return parameters
+
+    @contextmanager
+    def measure(self, stages: dict, name: str, items: int, memory: bool) -> Iterator:
+        """
+        Method is utilized to measure the stage: wall time and throughput, or peak of the traced memory
+        :param stages: dictionary in which measurements are collected
+        :param name: name of the stage
+        :param items: number of processed items (rows or facts)
+        :param memory: boolean variable that specifies whether memory (True) or time (False) is measured
+        :return: None
+        """
+        if memory:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        yield
+        seconds = time.perf_counter() - start
+        stage = stages.setdefault(name, dict())
+        if memory:
+            stage['peak_mb'] = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 3)
+        else:
+            stage['seconds'] = round(seconds, 4)
+            stage['throughput'] = round(items / seconds, 2) if seconds else 0.0
+
+    def run_stages(self, rows: list, stages: dict, memory: bool) -> None:
+        """
+        Method is utilized to run all stages on the dataset from scratch and to measure them
+        :param rows: list of (id, sentence, label) tuples
+        :param stages: dictionary in which measurements are collected
+        :param memory: boolean variable that specifies whether memory (True) or time (False) is measured
+        :return: None
+        """
+        work_dir = tempfile.mkdtemp(prefix='benchmark_')
+        try:
+            with open(os.path.join(work_dir, 'training.tsv'), 'w') as dataset_file:
+                dataset_file.writelines('\t'.join(row) + '\n' for row in rows)
+            context = PipelineContext(self.get_parameters(work_dir))
+            context.stopwords
+            with self.measure(stages, 'get_dataset', len(rows), memory):
+                context.reader.dataset
+            with self.measure(stages, 'categorize', len(rows), memory):
+                context.categorizer
+            with self.measure(stages, 'read_data', len(rows), memory):
+                context.sentences.dataset
+            fact_checker = context.fact_checker
+            with self.measure(stages, 'process_scrapping', len(context.sentences), memory):
+                dataset = fact_checker.process_scrapping()
+            with self.measure(stages, 'process_info', len(dataset), memory):
+                fact_checker.process_info()
+            if not memory:
+                self.results['match_rate'][str(len(rows))] = self.get_match_rate(dataset)
+                self.run_checks(fact_checker, dataset, stages)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    @staticmethod
+    def get_match_rate(dataset: FactTable) -> dict:
+        """
+        Method is utilized to compute the share of the facts whose entities were resolved to wiki links, so that the
+        benchmark can detect fixtures which do not match the queries (checks would measure only the no_match shortcut)
+        :param dataset: table of data with wiki matches
+        :return: dictionary of match rates of main and secondary entities
+        """
+        return {each: round(sum(link != 'no_match' for link in dataset.column(f'wiki_match_{each}')) / len(dataset), 4)
+                if len(dataset) else 0.0 for each in ['main', 'secondary']}
+
+    @staticmethod
+    def run_checks(fact_checker, dataset: list, stages: dict) -> None:
+        """
+        Method is utilized to measure latencies of the single table and page checks (pages are already cached)
+        :param fact_checker: FactChecking object, whose stages were already run
+        :param dataset: list of data with wiki matches
+        :param stages: dictionary in which measurements are collected
+        :return: None
+        """
+        latencies = {'check_table': list(), 'check_page': list()}
+        for each_data in dataset:
+            start = time.perf_counter()
+            fact_checker.check_table(each_data['wiki_match_main'])
+            latencies['check_table'].append(time.perf_counter() - start)
+            info_dict = {'wiki_link': each_data['wiki_match_main'],
+                         'info': fact_checker.standardize(each_data['secondary_info']),
+                         'category': each_data['category']}
+            start = time.perf_counter()
+            fact_checker.check_page(info_dict)
+            latencies['check_page'].append(time.perf_counter() - start)
+        for name, values in latencies.items():
+            stages[name] = {'seconds': round(sum(values), 4),
+                            'throughput': round(len(values) / sum(values), 2) if sum(values) else 0.0,
+                            **percentiles(values)}
+
+    @staticmethod
+    def extract_full(html: str) -> dict:
+        """
+        Method is utilized to extract the page as it was done before the single-pass extraction: table and page checks
+        parsed the whole page separately
+        :param html: html content of the web page
+        :return: dictionary that contains infobox data (or no_table) and list of paragraph texts
+        """
+        from bs4 import BeautifulSoup
+        from extraction import PageExtractor
+        tables = BeautifulSoup(html, 'html.parser').find_all('table', {'class': 'infobox'})
+        return {
+            'infobox': PageExtractor.get_table_data(tables[0]) if tables else 'no_table',
+            'paragraphs': [paragraph.text for paragraph in BeautifulSoup(html, 'html.parser').find_all('p')]
+        }
+
+    def run_extraction(self) -> None:
+        """
+        Method is utilized to compare the single-pass page extraction with the full parses of the page
+        :return: None
+        """
+        from extraction import PageExtractor
+        extractor = PageExtractor()
+        pages = list(self.fixtures['pages'].values())
+        timings = dict()
+        for name, extract in [('strainer', extractor.extract), ('full_parse', self.extract_full)]:
+            latencies = list()
+            for html in pages:
+                start = time.perf_counter()
+                extract(html)
+                latencies.append(time.perf_counter() - start)
+            timings[name] = {'seconds': round(sum(latencies), 4), **percentiles(latencies)}
+        if timings['strainer']['seconds']:
+            timings['speedup'] = round(timings['full_parse']['seconds'] / timings['strainer']['seconds'], 2)
+        self.results['extraction'] = timings
+
+    def run_refresh(self) -> None:
+        """
+        Method is utilized to compare the download of all pages with their revalidation (e.g., nightly refresh of the
+        page cache): after pages expire, they are requested conditionally and only the modified ones are transferred
+        :return: None
+        """
+        from live_backend import LiveBackend
+        work_dir = tempfile.mkdtemp(prefix='benchmark_')
+        try:
+            parameters = self.get_parameters(work_dir)
+            parameters['cache_ttl'] = 1
+            backend = LiveBackend(parameters)
+            titles = list(self.fixtures['pages'])
+            timings = {'pages': len(titles),
+                       'page_bytes': sum(len(page.encode('utf-8')) for page in self.fixtures['pages'].values())}
+            for name in ['download', 'revalidation']:
+                if name == 'revalidation':
+                    time.sleep(parameters['cache_ttl'] + 0.1)
+                before = dict(self.wiki.requests)
+                start = time.perf_counter()
+                for _ in backend.map(backend.fetch_page, titles):
+                    pass
+                timings[name] = {'seconds': round(time.perf_counter() - start, 4),
+                                 'bytes': self.wiki.requests['bytes'] - before['bytes'],
+                                 'not_modified': self.wiki.requests['not_modified'] - before['not_modified']}
+            if timings['download']['bytes']:
+                timings['bytes_ratio'] = round(timings['revalidation']['bytes'] / timings['download']['bytes'], 4)
+            self.results['refresh'] = timings
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def run_startup(self, rows: list) -> None:
+        """
+        Method is utilized to measure the warm start in the new process, after all caches and artifacts were filled by
+        the previous run: time of the whole run whose predictions are loaded from the artifact and time to the first
+        prediction of the streaming run
+        :param rows: list of (id, sentence, label) tuples
+        :return: None
+        """
+        work_dir = tempfile.mkdtemp(prefix='benchmark_')
+        try:
+            with open(os.path.join(work_dir, 'training.tsv'), 'w') as dataset_file:
+                dataset_file.writelines('\t'.join(row) + '\n' for row in rows)
+            parameters = self.get_parameters(work_dir)
+            PipelineContext(parameters).fact_checker.process_info()
+            command = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'main.py'),
+                       '--input_dir', parameters['input_dir'], '--output_dir', parameters['output_dir'],
+                       '--wiki_url', parameters['wiki_url'], '--rate_limit', '0', '--cache_ttl', '0']
+            timings = {'facts': len(rows)}
+            start = time.perf_counter()
+            subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            timings['warm_run'] = round(time.perf_counter() - start, 4)
+            path = os.path.join(parameters['output_dir'], 'predictions_training.jsonl')
+            start = time.perf_counter()
+            process = subprocess.Popen(command + ['--output_format', 'jsonl'], stdout=subprocess.DEVNULL,
+                                       stderr=subprocess.DEVNULL)
+            while process.poll() is None and not (os.path.exists(path) and os.path.getsize(path)):
+                time.sleep(0.005)
+            timings['first_prediction'] = round(time.perf_counter() - start, 4)
+            process.wait()
+            timings['stream_run'] = round(time.perf_counter() - start, 4)
+            self.results['startup'] = timings
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def run_tokenizer(self) -> None:
+        """
+        Method is utilized to check the parity of the regex tokenizer with word_tokenize on all sentences of the dataset
+        (synthetic facts of the largest size, if there is no dataset) and to compare their speed
+        :return: None
+        """
+        from tokenizer import SIMPLE, punkt_tokenize, regex_tokenize
+        if self.configuration['dataset']:
+            sentences = dataset_sentences(self.configuration['dataset'])
+        else:
+            sentences = [row[1] for row in synthetic_rows(max(self.configuration['sizes']))]
+        timings = dict()
+        tokens = dict()
+        for name, tokenize in [('punkt', punkt_tokenize), ('regex', regex_tokenize)]:
+            start = time.perf_counter()
+            tokens[name] = [tokenize(sentence) for sentence in sentences]
+            timings[name] = {'seconds': round(time.perf_counter() - start, 4)}
+        mismatches = [sentence for sentence, punkt, regex in zip(sentences, tokens['punkt'], tokens['regex'])
+                      if punkt != regex]
+        timings['sentences'] = len(sentences)
+        timings['fast_path'] = sum(SIMPLE.fullmatch(sentence) is not None for sentence in sentences)
+        timings['mismatches'] = len(mismatches)
+        timings['mismatch_examples'] = mismatches[:10]
+        if timings['regex']['seconds']:
+            timings['speedup'] = round(timings['punkt']['seconds'] / timings['regex']['seconds'], 2)
+        self.results['tokenizer'] = timings
+
+    def run(self) -> dict:
+        """
+        Method is utilized to run all benchmarks
+        :return: dictionary of results per dataset size and extraction results
+        """
+        self.wiki.start()
+        try:
+            for size in self.configuration['sizes']:
+                rows = self.get_rows(size)
+                stages = dict()
+                self.run_stages(rows, stages, memory=False)
+                if self.configuration['memory']:
+                    tracemalloc.start()
+                    self.run_stages(rows, stages, memory=True)
+                    tracemalloc.stop()
+                self.results['sizes'][str(size)] = stages
+                print(f'Size {size}: ' + ', '.join(f'{name} {stage["seconds"]}s' for name, stage in stages.items()),
+                      file=sys.stderr)
+            self.run_extraction()
+            self.run_refresh()
+            self.run_startup(self.get_rows(max(self.configuration['sizes'])))
+            self.run_tokenizer()
+        finally:
+            self.wiki.stop()
+        return self.results
+
+    @staticmethod
+    def compare(results: dict, baseline: dict, tolerance: float) -> list:
+        """
+        Method is utilized to compare stage times with the stored baseline
+        :param results: current results
+        :param baseline: baseline results
+        :param tolerance: allowed relative slowdown (e.g., 0.25 means 25% slower)
+        :return: list of regressions: (size, stage, baseline seconds, current seconds)
+        """
+        regressions = list()
+        for size, stages in results['sizes'].items():
+            for name, stage in stages.items():
+                reference = baseline['sizes'].get(size, dict()).get(name)
+                if reference and reference['seconds'] and stage['seconds'] > reference['seconds'] * (1 + tolerance):
+                    regressions.append((size, name, reference['seconds'], stage['seconds']))
+        return regressions
+
+
+def report(results: dict) -> None:
+    """
+    Function is utilized to print results of the benchmarks as a table
+    :param results: dictionary of results per dataset size and extraction results
+    :return: None
+    """
+    print(f'{"size":>8} {"stage":<20} {"seconds":>10} {"items/s":>12} {"p50 ms":>10} {"p99 ms":>10} {"peak MB":>10}')
+    for size, stages in results['sizes'].items():
+        for name, stage in stages.items():
+            print(f'{size:>8} {name:<20} {stage["seconds"]:>10} {stage["throughput"]:>12} '
+                  f'{stage.get("p50_ms", "-"):>10} {stage.get("p99_ms", "-"):>10} {stage.get("peak_mb", "-"):>10}')
+    for size, rates in results['match_rate'].items():
+        print(f'Match rate at size {size}: main {rates["main"]}, secondary {rates["secondary"]}')
+    extraction = results['extraction']
+    if extraction:
+        print(f'Extraction: strainer {extraction["strainer"]["seconds"]}s, '
+              f'full parse {extraction["full_parse"]["seconds"]}s, speedup {extraction.get("speedup", "-")}x')
+    refresh = results['refresh']
+    if refresh:
+        print(f'Refresh of {refresh["pages"]} pages ({refresh["page_bytes"]} bytes): download '
+              f'{refresh["download"]["seconds"]}s, {refresh["download"]["bytes"]} bytes transferred; revalidation '
+              f'{refresh["revalidation"]["seconds"]}s, {refresh["revalidation"]["bytes"]} bytes transferred, '
+              f'{refresh["revalidation"]["not_modified"]} not modified')
+    startup = results['startup']
+    if startup:
+        print(f'Warm start of {startup["facts"]} facts: run {startup["warm_run"]}s, first prediction of the stream '
+              f'{startup["first_prediction"]}s, stream {startup["stream_run"]}s')
+    tokenizer = results['tokenizer']
+    if tokenizer:
+        print(f'Tokenizer: punkt {tokenizer["punkt"]["seconds"]}s, regex {tokenizer["regex"]["seconds"]}s, '
+              f'speedup {tokenizer.get("speedup", "-")}x, fast path {tokenizer["fast_path"]}/{tokenizer["sentences"]}, '
+              f'mismatches {tokenizer["mismatches"]}')
+
+
+def __main__():
+    arguments = collect_arguments()
+    if arguments.record:
+        if not arguments.dataset:
+            sys.exit('Recording requires the dataset (--dataset)')
+        record_fixtures(arguments.dataset, arguments.record)
+        return
+    results = BenchmarkSuite(arguments).run()
+    report(results)
+    with open(arguments.output, 'w') as results_file:
+        json.dump(results, results_file, indent=2)
+    low_rates = [(size, each, rate) for size, rates in results['match_rate'].items() for each, rate in rates.items()
+                 if rate < arguments.min_match_rate]
+    for size, each, rate in low_rates:
+        print(f'Implausible match rate of {each} entities at size {size}: {rate} (fixtures do not match the queries)')
+    if results['tokenizer']['mismatches']:
+        print(f'Regex tokenizer differs from word_tokenize on {results["tokenizer"]["mismatches"]} sentences: '
+              f'{results["tokenizer"]["mismatch_examples"]}')
+    if low_rates or results['tokenizer']['mismatches']:
+        sys.exit(1)
+    if arguments.baseline and arguments.save_baseline:
+        shutil.copy(arguments.output, arguments.baseline)
+    elif arguments.baseline and os.path.exists(arguments.baseline):
+        with open(arguments.baseline, 'r') as baseline_file:
+            regressions = BenchmarkSuite.compare(results, json.load(baseline_file), arguments.tolerance)
+        for size, name, reference, current in regressions:
+            print(f'Regression: {name} at size {size}: {reference}s -> {current}s')
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    __main__()
@@ -1,37 +1,56 @@
-from reader import ReadDataset
+import os
 from collections import Counter
-from nltk.corpus import stopwords
+from functools import cached_property
 from string import punctuation
+from matcher import CategoryMatcher
+from artifacts import StageArtifact, fingerprint
+from pipeline import PipelineContext
+from utilities import complete_parameters
+from metrics import timed
 
 
 class CategorizeDataset:
     """
     Class is utilized to extract categories from the source dataset
     """
-    def __init__(self, config_parameters: dict):
+    def __init__(self, config_parameters: dict, context: PipelineContext = None):
         """
         Method is utilized as an initializer of the class
         :param config_parameters: all required parameters for the project
+        :param context: shared pipeline context (new context is created if it is not provided)
         """
-        self.configuration = self.set_configuration(config_parameters)
+        config_parameters = complete_parameters(config_parameters)
+        context = context if context is not None else PipelineContext(config_parameters)
+        self.configuration = self.set_configuration(config_parameters, context)
         self.categories = self.categorize()
 
     @staticmethod
-    def set_configuration(parameters: dict) -> dict:
+    def set_configuration(parameters: dict, context: PipelineContext) -> dict:
         """
         Method is utilized to extract and generate task-specific parameters according to the provided parameters
         :param parameters: all required parameters for the project
+        :param context: shared pipeline context, which provides reader and stopwords (lazily)
         :return: configuration dictionary that contains required parameters for the specific task
         """
-        reader_obj = ReadDataset(parameters)
-        sw = stopwords.words('english')
-        sw.extend(["'re", "'s", "'ve"])
+        reader_obj = context.reader
+        categories_dir = os.path.join(parameters['output_dir'], f"categories_{parameters['fact_set']}.pickle")
         return {
+            'context': context,
             'reader': reader_obj,
-            'sw': sw,
-            'dataset_type': parameters['fact_set']
+            'artifact': StageArtifact(categories_dir),
+            'dataset_type': parameters['fact_set'],
+            'category_threshold': parameters['category_threshold'],
+            'uppercase_threshold': parameters['uppercase_threshold']
         }
 
+    @cached_property
+    def stopwords(self) -> set:
+        """
+        Method is utilized to load stopwords only when categories are extracted, since NLTK corpora are slow to load
+        :return: set of stopwords
+        """
+        return set(self.configuration['context'].stopwords)
+
     def init_scenario(self, cross_check_first: list, cross_check_second: list) -> list:
         """
         Method is utilized to collect initial categories which are easy to extract. Then calls other sessions in
@@ -40,11 +59,12 @@ class CategorizeDataset:
         :param cross_check_second: higher level checked data: bigrams vs. trigrams
         :return:
         """
-        unique_grams = list()
+        unique_grams = Counter()
         for each in cross_check_second:
-            unique_grams.extend(each)
-        for key, value in Counter(unique_grams).items():
-            if value > 140 and key not in punctuation and key not in self.configuration['sw']:
+            unique_grams.update(each)
+        for key, value in unique_grams.items():
+            if value > self.configuration['category_threshold'] and key not in punctuation and \
+                    key not in self.stopwords:
                 cross_check_first.append(key)
         init_categories = self.clean_tokens(cross_check_first)
         categories = self.eliminate_uppercase(init_categories, unique_grams)
@@ -62,7 +82,7 @@ class CategorizeDataset:
         for each in cross_check_first:
             split_info = each.split(' ')
             if len(split_info) == 2:
-                if split_info[1] in self.configuration['sw'] or split_info[1] in punctuation:
+                if split_info[1] in self.stopwords or split_info[1] in punctuation:
                     keys.append(split_info[0])
                 else:
                     keys.append(each)
@@ -70,17 +90,17 @@ class CategorizeDataset:
                 keys.append(split_info[0])
         return keys
 
-    def eliminate_uppercase(self, categories: list, unique_grams: list) -> list:
+    def eliminate_uppercase(self, categories: list, unique_grams: Counter) -> list:
         """
         Method is utilized to clean uppercase words from the recent categorization results
         :param categories: list of previous categorization results
-        :param unique_grams: list of higher level checked data where each data occurs more than once (makes things easy)
+        :param unique_grams: counts of higher level checked data, which are computed once
         :return: resulting list of categories after eliminating uppercase words which have higher frequencies
         """
         result = list()
         for each_word in set(categories):
-            if each_word in Counter(unique_grams).keys():
-                if Counter(unique_grams)[each_word] >= 12 and not each_word[0].isupper():
+            if each_word in unique_grams:
+                if unique_grams[each_word] >= self.configuration['uppercase_threshold'] and not each_word[0].isupper():
                     result.append(each_word)
             else:
                 result.append(each_word)
@@ -90,15 +110,17 @@ class CategorizeDataset:
     @staticmethod
     def eliminate_repetition(result: list) -> list:
         """
-        Method is utilized to eliminate possible repetition from the list (word can hide in the other word)
+        Method is utilized to eliminate possible repetition from the list (word can hide in the other word). All words
+        which hide in each word are found in one pass over it by the multi-pattern matcher
         :param result: list of recent categorization results
         :return: list of categorization results -> final step of categorization
         """
+        matcher = CategoryMatcher(result)
         removables = dict()
-        for word in result:
-            for each in result:
-                if word != each and word in each:
-                    removables[word] = True
+        for each in set(result):
+            for idx in matcher.find(each):
+                if result[idx] != each:
+                    removables[result[idx]] = True
         result_categories = [each for each in result if each not in removables.keys()]
 
         return result_categories
@@ -112,25 +134,32 @@ class CategorizeDataset:
         :return: list of cross-checking results
         """
         results = list()
+        higher = set(higher)
         for each in lower:
             check_key = f"'s {each}"
             if check_key in higher:
                 results.append(f'{each}')
         return results
 
+    @timed('categorize')
     def categorize(self) -> list:
         """
-        Method is utilized to extract categories from the provided sentences
+        Method is utilized to extract categories from the provided sentences. Categories are stored along with the hash
+        of the dataset and thresholds, so that they are extracted again only when one of them changes
         :return: list of categories
         """
-        dataset = self.configuration['reader'].dataset
-
+        key = fingerprint(self.configuration['reader'].stage_key, self.configuration['category_threshold'],
+                          self.configuration['uppercase_threshold'])
+        categories = self.configuration['artifact'].load(key)
+        if categories is not None:
+            return categories
         unigrams_cross = list()
         bigrams_cross = list()
-        for idx in range(len(dataset['id'])):
-            unigrams_cross.extend(self.cross_check(dataset['unigrams'][idx], dataset['bigrams'][idx]))
-            bigrams_cross.extend(self.cross_check(dataset['bigrams'][idx], dataset['trigrams'][idx]))
+        for row in self.configuration['reader'].iter_rows():
+            unigrams_cross.extend(self.cross_check(row['unigrams'], row['bigrams']))
+            bigrams_cross.extend(self.cross_check(row['bigrams'], row['trigrams']))
 
         categories = self.init_scenario(unigrams_cross, bigrams_cross)
+        self.configuration['artifact'].save(key, key, categories, dict())
 
         return categories
@@ -0,0 +1,373 @@
+import bz2
+import json
+import os
+import re
+import sqlite3
+import unicodedata
+import xml.etree.ElementTree as ElementTree
+import zlib
+from typing import Any, Callable, Iterable, Iterator
+
+from tqdm import tqdm
+
+from metrics import METRICS
+from utilities import complete_parameters, normalize
+
+INDEX_FORMAT = 2
+
+
+class DumpBackend:
+    """
+    Class is utilized as a source of wikipedia information, which uses the local pages-articles XML dump instead of
+    live wikipedia. The dump is streamed only once to build on-disk title index along with infobox and paragraph stores
+    """
+    def __init__(self, config_parameters: dict):
+        """
+        Method is utilized as an initializer of the class
+        :param config_parameters: all required parameters for the project
+        """
+        config_parameters = complete_parameters(config_parameters)
+        self.configuration = self.set_configuration(config_parameters)
+        self.identity = self.get_identity(config_parameters)
+        self.connection = self.build_index()
+
+    @staticmethod
+    def set_configuration(parameters: dict) -> dict:
+        """
+        Method is utilized to extract and generate task-specific parameters according to the provided parameters
+        :param parameters: all required parameters for the project
+        :return: configuration dictionary that contains required parameters for the specific task
+        """
+        if not parameters['dump_path'] or not os.path.exists(parameters['dump_path']):
+            raise FileNotFoundError(f"Wikipedia dump was not found: {parameters['dump_path']}")
+        index_dir = os.path.join(parameters['output_dir'], 'dump_index')
+        if not os.path.exists(index_dir):
+            os.makedirs(index_dir)
+        return {
+            'dump_path': parameters['dump_path'],
+            'index_dir': os.path.join(index_dir, 'dump.sqlite')
+        }
+
+    @staticmethod
+    def get_signature(dump_path: str) -> str:
+        """
+        Method is utilized to identify the dump file without reading it
+        :param dump_path: path to the dump file
+        :return: signature that contains path, size and modification time of the dump
+        """
+        stat = os.stat(dump_path)
+        return f"{os.path.abspath(dump_path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    @staticmethod
+    def get_identity(parameters: dict) -> tuple:
+        """
+        Method is utilized to identify the source without building the backend
+        :param parameters: all required parameters for the project
+        :return: tuple of the backend type and signature of the dump
+        """
+        if not parameters['dump_path'] or not os.path.exists(parameters['dump_path']):
+            raise FileNotFoundError(f"Wikipedia dump was not found: {parameters['dump_path']}")
+        return 'dump', DumpBackend.get_signature(parameters['dump_path'])
+
+    def build_index(self) -> sqlite3.Connection:
+        """
+        Method is utilized to build the index of the dump, if it was not built for the same dump file (and the same
+        format of the index, e.g., normalization of the titles) before
+        :return: connection to the index database
+        """
+        signature = f"{INDEX_FORMAT}:{self.get_signature(self.configuration['dump_path'])}"
+        connection = sqlite3.connect(self.configuration['index_dir'], check_same_thread=False)
+        connection.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+        row = connection.execute("SELECT value FROM meta WHERE key = 'signature'").fetchone()
+        if row is not None and row[0] == signature:
+            return connection
+
+        for table in ['titles', 'words', 'articles']:
+            connection.execute(f'DROP TABLE IF EXISTS {table}')
+        connection.execute('CREATE TABLE titles (normalized TEXT PRIMARY KEY, title TEXT NOT NULL)')
+        connection.execute('CREATE TABLE words (word TEXT NOT NULL, title TEXT NOT NULL)')
+        connection.execute('CREATE TABLE articles (title TEXT PRIMARY KEY, infobox BLOB, paragraphs BLOB NOT NULL)')
+
+        ti = tqdm(self.read_dump(), desc='Wikipedia dump is indexed', leave=True)
+        for title, redirect, text in ti:
+            if redirect is not None:
+                connection.execute('INSERT OR IGNORE INTO titles VALUES (?, ?)', (normalize(title), redirect))
+                continue
+            connection.execute('INSERT OR REPLACE INTO titles VALUES (?, ?)', (normalize(title), title))
+            connection.executemany('INSERT INTO words VALUES (?, ?)',
+                                   [(word, title) for word in set(self.get_words(title))])
+            infobox = self.get_infobox(text)
+            connection.execute('INSERT OR REPLACE INTO articles VALUES (?, ?, ?)', (
+                title,
+                zlib.compress(json.dumps(infobox).encode('utf-8')) if infobox is not None else None,
+                zlib.compress(json.dumps(self.get_paragraphs_text(text)).encode('utf-8'))
+            ))
+        connection.execute('CREATE INDEX words_word ON words (word)')
+        connection.execute("INSERT OR REPLACE INTO meta VALUES ('signature', ?)", (signature,))
+        connection.commit()
+        return connection
+
+    def read_dump(self) -> Iterator:
+        """
+        Method is utilized to stream articles of the dump (plain or bz2-compressed XML) one by one
+        :return: yields title, redirect target (None if the page is not redirect) and wikitext of each article
+        """
+        path = self.configuration['dump_path']
+        with (bz2.open(path, 'rb') if path.endswith('.bz2') else open(path, 'rb')) as dump:
+            page = dict()
+            for _, element in ElementTree.iterparse(dump, events=('end',)):
+                tag = element.tag.rsplit('}', 1)[-1]
+                if tag in ['title', 'ns', 'text']:
+                    page[tag] = element.text or ''
+                elif tag == 'redirect':
+                    page['redirect'] = element.get('title')
+                elif tag == 'page':
+                    if page.get('ns', '0') == '0' and 'title' in page:
+                        yield page['title'], page.get('redirect'), page.get('text', '')
+                    page = dict()
+                    element.clear()
+
+    def search(self, query: str, results: int = 10) -> list:
+        """
+        Method is utilized to resolve titles which are relevant to the query, similar to wikipedia.search
+        :param query: information that is searched
+        :param results: maximum number of titles
+        :return: list of titles: exact (or redirected) title first, then titles that contain all words of the query
+        """
+        METRICS.increment('search_requests')
+        row = self.connection.execute('SELECT title FROM titles WHERE normalized = ?',
+                                      (normalize(query),)).fetchone()
+        titles = [row[0]] if row is not None else list()
+        words = list(dict.fromkeys(self.get_words(query)))
+        if words:
+            statement = ' INTERSECT '.join(['SELECT title FROM words WHERE word = ?'] * len(words))
+            matches = [each[0] for each in self.connection.execute(statement, words).fetchall()]
+            titles.extend(sorted([each for each in matches if each not in titles], key=lambda each: (len(each), each)))
+        return titles[:results]
+
+    @staticmethod
+    def map(function: Callable, items: Iterable) -> Iterator:
+        """
+        Method is utilized to apply the function to all items. Local storage does not need concurrency
+        :param function: function that is applied to each item
+        :param items: input items
+        :return: iterator of results in the same order as the items
+        """
+        return map(function, items)
+
+    def prefetch(self, links: list) -> None:
+        """
+        Method is utilized for compatibility with the live backend: all pages are already stored locally
+        :param links: list of wiki links
+        :return: None
+        """
+
+    def get_article(self, wiki_link: str) -> Any:
+        """
+        Method is utilized to read the stored article
+        :param wiki_link: title of the article (redirects are followed)
+        :return: tuple of compressed infobox and paragraphs, or None if article does not exist
+        """
+        row = self.connection.execute('SELECT infobox, paragraphs FROM articles WHERE title = ?',
+                                      (wiki_link,)).fetchone()
+        if row is None:
+            target = self.connection.execute('SELECT title FROM titles WHERE normalized = ?',
+                                             (normalize(wiki_link),)).fetchone()
+            if target is not None:
+                row = self.connection.execute('SELECT infobox, paragraphs FROM articles WHERE title = ?',
+                                              (target[0],)).fetchone()
+        return row
+
+    def get_table(self, wiki_link: str) -> Any:
+        """
+        Method is utilized to collect infobox information of the article
+        :param wiki_link: title of the article
+        :return: dictionary of table data if the article has infobox, otherwise no_table
+        """
+        row = self.get_article(wiki_link)
+        if row is None or row[0] is None:
+            return 'no_table'
+        return json.loads(zlib.decompress(row[0]).decode('utf-8'))
+
+    def get_digest(self, wiki_link: str) -> str:
+        """
+        Method is utilized to identify the content of the article, which changes only with the dump
+        :param wiki_link: title of the article
+        :return: signature of the dump
+        """
+        return self.identity[1]
+
+    def get_paragraphs(self, wiki_link: str) -> list:
+        """
+        Method is utilized to collect texts of all paragraphs of the article
+        :param wiki_link: title of the article
+        :return: list of paragraph texts
+        """
+        row = self.get_article(wiki_link)
+        return json.loads(zlib.decompress(row[1]).decode('utf-8')) if row is not None else list()
+
+    @staticmethod
+    def get_words(title: str) -> list:
+        """
+        Method is utilized to split title into lowercased words
+        :param title: title of the article or the query
+        :return: list of words
+        """
+        return re.findall(r'\w+', title.lower())
+
+    @staticmethod
+    def find_closing(text: str, start: int, opening: str, closing: str) -> int:
+        """
+        Method is utilized to find the end of the nested structure (e.g., template or link)
+        :param text: wikitext
+        :param start: index of the opening characters
+        :param opening: opening characters (e.g., {{)
+        :param closing: closing characters (e.g., }})
+        :return: index after the closing characters or length of the text if structure is not closed
+        """
+        depth = 0
+        idx = start
+        while idx < len(text):
+            if text.startswith(opening, idx):
+                depth += 1
+                idx += len(opening)
+            elif text.startswith(closing, idx):
+                depth -= 1
+                idx += len(closing)
+                if not depth:
+                    return idx
+            else:
+                idx += 1
+        return len(text)
+
+    @staticmethod
+    def split_parameters(body: str) -> list:
+        """
+        Method is utilized to split template body into its parameters, ignoring separators of nested structures
+        :param body: text between the template braces
+        :return: list of parameters (the first one is the name of the template)
+        """
+        parameters = list()
+        depth = 0
+        current = str()
+        idx = 0
+        while idx < len(body):
+            pair = body[idx: idx + 2]
+            if pair in ['{{', '[[']:
+                depth += 1
+                current += pair
+                idx += 2
+            elif pair in ['}}', ']]']:
+                depth -= 1
+                current += pair
+                idx += 2
+            elif body[idx] == '|' and not depth:
+                parameters.append(current)
+                current = str()
+                idx += 1
+            else:
+                current += body[idx]
+                idx += 1
+        parameters.append(current)
+        return parameters
+
+    def remove_nested(self, text: str, opening: str, closing: str, keep: Callable = None) -> str:
+        """
+        Method is utilized to remove (or replace) all top-level nested structures from the text
+        :param text: wikitext
+        :param opening: opening characters of the structure
+        :param closing: closing characters of the structure
+        :param keep: optional function which returns replacement of the structure
+        :return: resulting text
+        """
+        result = str()
+        idx = 0
+        while True:
+            start = text.find(opening, idx)
+            if start == -1:
+                return result + text[idx:]
+            end = self.find_closing(text, start, opening, closing)
+            result += text[idx: start]
+            if keep is not None:
+                result += keep(text[start + len(opening): end - len(closing)])
+            idx = end
+
+    def flatten_template(self, body: str) -> str:
+        """
+        Method is utilized to replace template by its positional parameters (e.g., {{plainlist|...}})
+        :param body: text between the template braces
+        :return: plain text of the template
+        """
+        parameters = self.split_parameters(body)[1:]
+        return ' '.join(self.clean(each) for each in parameters if '=' not in each.split('[[')[0])
+
+    def clean(self, text: str) -> str:
+        """
+        Method is utilized to transform wikitext into plain text
+        :param text: wikitext
+        :return: plain text
+        """
+        text = re.sub(r'<!--.*?-->', '', text, flags=re.S)
+        text = re.sub(r'<ref[^>]*/>', '', text)
+        text = re.sub(r'<ref[^>]*>.*?</ref>', '', text, flags=re.S)
+        text = re.sub(r'<br\s*/?>', ' ', text)
+        text = re.sub(r'<[^>]+>', '', text)
+        text = self.remove_nested(text, '{{', '}}', self.flatten_template)
+        text = self.remove_nested(text, '[[', ']]', self.link_text)
+        text = re.sub(r'\[https?://[^\s\]]+\s*([^\]]*)\]', r'\1', text)
+        text = text.replace("'''", '').replace("''", '').replace('&nbsp;', ' ')
+        text = re.sub(r'^\s*[*#:;]+\s*', '', text, flags=re.M)
+        return ' '.join(text.split())
+
+    def link_text(self, body: str) -> str:
+        """
+        Method is utilized to transform the internal link into its displayed text
+        :param body: text between the link brackets
+        :return: displayed text of the link (files and categories are discarded)
+        """
+        if body.split(':', 1)[0].lower() in ['file', 'image', 'category']:
+            return ''
+        return self.clean(body.split('|')[-1])
+
+    def get_infobox(self, text: str) -> Any:
+        """
+        Method is utilized to collect infobox of the article in the same form as live table data
+        :param text: wikitext of the article
+        :return: dictionary of infobox data or None if the article does not have infobox
+        """
+        for match in re.finditer(r'\{\{\s*infobox', text, flags=re.I):
+            end = self.find_closing(text, match.start(), '{{', '}}')
+            table_dict = dict()
+            for parameter in self.split_parameters(text[match.start() + 2: end - 2])[1:]:
+                if '=' not in parameter:
+                    continue
+                key, value = parameter.split('=', 1)
+                key = ' '.join(key.replace('_', ' ').split()).lower()
+                value = self.clean(value)
+                if key and value:
+                    table_dict[key] = unicodedata.normalize('NFKC', value.replace('\u200b', ''))
+            return table_dict
+        return None
+
+    def get_paragraphs_text(self, text: str) -> list:
+        """
+        Method is utilized to collect plain texts of the article's paragraphs
+        :param text: wikitext of the article
+        :return: list of paragraph texts
+        """
+        text = re.sub(r'<!--.*?-->', '', text, flags=re.S)
+        text = self.remove_nested(text, '{{', '}}')
+        text = self.remove_nested(text, '{|', '|}')
+        paragraphs = list()
+        current = list()
+        for line in text.split('\n'):
+            stripped = line.strip()
+            if not stripped or stripped[0] in '=*#:;|!{':
+                if current:
+                    paragraphs.append(self.clean(' '.join(current)))
+                    current = list()
+                continue
+            current.append(stripped)
+        if current:
+            paragraphs.append(self.clean(' '.join(current)))
+        return [each for each in paragraphs if each]
@@ -0,0 +1,204 @@
+import argparse
+import json
+import os
+import pickle
+
+import numpy as np
+
+
+def load_predictions(path: str) -> dict:
+    """
+    Function is utilized to load predictions either from predictions.pickle (the plain dictionary which process_info
+    writes), from predictions_artifact.pickle (the stage artifact of process_info) or from the JSONL output of the
+    streaming mode
+    :param path: path to predictions.pickle, predictions_artifact.pickle or predictions_<fact_set>.jsonl
+    :return: dictionary of lists: id, label, category, prediction and source
+    """
+    if path.endswith('.jsonl'):
+        predictions = {'id': list(), 'label': list(), 'category': list(), 'prediction': list(), 'source': list()}
+        with open(path, 'r', encoding='utf-8') as predictions_file:
+            for each_line in predictions_file:
+                row = json.loads(each_line)
+                for key in predictions:
+                    predictions[key].append(row.get(key, 'none' if key == 'source' else None))
+        return predictions
+    with open(path, 'rb') as predictions_file:
+        predictions = pickle.load(predictions_file)
+    if 'key' in predictions and 'value' in predictions:
+        predictions = predictions['value']
+    size = len(predictions['id'])
+    return {
+        'id': predictions['id'],
+        'label': predictions['label'],
+        'category': predictions.get('category', ['unknown'] * size),
+        'prediction': predictions['prediction'],
+        'source': predictions.get('source', ['none'] * size)
+    }
+
+
+class Evaluation:
+    """
+    Class is utilized to evaluate predictions: all values are kept in NumPy arrays (strings are encoded as integer
+    codes), so that confusion matrices and breakdowns are computed without Python loops over facts
+    """
+    def __init__(self, predictions: dict):
+        """
+        Method is utilized as an initializer of the class
+        :param predictions: dictionary of lists: id, label, category, prediction and source
+        """
+        labels = np.asarray(predictions['label'], dtype=object)
+        self.ids = np.asarray(predictions['id'], dtype=str)
+        self.labelled = (labels == '1.0') | (labels == '0.0')
+        self.labels = (labels == '1.0').astype(np.int64)
+        self.predictions = (np.asarray(predictions['prediction'], dtype=object) == '1.0').astype(np.int64)
+        self.categories, self.category_codes = np.unique(np.asarray(predictions['category'], dtype=str),
+                                                         return_inverse=True)
+        self.sources, self.source_codes = np.unique(np.asarray(predictions['source'], dtype=str), return_inverse=True)
+
+    @staticmethod
+    def get_scores(confusion: np.ndarray) -> dict:
+        """
+        Method is utilized to compute scores from the confusion matrix
+        :param confusion: confusion matrix (rows are labels, columns are predictions: false, true)
+        :return: dictionary of counts, accuracy, precision, recall and f1 score
+        """
+        (tn, fp), (fn, tp) = confusion.tolist()
+        total = tn + fp + fn + tp
+        precision = tp / (tp + fp) if tp + fp else 0.0
+        recall = tp / (tp + fn) if tp + fn else 0.0
+        return {
+            'facts': total,
+            'tp': tp, 'fp': fp, 'fn': fn, 'tn': tn,
+            'accuracy': round((tp + tn) / total, 4) if total else 0.0,
+            'precision': round(precision, 4),
+            'recall': round(recall, 4),
+            'f1': round(2 * precision * recall / (precision + recall), 4) if precision + recall else 0.0
+        }
+
+    def confusion(self, codes: np.ndarray = None, groups: int = 1) -> np.ndarray:
+        """
+        Method is utilized to compute confusion matrices of the labelled facts, per group if codes are provided
+        :param codes: integer group code of each fact (e.g., category codes)
+        :param groups: number of groups
+        :return: array of shape (groups, 2, 2)
+        """
+        codes = np.zeros(len(self.labels), dtype=np.int64) if codes is None else codes
+        cells = codes[self.labelled] * 4 + self.labels[self.labelled] * 2 + self.predictions[self.labelled]
+        return np.bincount(cells, minlength=groups * 4).reshape(groups, 2, 2)
+
+    def breakdown(self, names: np.ndarray, codes: np.ndarray) -> dict:
+        """
+        Method is utilized to compute scores per group, along with the share of the true predictions in the group
+        :param names: names of the groups
+        :param codes: integer group code of each fact
+        :return: dictionary in which keys are group names and values are scores
+        """
+        confusions = self.confusion(codes, len(names))
+        facts = np.bincount(codes, minlength=len(names))
+        positives = np.bincount(codes, weights=self.predictions, minlength=len(names))
+        result = dict()
+        for idx, name in enumerate(names):
+            result[str(name)] = self.get_scores(confusions[idx])
+            result[str(name)]['predicted'] = int(facts[idx])
+            result[str(name)]['predicted_true'] = int(positives[idx])
+        return result
+
+    def evaluate(self) -> dict:
+        """
+        Method is utilized to evaluate the predictions
+        :return: dictionary of overall scores, per-category and per-source breakdowns
+        """
+        return {
+            'overall': self.get_scores(self.confusion()[0]),
+            'categories': self.breakdown(self.categories, self.category_codes),
+            'sources': self.breakdown(self.sources, self.source_codes)
+        }
+
+
+def compare(runs: dict) -> dict:
+    """
+    Function is utilized to compare several prediction runs on their common facts (id and category)
+    :param runs: dictionary in which keys are names of runs and values are Evaluation objects
+    :return: dictionary of scores per run and pairwise agreement of the runs
+    """
+    names = list(runs)
+    first_run = runs[names[0]]
+    same_facts = all(np.array_equal(run.ids, first_run.ids) and np.array_equal(
+        run.categories[run.category_codes], first_run.categories[first_run.category_codes]) for run in runs.values())
+    if same_facts:
+        positions = {name: slice(None) for name in names}
+        facts = len(first_run.ids)
+    else:
+        _, id_codes = np.unique(np.concatenate([run.ids for run in runs.values()]), return_inverse=True)
+        categories = np.unique(np.concatenate([run.categories for run in runs.values()]))
+        keys = dict()
+        start = 0
+        for name, run in runs.items():
+            category_codes = np.searchsorted(categories, run.categories)[run.category_codes]
+            keys[name] = id_codes[start: start + len(run.ids)].astype(np.int64) * len(categories) + category_codes
+            start += len(run.ids)
+        common = keys[names[0]]
+        for name in names[1:]:
+            common = np.intersect1d(common, keys[name])
+        positions = dict()
+        for name in names:
+            order = np.argsort(keys[name], kind='stable')
+            positions[name] = order[np.searchsorted(keys[name], common, sorter=order)]
+        facts = len(common)
+    aligned = {name: {'predictions': run.predictions[positions[name]], 'labels': run.labels[positions[name]],
+                      'labelled': run.labelled[positions[name]]} for name, run in runs.items()}
+    result = {'facts': int(facts), 'runs': {name: runs[name].evaluate()['overall'] for name in names},
+              'agreement': dict()}
+    for idx, first in enumerate(names):
+        for second in names[idx + 1:]:
+            same = aligned[first]['predictions'] == aligned[second]['predictions']
+            labelled = aligned[first]['labelled']
+            correct_first = aligned[first]['predictions'] == aligned[first]['labels']
+            correct_second = aligned[second]['predictions'] == aligned[second]['labels']
+            result['agreement'][f'{first} vs {second}'] = {
+                'agreement': round(float(same.mean()), 4) if len(same) else 0.0,
+                f'only_{first}_correct': int((labelled & correct_first & ~correct_second).sum()),
+                f'only_{second}_correct': int((labelled & correct_second & ~correct_first).sum())
+            }
+    return result
+
+
+def report(name: str, evaluation: dict) -> None:
+    """
+    Function is utilized to print the evaluation as tables
+    :param name: name of the run
+    :param evaluation: evaluation of the run
+    :return: None
+    """
+    overall = evaluation['overall']
+    print(f'{name}: accuracy {overall["accuracy"]}, precision {overall["precision"]}, recall {overall["recall"]}, '
+          f'f1 {overall["f1"]} (TP {overall["tp"]}, FP {overall["fp"]}, FN {overall["fn"]}, TN {overall["tn"]})')
+    for title, column in [('categories', 'category'), ('sources', 'source')]:
+        print(f'  {column:<20} {"facts":>8} {"true":>8} {"accuracy":>9} '
+              f'{"precision":>10} {"recall":>8}')
+        for key, scores in evaluation[title].items():
+            print(f'  {key:<20} {scores["predicted"]:>8} {scores["predicted_true"]:>8} {scores["accuracy"]:>9} '
+                  f'{scores["precision"]:>10} {scores["recall"]:>8}')
+
+
+def __main__():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('predictions', nargs='+', type=str)
+    parser.add_argument('--json', default=None, required=False, type=str)
+    arguments = parser.parse_args()
+    runs = {path: Evaluation(load_predictions(path)) for path in arguments.predictions}
+    evaluations = {path: run.evaluate() for path, run in runs.items()}
+    for path, evaluation in evaluations.items():
+        report(os.path.basename(path) if len(runs) == 1 else path, evaluation)
+    result = {'evaluations': evaluations}
+    if len(runs) > 1:
+        result['comparison'] = compare(runs)
+        for pair, agreement in result['comparison']['agreement'].items():
+            print(f'{pair}: ' + ', '.join(f'{key} {value}' for key, value in agreement.items()))
+    if arguments.json:
+        with open(arguments.json, 'w') as result_file:
+            json.dump(result, result_file, indent=2)
+
+
+if __name__ == '__main__':
+    __main__()
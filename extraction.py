@@ -0,0 +1,87 @@
+import unicodedata
+from typing import Iterable
+
+import bs4
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import HTMLParserTreeBuilder
+from bs4.builder._htmlparser import BeautifulSoupHTMLParser
+
+
+class ChunkedTreeBuilder(HTMLParserTreeBuilder):
+    """
+    Class is utilized to build the soup from the page which is given in chunks: each chunk is fed to the incremental
+    HTML parser as soon as it is produced, so that the whole text of the page is never held along with the soup
+    """
+    def __init__(self, chunks: Iterable, **kwargs):
+        """
+        Method is utilized as an initializer of the class
+        :param chunks: iterable of decoded chunks of the page
+        :param kwargs: keyword arguments of the tree builder
+        """
+        super().__init__(**kwargs)
+        self.chunks = chunks
+
+    def feed(self, markup: str) -> None:
+        """
+        Method is utilized to parse the chunks instead of the markup that was passed to BeautifulSoup (it is empty)
+        :param markup: markup of the soup, which is ignored
+        :return: None
+        """
+        args, kwargs = self.parser_args
+        parser = BeautifulSoupHTMLParser(self.soup, *args, **kwargs)
+        for chunk in self.chunks:
+            parser.feed(chunk)
+        parser.close()
+        parser.already_closed_empty_element = []
+
+
+class PageExtractor:
+    """
+    Class is utilized to parse the web page only once and to extract all information that fact checking needs: infobox
+    data and paragraph texts
+    """
+    def __init__(self):
+        """
+        Method is utilized as an initializer of the class. Only tables and paragraphs are parsed, the rest of the page
+        (navigation, scripts, styles, etc.) is skipped by the parser
+        """
+        self.strainer = SoupStrainer(['table', 'p'])
+
+    def extract(self, html: str) -> dict:
+        """
+        Method is utilized to generate the structured document of the web page
+        :param html: html content of the web page
+        :return: dictionary that contains infobox data (or no_table) and list of paragraph texts
+        """
+        return self.extract_chunks([html])
+
+    def extract_chunks(self, chunks: Iterable) -> dict:
+        """
+        Method is utilized to generate the structured document of the web page which is given in chunks (e.g., while it
+        is decompressed from the page cache), so that only the soup of tables and paragraphs is built from it
+        :param chunks: iterable of decoded chunks of the web page
+        :return: dictionary that contains infobox data (or no_table) and list of paragraph texts
+        """
+        soup = BeautifulSoup('', builder=ChunkedTreeBuilder(chunks), parse_only=self.strainer)
+        tables = soup.find_all('table', {'class': 'infobox'})
+        return {
+            'infobox': self.get_table_data(tables[0]) if tables else 'no_table',
+            'paragraphs': [paragraph.text for paragraph in soup.find_all('p')]
+        }
+
+    @staticmethod
+    def get_table_data(table_info: bs4.element.Tag) -> dict:
+        """
+        Method is utilized to collect table information in the dictionary data structure
+        :param table_info: table information which was extracted from the given web page's html
+        :return: dictionary data that contains table information
+        """
+        table_dict = dict()
+        for row in table_info.find_all('tr'):
+            if len(row) > 1:
+                cols = [each.text for each in row.find_all(['th', 'td'])]
+                for idx in range(1, len(cols)):
+                    table_dict[cols[0].replace('\xa0', ' ').lower()] = unicodedata.normalize(
+                        "NFKC", cols[idx].replace('\u200b', '')
+                    )
+        return table_dict
@@ -1,14 +1,18 @@
+import json
+import os
 import pickle
-import unicodedata
-from typing import Any
+from typing import Any, Iterable, Iterator, Optional
 
-from utilities import *
-import bs4
+from utilities import check_dir, complete_parameters
 from tqdm import tqdm
-from process_sentences import ProcessSentences
-import wikipedia as wiki
-from bs4 import BeautifulSoup
-import requests
+from artifacts import StageArtifact, fingerprint
+from pipeline import PipelineContext
+from parallel import ParallelRunner, check_chunk, search_chunk
+from journal import Journal
+from metrics import METRICS, timed
+from records import FactTable
+from synonyms import SynonymIndex, load_expansion
+from planner import CheckPlanner
 
 
 class FactChecking:
@@ -16,51 +20,134 @@ class FactChecking:
     Class is utilized as a final step of the project: Fact Checking
     """
 
-    def __init__(self, config_parameters: dict):
+    def __init__(self, config_parameters: dict, context: PipelineContext = None):
         """
         Method is utilized as an initializer of the class
         :param config_parameters: all required parameters for the project
+        :param context: shared pipeline context (new context is created if it is not provided)
         """
-        self.configuration = self.set_configuration(config_parameters)
+        config_parameters = complete_parameters(config_parameters)
+        context = context if context is not None else PipelineContext(config_parameters)
+        self.configuration = self.set_configuration(config_parameters, context)
         self.synonyms = self.set_synonyms()
+        expansion_path = self.configuration['expansion_path']
+        self.synonym_index = SynonymIndex(
+            self.synonyms, load_expansion(self.synonyms, expansion_path) if expansion_path else None
+        )
+        self.planner = CheckPlanner({'table': self.check_table_info, 'page': self.check_page}, self.get_digest,
+                                    self.configuration['outcome_size'])
+        self.stage_keys = None
 
     @staticmethod
-    def set_configuration(parameters: dict) -> dict:
+    def set_configuration(parameters: dict, context: PipelineContext) -> dict:
         """
         Method is utilized to extract and generate task-specific parameters according to the provided parameters
         :param parameters: all required parameters for the project
+        :param context: shared pipeline context, which provides sentence processor and backend (lazily)
         :return: configuration dictionary that contains required parameters for the specific task
         """
         check_dir(parameters['output_dir'])
         return {
             'ds_type': parameters['fact_set'],
-            'sentence_process': ProcessSentences(parameters),
-            'wiki_file': os.path.join(parameters['output_dir'], 'wiki_match_data.pickle'),
-            'predictions_dir': os.path.join(parameters['output_dir'], 'predictions.pickle')
+            'context': context,
+            'runner': ParallelRunner(parameters),
+            'wiki_artifact': StageArtifact(os.path.join(parameters['output_dir'], 'wiki_match_data.pickle')),
+            'predictions_artifact': StageArtifact(os.path.join(parameters['output_dir'],
+                                                               'predictions_artifact.pickle')),
+            'predictions_file': os.path.join(parameters['output_dir'], 'predictions.pickle'),
+            'wiki_journal': Journal(os.path.join(parameters['output_dir'], 'wiki_match_data.journal')),
+            'predictions_journal': Journal(os.path.join(parameters['output_dir'], 'predictions.journal')),
+            'output_dir': parameters['output_dir'],
+            'stream_size': max(parameters['batch_size'], 1),
+            'outcome_size': 65536,
+            'expansion_path': (os.path.join(parameters['output_dir'], 'synonyms_wordnet.json')
+                               if parameters['synonym_expansion'] else None)
         }
 
-    def process_scrapping(self) -> list:
+    @staticmethod
+    def set_backend(parameters: dict) -> Any:
+        """
+        Method is utilized to generate the source of wikipedia information according to the provided parameters
+        :param parameters: all required parameters for the project
+        :return: live backend (default) or local dump backend
+        """
+        if parameters['backend'] == 'dump':
+            from dump_backend import DumpBackend
+            return DumpBackend(parameters)
+        from live_backend import LiveBackend
+        return LiveBackend(parameters)
+
+    @staticmethod
+    def get_identity(parameters: dict) -> tuple:
+        """
+        Method is utilized to identify the source of wikipedia information according to the provided parameters
+        :param parameters: all required parameters for the project
+        :return: identity of the live (default) or local dump backend
+        """
+        if parameters['backend'] == 'dump':
+            from dump_backend import DumpBackend
+            return DumpBackend.get_identity(parameters)
+        from live_backend import LiveBackend
+        return LiveBackend.get_identity(parameters)
+
+    def get_stage_keys(self) -> dict:
+        """
+        Method is utilized to compute (once) hashes of inputs and configuration of the scrapping and checking stages, so
+        that their artifacts are reused only when nothing that affects them has changed
+        :return: dictionary of stage keys and configuration hashes
+        """
+        if self.stage_keys is not None:
+            return self.stage_keys
+        backend = self.configuration['context'].identity
+        knowledge_base = self.configuration['context'].knowledge_base
+        knowledge_base_key = knowledge_base.read_key() if knowledge_base is not None else None
+        resolver = self.configuration['context'].resolver
+        scrapping_config = fingerprint(backend, resolver.configuration['title_index'],
+                                       resolver.configuration['title_cutoff'])
+        info_config = fingerprint(backend, self.synonym_index.forms, knowledge_base_key, 'source', CheckPlanner.STEPS)
+        scrapping_key = fingerprint(self.configuration['context'].sentences.stage_key, scrapping_config,
+                                    knowledge_base_key)
+        self.stage_keys = {
+            'scrapping_config': scrapping_config,
+            'scrapping': scrapping_key,
+            'info_config': info_config,
+            'info': fingerprint(scrapping_key, info_config)
+        }
+        return self.stage_keys
+
+    @timed('process_scrapping')
+    def process_scrapping(self) -> FactTable:
         """
         Method is utilized to check and retrieve wikipedia link which is relevant to the provided information
-        :return: list of data in required forma
+        :return: table of processed sentences along with their wiki matches
         """
-        if not os.path.exists(self.configuration['wiki_file']):
-            initial_scrapping_results = list()
-            ti = tqdm(iterable=self.configuration['sp'], total=self.configuration['sentence_process'].__len__(),
+        artifact = self.configuration['wiki_artifact']
+        initial_scrapping_results = artifact.load(self.get_stage_keys()['scrapping'])
+        if initial_scrapping_results is None:
+            initial_scrapping_results = self.configuration['context'].sentences.dataset.copy()
+            sentences = initial_scrapping_results
+            journal = self.configuration['wiki_journal']
+            search_results = artifact.rows(self.get_stage_keys()['scrapping_config'])
+            search_results.update(journal.open(self.get_stage_keys()['scrapping_config']))
+            search_results.update(self.search_all(sentences, search_results, journal))
+            rows = dict()
+            ti = tqdm(iterable=sentences, total=len(sentences),
                       desc=f'Wiki matches are collected for {self.configuration["ds_type"]}', leave=True)
             s_main = 0
             u_main = 0
             s_sec = 0
             u_sec = 0
             for each_data in ti:
-                results = wiki.search(each_data['main_info'])
+                results = search_results.get(each_data['main_info'], list())
                 num_results = len(results)
                 each_data['wiki_match_main'] = results[0] if num_results else 'no_match'
-                results_second = wiki.search(each_data['secondary_info'])
+                results_second = search_results.get(each_data['secondary_info'], list())
                 num_results_second = len(results_second)
                 each_data['wiki_match_secondary'] = results_second[0] if num_results_second else 'no_match'
+                for info in [each_data['main_info'], each_data['secondary_info']]:
+                    if info in search_results:
+                        rows[info] = search_results[info][:1]
 
-                initial_scrapping_results.append(each_data)
                 if num_results:
                     s_main += 1
                 else:
@@ -72,12 +159,44 @@ class FactChecking:
                     u_sec += 1
                 ti.set_description(f'WIki matches are collected for {self.configuration["ds_type"]}: '
                                    f'Main S/U => {s_main}/{u_main}, Secondary S/U => {s_sec}/{u_sec}')
-            with open(self.configuration['wiki_file'], 'wb') as wiki_data:
-                pickle.dump(initial_scrapping_results, wiki_data)
-        with open(self.configuration['wiki_file'], 'rb') as wiki_data:
-            initial_scrapping_results = pickle.load(wiki_data)
+            artifact.save(self.get_stage_keys()['scrapping'], self.get_stage_keys()['scrapping_config'],
+                          initial_scrapping_results, rows)
+            journal.close()
         return initial_scrapping_results
 
+    def search_all(self, sentences: Iterable, known: dict, journal: Journal) -> dict:
+        """
+        Method is utilized to resolve all main and secondary information to wikipedia titles. Queries are deduplicated
+        by the entity resolver, so that each unique entity is searched only once (concurrently), and each resolution is
+        committed to the journal as soon as it arrives. Facts which are settled by the knowledge base are not searched
+        :param sentences: table of processed sentences
+        :param known: dictionary of queries which were already searched in the previous (or interrupted) run
+        :param journal: journal of the scrapping stage
+        :return: dictionary in which keys are (new) queries and values are lists with the top wikipedia title
+        """
+        queries = list()
+        for each_data in sentences:
+            if self.settle(each_data) is None:
+                queries.extend([each_data['main_info'], each_data['secondary_info']])
+        queries = [query for query in dict.fromkeys(queries) if query not in known]
+        resolutions = self.configuration['context'].resolver.resolve_all(queries, self.search_queries)
+        ti = tqdm(resolutions, total=len(queries), desc='Wiki search', leave=True)
+        searched = dict()
+        for query, titles in ti:
+            searched[query] = titles
+            journal.append((query, titles))
+        return searched
+
+    def search_queries(self, queries: list) -> Iterator:
+        """
+        Method is utilized to search the queries concurrently (in worker processes, if it was requested)
+        :param queries: list of unique queries
+        :return: iterator of search results in the same order as the queries
+        """
+        backend = self.configuration['context'].backend
+        runner = self.configuration['runner']
+        return runner.map(search_chunk, queries) if runner.enabled else backend.map(backend.search, queries)
+
     @staticmethod
     def set_synonyms() -> dict:
         """
@@ -106,45 +225,199 @@ class FactChecking:
             'birth place': ['birth place', 'nascence place', 'birth', 'born']
         }
 
+    @timed('process_info')
     def process_info(self) -> dict:
         """
         Method is utilized as a main function of the fact-checker object, in which all processes are called
         either implicitly or explicitly
         :return: dataset dictionary that contains prediction and target values along with data and its label
         """
-        if not os.path.exists(self.configuration['predictions_dir']):
+        artifact = self.configuration['predictions_artifact']
+        data_dict = artifact.load(self.get_stage_keys()['info'])
+        if data_dict is None:
             current_dataset = self.process_scrapping()
-            data_dict = {'id': list(), 'data': list(), 'label': list(), 'prediction': list()}
+            journal = self.configuration['predictions_journal']
+            checked = artifact.rows(self.get_stage_keys()['info_config'])
+            checked.update(journal.open(self.get_stage_keys()['info_config']))
+            rows = dict()
+            links = list()
+            for each_data in current_dataset:
+                row_key = self.get_row_key(each_data)
+                if row_key in checked:
+                    continue
+                settled = self.settle(each_data)
+                if settled is not None:
+                    checked[row_key] = (settled, 'knowledge_base')
+                    METRICS.increment('match_knowledge_base')
+                else:
+                    links.extend([each_data['wiki_match_main'], each_data['wiki_match_secondary']])
+            self.configuration['context'].backend.prefetch([link for link in links if link != 'no_match'])
+            data_dict = {'id': list(), 'data': list(), 'label': list(), 'category': list(), 'prediction': list(),
+                         'source': list()}
 
             ti = tqdm(enumerate(current_dataset), total=len(current_dataset), desc='Fact checking:')
+            matches = self.check_all(current_dataset, checked)
             successful = 0
             for idx, each_data in ti:
                 label = True if each_data['label'] == '1.0' else False
-                match = self.check_information(each_data)
-                for key in data_dict.keys():
-                    if key != 'prediction':
-                        data_dict[key].append(each_data[key])
-                    else:
-                        data_dict[key].append('1.0' if match else '0.0')
+                match, source = next(matches)
+                row_key = self.get_row_key(each_data)
+                if row_key not in checked:
+                    journal.append((row_key, (match, source)))
+                rows[row_key] = (match, source)
+                for key in ['id', 'data', 'label', 'category']:
+                    data_dict[key].append(each_data[key])
+                data_dict['prediction'].append('1.0' if match else '0.0')
+                data_dict['source'].append(source)
 
                 if match == label:
                     successful += 1
 
                 ti.set_description(
                     f'Fact checking: accuracy => {successful}/{idx + 1} ({(successful / (idx + 1)):.4f})')
-            with open(self.configuration['predictions_dir'], 'wb') as data:
-                pickle.dump(data_dict, data)
-        with open(self.configuration['predictions_dir'], 'rb') as data:
-            data_dict = pickle.load(data)
+            artifact.save(self.get_stage_keys()['info'], self.get_stage_keys()['info_config'], data_dict, rows)
+            journal.close()
+            self.save_predictions(data_dict)
+        elif not os.path.exists(self.configuration['predictions_file']):
+            self.save_predictions(data_dict)
 
         return data_dict
 
+    def save_predictions(self, data_dict: dict) -> None:
+        """
+        Method is utilized to write predictions as the plain dictionary of lists (id, data, label, category, prediction
+        and source) to predictions.pickle, while the stage artifact with reusable rows is kept in a separate file
+        :param data_dict: dataset dictionary that contains prediction and target values along with data and its label
+        :return: None
+        """
+        temporary_path = f'{self.configuration["predictions_file"]}.tmp'
+        with open(temporary_path, 'wb') as data:
+            pickle.dump(data_dict, data)
+        os.replace(temporary_path, self.configuration['predictions_file'])
+
+    def check_all(self, dataset: FactTable, checked: dict) -> Iterator:
+        """
+        Method is utilized to check all data which were not checked in the previous run, either serially or across
+        worker processes
+        :param dataset: table of data with wiki matches
+        :param checked: dictionary of checking results of the previous run
+        :return: iterator of (match, source) pairs in the same order as the dataset
+        """
+        pending = [each_data for each_data in dataset if self.get_row_key(each_data) not in checked]
+        runner = self.configuration['runner']
+        results = runner.map(check_chunk, pending) if runner.enabled else map(self.check_source, pending)
+        for each_data in dataset:
+            row_key = self.get_row_key(each_data)
+            yield checked[row_key] if row_key in checked else next(results)
+
+    def check_stream(self, facts: Iterable) -> Iterator:
+        """
+        Method is utilized to check facts as a stream: facts are consumed in small batches and each fact is yielded as
+        soon as it is checked, so that memory does not grow with the size of the fact set
+        :param facts: iterable of data (e.g., ProcessSentences object), which contain main and secondary information
+        :return: iterator of copies of data with wiki matches and prediction, in the same order as the facts
+        """
+        batch = list()
+        for each_data in facts:
+            batch.append(each_data)
+            if len(batch) == self.configuration['stream_size']:
+                yield from self.check_facts(batch)
+                batch = list()
+        yield from self.check_facts(batch)
+
+    def check_facts(self, facts: list) -> Iterator:
+        """
+        Method is utilized to check the batch of facts: facts are settled by the knowledge base if it is possible, for
+        the rest unique entities are resolved once, unique pages are fetched once (concurrently) and outcomes of checks
+        are reused by the planner as long as their pages do not change. Facts are not modified (e.g., rows of the
+        shared fact table), results are written to their copies
+        :param facts: list of data, which contain main and secondary information
+        :return: iterator of copies of data with wiki matches, prediction and its source, in the same order as the facts
+        """
+        backend = self.configuration['context'].backend
+        facts = [dict(each_data) for each_data in facts]
+        settled = [self.settle(each_data) for each_data in facts]
+        METRICS.increment('match_knowledge_base', sum(known is not None for known in settled))
+        queries = [info for each_data, known in zip(facts, settled) if known is None
+                   for info in (each_data['main_info'], each_data['secondary_info'])]
+        titles = dict(self.configuration['context'].resolver.resolve_all(
+            dict.fromkeys(queries), lambda unique: backend.map(backend.search, unique)
+        ))
+        links = list()
+        for each_data, known in zip(facts, settled):
+            for each in ['main', 'secondary']:
+                found = titles.get(each_data[f'{each}_info'], list())
+                each_data[f'wiki_match_{each}'] = found[0] if found else 'no_match'
+            if known is None:
+                links.extend([each_data['wiki_match_main'], each_data['wiki_match_secondary']])
+        backend.prefetch([link for link in links if link != 'no_match'])
+        for each_data, known in zip(facts, settled):
+            match, source = (known, 'knowledge_base') if known is not None else self.check_source(each_data)
+            each_data['prediction'] = match
+            each_data['source'] = source
+            yield each_data
+
+    def settle(self, data: dict) -> Optional[bool]:
+        """
+        Method is utilized to settle the fact by the local knowledge base of the training facts, without the web
+        :param data: dictionary that contains main and secondary information and category
+        :return: label of the fact if the knowledge base knows it, otherwise None
+        """
+        knowledge_base = self.configuration['context'].knowledge_base
+        if knowledge_base is None:
+            return None
+        return knowledge_base.lookup(data['main_info'], data['category'], data['secondary_info'])
+
+    @timed('write_predictions')
+    def write_predictions(self, output_format: str) -> str:
+        """
+        Method is utilized to check all facts of the dataset as a stream and to write each prediction as soon as it is
+        computed, either as JSON lines or as tab-separated id, sentence and prediction (the format of the dataset)
+        :param output_format: jsonl or tsv
+        :return: path to the predictions file
+        """
+        path = os.path.join(self.configuration['output_dir'],
+                            f'predictions_{self.configuration["ds_type"]}.{output_format}')
+        sentences = self.configuration['context'].sentences
+        ti = tqdm(self.check_stream(sentences), total=len(sentences), desc='Fact checking (stream):')
+        with open(path, 'w', encoding='utf-8') as predictions:
+            for each_data in ti:
+                prediction = '1.0' if each_data['prediction'] else '0.0'
+                if output_format == 'jsonl':
+                    line = json.dumps({'id': each_data['id'], 'data': each_data['data'], 'label': each_data['label'],
+                                       'category': each_data['category'], 'prediction': prediction,
+                                       'source': each_data['source']})
+                else:
+                    line = '\t'.join([each_data['id'], each_data['data'], prediction])
+                predictions.write(line + '\n')
+                predictions.flush()
+        return path
+
+    @staticmethod
+    def get_row_key(data: dict) -> tuple:
+        """
+        Method is utilized to collect all information of the data that checking result depends on
+        :param data: dictionary that contains all information relevant to the task
+        :return: tuple which identifies the checking result of the data
+        """
+        return (data['wiki_match_main'], data['wiki_match_secondary'], data['main_info'], data['secondary_info'],
+                data['category'])
+
     def check_information(self, data: dict) -> bool:
         """
         Method is utilized to check single data
         :param data: dictionary that contains all information relevant to the task
         :return: checking results per given data
         """
+        return self.check_source(data)[0]
+
+    def check_source(self, data: dict) -> tuple:
+        """
+        Method is utilized to check single data and to keep where the information was found. Checks are run by the
+        planner: infobox lookups of both wiki links first, then paragraph scans, until the first hit
+        :param data: dictionary that contains all information relevant to the task
+        :return: tuple of checking result and its source: table, page or none
+        """
         check_dict = {'main': dict(), 'secondary': dict()}
         for each in check_dict.keys():
             info_key = 'secondary' if each == 'main' else 'main'
@@ -153,40 +426,24 @@ class FactChecking:
                 'info': self.standardize(data[f'{info_key}_info']),
                 'category': data['category']
             }
-        match = self.check_table_match(check_dict)
-        if not match:
-            for info_type, info_dict in check_dict.items():
-                match = self.check_page(info_dict)
-                if match:
-                    break
-
-        return match
+        source = self.planner.run(check_dict)
+        METRICS.increment('facts_checked')
+        METRICS.increment(f'match_{source}')
+        return source != 'none', source
 
-    def check_table_match(self, check_dict: dict) -> bool:
+    def check_table_info(self, info_dict: dict) -> bool:
         """
         Method is utilized to check the fact by matching information and table data, which is retrieved by the given
         wiki-link (in the dict)
-        :param check_dict: dictionary that contains all checking relevant information
-        :return: boolean variable that specifies whether information was found on table or not
+        :param info_dict: dictionary that contains all checking-relevant information
+        :return: boolean variable specifies whether information was found in the table or not (False if the page has
+        no table, since the page is checked by paragraphs separately)
         """
-        match = False
-        table_match = False
-        for info_type, info_dict in check_dict.items():
-            table_data = self.check_table(info_dict['wiki_link'])
-            if table_data == 'no_match':
-                match = False
-            elif table_data == 'no_table':
-                match = self.check_page(info_dict)
-                if match:
-                    break
-            else:
-                cat_match, category = self.category_match(table_data, info_dict['category'])
-                if cat_match and info_dict['info'] in table_data[category]:
-                    table_match = True
-                    break
-        match = table_match or match
-
-        return match
+        table_data = self.check_table(info_dict['wiki_link'])
+        if table_data in ['no_match', 'no_table']:
+            return False
+        cat_match, category = self.category_match(table_data, info_dict['category'])
+        return cat_match and info_dict['info'] in table_data[category]
 
     def check_page(self, info_dict: dict) -> bool:
         """
@@ -196,19 +453,17 @@ class FactChecking:
         """
         match = False
         if info_dict['wiki_link'] != 'no_match':
-            url = self.get_url(info_dict['wiki_link'])
-            s = requests.Session()
-            response = s.get(url, timeout=10).text
-            soup = BeautifulSoup(response, 'html.parser')
-            for paragraph in soup.find_all('p'):
-
-                if info_dict['info'] in paragraph.text:
-                    for syn in self.synonyms[info_dict['category']]:
-                        if syn in paragraph.text:
-                            match = True
+            paragraphs = self.configuration['context'].backend.get_paragraphs(info_dict['wiki_link'])
+            with METRICS.timer('check_page'):
+                for paragraph in paragraphs:
+
+                    if info_dict['info'] in paragraph:
+                        for syn in self.synonym_index.get_forms(info_dict['category']):
+                            if syn in paragraph:
+                                match = True
+                                break
+                        if match:
                             break
-                    if match:
-                        break
         return match
 
     def category_match(self, table_dict: dict, category: str) -> tuple:
@@ -218,14 +473,7 @@ class FactChecking:
         :param category: category which was extracted from the input sentence
         :return: tuple of matching results in terms of category and the key that was matched (it can be synonym, too)
         """
-        match = False
-        search_key = None
-        for key in table_dict.keys():
-            if key in self.synonyms[category]:
-                match = True
-                search_key = key
-                break
-        return match, search_key
+        return self.synonym_index.match(table_dict, category)
 
     @staticmethod
     def standardize(info: str) -> str:
@@ -240,22 +488,14 @@ class FactChecking:
         else:
             return info
 
-    @staticmethod
-    def get_table_data(table_info: bs4.element.Tag) -> dict:
-        """
-        Method is utilized to collect table information in the dictionary data structure
-        :param table_info: table information which was extracted from the given web page's html
-        :return: dictionary data that contains table information
-        """
-        table_dict = dict()
-        for row in table_info.find_all('tr'):
-            if len(row) > 1:
-                cols = [each.text for each in row.find_all(['th', 'td'])]
-                for idx in range(1, len(cols)):
-                    table_dict[cols[0].replace('\xa0', ' ').lower()] = unicodedata.normalize(
-                        "NFKC", cols[idx].replace('\u200b', '')
-                    )
-        return table_dict
+    def get_digest(self, wiki_link: str) -> str:
+        """
+        Method is utilized to identify the current content of the page, so that outcomes of its checks are not reused
+        after the page has changed
+        :param wiki_link: wiki link of the page
+        :return: digest of the page content
+        """
+        return self.configuration['context'].backend.get_digest(wiki_link)
 
     def check_table(self, url: str) -> Any:
         """
@@ -263,28 +503,7 @@ class FactChecking:
         :param url: wiki link information that wikipedia's standard page link is generated according to it
         :return: table info if it exists else information about its existence
         """
-        if url != 'no_match':
-            url = self.get_url(url)
-            s = requests.Session()
-            response = s.get(url, timeout=10).text
-            soup = BeautifulSoup(response, 'html.parser')
-
-            tables = soup.find_all('table', {'class': 'infobox'})
-            table_info = tables[0] if tables else 'no_table'
-        else:
-            table_info = 'no_match'
-        return self.get_table_data(table_info) if table_info != 'no_table' and table_info != 'no_match' else table_info
-
-    @staticmethod
-    def get_url(wiki_link: str) -> str:
-        """
-        Method is utilized to generate wikipedia's standard webpage link
-        :param wiki_link: information that is utilized to generate wikipedia link
-        :return: web link to the wikipedia page
-        """
-        wiki_info = wiki_link.split(' ')
-        wiki_link_page = str()
-        for idx, each in enumerate(wiki_info):
-            wiki_link_page += f'{each}_' if idx != len(wiki_info) - 1 else f'{each}'
-        url = f"https://en.wikipedia.org/wiki/{wiki_link_page}"
-        return url
+        if url == 'no_match':
+            return 'no_match'
+        with METRICS.timer('check_table'):
+            return self.configuration['context'].backend.get_table(url)
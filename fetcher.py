@@ -0,0 +1,214 @@
+import codecs
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+import requests
+import wikipedia as wiki
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+
+from metrics import METRICS
+
+
+class TokenBucket:
+    """
+    Class is utilized as a thread-safe token-bucket rate limiter
+    """
+    def __init__(self, rate: float, capacity: int):
+        """
+        Method is utilized as an initializer of the class
+        :param rate: number of tokens which are added to the bucket per second (0 means there is no limit)
+        :param capacity: maximum number of tokens that bucket can hold (i.e., size of the burst)
+        """
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Method is utilized to take one token from the bucket, waiting until it becomes available
+        :return: None
+        """
+        if not self.rate:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class WikiFetcher:
+    """
+    Class is utilized to send all requests to Wikipedia through single pooled keep-alive session, with bounded
+    concurrency and rate limiting
+    """
+    def __init__(self, wiki_url: str, max_workers: int, rate: float, timeout: int = 10, chunk_size: int = 65536,
+                 retries: int = 3, backoff: float = 1.0):
+        """
+        Method is utilized as an initializer of the class
+        :param wiki_url: base url of the wikipedia (e.g., https://en.wikipedia.org), it can point to a local server
+        :param max_workers: maximum number of concurrent requests
+        :param rate: maximum number of requests per second (0 means there is no limit)
+        :param timeout: timeout of each request in seconds
+        :param chunk_size: size of the chunk in which response bodies are read
+        :param retries: number of retries of the request which was throttled (429) or failed on the server (5xx)
+        :param backoff: delay before the first retry in seconds, it is doubled for each next retry
+        """
+        self.wiki_url = wiki_url.rstrip('/')
+        self.api_url = f'{self.wiki_url}/w/api.php'
+        self.max_workers = max(max_workers, 1)
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        self.retries = retries
+        self.backoff = backoff
+        self.bucket = TokenBucket(rate, self.max_workers)
+        self.session = self.set_session()
+
+    def set_session(self) -> requests.Session:
+        """
+        Method is utilized to generate session whose connection pool is large enough for all workers. Compressed
+        transfer is negotiated with all encodings that can be decoded (gzip and deflate, br if brotli is installed)
+        :return: requests session object
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({'User-Agent': wiki.wikipedia.USER_AGENT,
+                                'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding']})
+        return session
+
+    @staticmethod
+    def is_transient(status: int) -> bool:
+        """
+        Method is utilized to check whether the failed request can succeed if it is sent again
+        :param status: HTTP status code of the response
+        :return: True if the request was throttled (429) or failed on the server (5xx)
+        """
+        return status == 429 or status >= 500
+
+    def get_delay(self, response: requests.Response, attempt: int) -> float:
+        """
+        Method is utilized to compute the delay before the retry: Retry-After of the response (in seconds) if it was
+        sent, otherwise the exponential backoff
+        :param response: response of the failed request
+        :param attempt: number of the failed attempt (starting from 0)
+        :return: delay in seconds
+        """
+        retry_after = response.headers.get('Retry-After', '')
+        return float(retry_after) if retry_after.isdigit() else self.backoff * 2 ** attempt
+
+    def send(self, name: str, url: str, read: Callable, **kwargs) -> requests.Response:
+        """
+        Method is utilized to send the request through the rate limiter. Throttled (429) and failed (5xx) requests are
+        retried with backoff, number of requests, retries, failures and transferred bytes are counted under the name
+        :param name: name of the request in the metrics (e.g., fetch or search)
+        :param url: url of the request
+        :param read: function that reads the streamed body of each response before the connection is released
+        :param kwargs: additional arguments of the request (e.g., headers or params)
+        :return: response of the last attempt
+        :raises requests.HTTPError: if the request still fails after all retries
+        """
+        for attempt in range(self.retries + 1):
+            self.bucket.acquire()
+            with METRICS.timer(name):
+                with self.session.get(url, timeout=self.timeout, stream=True, **kwargs) as response:
+                    read(response)
+                    wire_bytes = response.raw.tell()
+            METRICS.increment(f'{name}_requests')
+            METRICS.increment(f'{name}_bytes', wire_bytes)
+            if not self.is_transient(response.status_code) or attempt == self.retries:
+                break
+            METRICS.increment(f'{name}_retries')
+            time.sleep(self.get_delay(response, attempt))
+        if self.is_transient(response.status_code):
+            METRICS.increment(f'{name}_failed')
+            response.raise_for_status()
+        return response
+
+    def get(self, url: str, writer: Any, etag: Optional[str] = None, last_modified: Optional[str] = None) -> tuple:
+        """
+        Method is utilized to download the web page. If validators of the cached copy are provided, the request is
+        conditional and the body is not sent when the page was not modified. The body is streamed in chunks, decoded
+        incrementally and each decoded chunk is passed to the writer right away, so that the whole page is never held
+        as text. Throttled and failed (5xx) requests are retried with backoff, bodies of unsuccessful responses are
+        never written
+        :param url: url of the web page
+        :param writer: object that receives decoded chunks of the successful (2xx) response by write and is closed
+        after the last one (e.g., PageWriter of the page cache)
+        :param etag: ETag of the cached copy of the page
+        :param last_modified: Last-Modified value of the cached copy of the page
+        :return: tuple of HTTP status code, ETag and Last-Modified values of the web page
+        :raises requests.HTTPError: if the request still fails after all retries
+        """
+        headers = dict()
+        if etag is not None:
+            headers['If-None-Match'] = etag
+        if last_modified is not None:
+            headers['If-Modified-Since'] = last_modified
+
+        def read(response: requests.Response) -> None:
+            if 200 <= response.status_code < 300:
+                decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+                for chunk in response.iter_content(self.chunk_size):
+                    writer.write(decoder.decode(chunk))
+                    METRICS.increment('fetch_decoded_bytes', len(chunk))
+                writer.write(decoder.decode(b'', final=True))
+                writer.close()
+
+        response = self.send('fetch', url, read, headers=headers)
+        if response.status_code == 304:
+            METRICS.increment('fetch_not_modified')
+        elif not 200 <= response.status_code < 300:
+            METRICS.increment('fetch_unsuccessful')
+        return response.status_code, response.headers.get('ETag'), response.headers.get('Last-Modified')
+
+    def search(self, query: str, results: int = 10) -> list:
+        """
+        Method is utilized to search wikipedia titles. It sends the same request as wikipedia.search does
+        :param query: information that is searched
+        :param results: maximum number of titles
+        :return: list of titles which are relevant to the query
+        :raises requests.HTTPError: if the request is unsuccessful (throttled and failed requests are retried first)
+        """
+        params = {
+            'list': 'search',
+            'srprop': '',
+            'srlimit': results,
+            'limit': results,
+            'srsearch': query,
+            'format': 'json',
+            'action': 'query'
+        }
+        response = self.send('search', self.api_url, lambda each: each.content, params=params)
+        response.raise_for_status()
+        raw_results = response.json()
+        if 'error' in raw_results:
+            if raw_results['error']['info'] in ('HTTP request timed out.', 'Pool queue is full'):
+                raise wiki.exceptions.HTTPTimeoutError(query)
+            raise wiki.exceptions.WikipediaException(raw_results['error']['info'])
+        return [each['title'] for each in raw_results['query']['search']]
+
+    def map(self, function: Callable, items: Iterable) -> Iterator:
+        """
+        Method is utilized to apply the function to all items concurrently
+        :param function: function that is applied to each item (e.g., search or get)
+        :param items: input items
+        :return: iterator of results in the same order as the items
+        """
+        items = list(items)
+        if self.max_workers == 1 or len(items) < 2:
+            yield from map(function, items)
+            return
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            yield from executor.map(function, items)
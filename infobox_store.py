@@ -0,0 +1,59 @@
+import marshal
+import os
+import sqlite3
+import threading
+import zlib
+from typing import Any
+
+
+class InfoboxStore:
+    """
+    Class is utilized as a persistent storage of already normalized infobox data, keyed by the resolved title. Each
+    entry keeps the digest of the page it was built from, so it is rebuilt only when the source page changes
+    """
+    def __init__(self, store_dir: str):
+        """
+        Method is utilized as an initializer of the class
+        :param store_dir: directory in which the store database is kept
+        """
+        if not os.path.exists(store_dir):
+            os.makedirs(store_dir)
+        self.lock = threading.Lock()
+        self.loaded = dict()
+        self.connection = sqlite3.connect(os.path.join(store_dir, 'infoboxes.sqlite'), timeout=30,
+                                          check_same_thread=False)
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS infoboxes (title TEXT PRIMARY KEY, digest TEXT NOT NULL, data BLOB NOT NULL)'
+        )
+        self.connection.commit()
+
+    def get(self, title: str, digest: str) -> Any:
+        """
+        Method is utilized to read the infobox data of the title
+        :param title: resolved wikipedia title
+        :param digest: digest of the current source page
+        :return: infobox dictionary (or no_table) if it was built from the same page, otherwise None
+        """
+        with self.lock:
+            if title not in self.loaded:
+                row = self.connection.execute('SELECT digest, data FROM infoboxes WHERE title = ?',
+                                              (title,)).fetchone()
+                if row is None:
+                    return None
+                self.loaded[title] = (row[0], marshal.loads(zlib.decompress(row[1])))
+            stored_digest, table = self.loaded[title]
+        return table if stored_digest == digest else None
+
+    def put(self, title: str, digest: str, table: Any) -> None:
+        """
+        Method is utilized to store the infobox data of the title
+        :param title: resolved wikipedia title
+        :param digest: digest of the source page
+        :param table: infobox dictionary or no_table
+        :return: None
+        """
+        with self.lock:
+            self.loaded[title] = (digest, table)
+            self.connection.execute('INSERT OR REPLACE INTO infoboxes VALUES (?, ?, ?)',
+                                    (title, digest, zlib.compress(marshal.dumps(table))))
+            self.connection.commit()
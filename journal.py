@@ -0,0 +1,83 @@
+import os
+import pickle
+import struct
+import zlib
+from typing import Any
+
+HEADER = struct.Struct('<II')
+
+
+class Journal:
+    """
+    Class is utilized as an append-only, crash-safe journal of completed work. Each record is framed by its length and
+    CRC32 checksum and is flushed to disk as soon as it is written, so that long stages can resume after a crash
+    """
+    def __init__(self, path: str):
+        """
+        Method is utilized as an initializer of the class
+        :param path: path to the journal file
+        """
+        self.path = path
+        self.file = None
+
+    def replay(self) -> list:
+        """
+        Method is utilized to read all committed records. Torn (incomplete or corrupted) tail of the journal is cut off
+        :return: list of records in the order they were written
+        """
+        records = list()
+        if not os.path.exists(self.path):
+            return records
+        valid_size = 0
+        with open(self.path, 'rb') as journal_file:
+            while True:
+                header = journal_file.read(HEADER.size)
+                if len(header) < HEADER.size:
+                    break
+                size, checksum = HEADER.unpack(header)
+                payload = journal_file.read(size)
+                if len(payload) < size or zlib.crc32(payload) != checksum:
+                    break
+                records.append(pickle.loads(payload))
+                valid_size += HEADER.size + size
+        if valid_size != os.path.getsize(self.path):
+            with open(self.path, 'r+b') as journal_file:
+                journal_file.truncate(valid_size)
+        return records
+
+    def open(self, config: str) -> list:
+        """
+        Method is utilized to open the journal for appending. Records are resumed only if the journal was written with
+        the same configuration, otherwise the journal is started from scratch
+        :param config: hash of the configuration of the stage
+        :return: list of committed records (without the configuration record)
+        """
+        records = self.replay()
+        if not records or records[0] != config:
+            self.file = open(self.path, 'wb')
+            self.append(config)
+            return list()
+        self.file = open(self.path, 'ab')
+        return records[1:]
+
+    def append(self, record: Any) -> None:
+        """
+        Method is utilized to commit the record to the journal
+        :param record: picklable record (e.g., key and result of one completed item)
+        :return: None
+        """
+        payload = pickle.dumps(record)
+        self.file.write(HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self) -> None:
+        """
+        Method is utilized to close and to remove the journal, once its records were compacted into the final artifact
+        :return: None
+        """
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
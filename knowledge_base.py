@@ -0,0 +1,161 @@
+import hashlib
+import mmap
+import os
+import struct
+from typing import Iterable, Optional
+
+from utilities import normalize
+
+HEADER = struct.Struct('<4sQQ64s')
+SLOT = struct.Struct('<16sB')
+MAGIC = b'FKB1'
+EMPTY, FALSE, TRUE, CONFLICT = 0, 1, 2, 3
+
+
+class KnowledgeBase:
+    """
+    Class is utilized as a local knowledge base of the labelled facts of the training set. Facts are kept in the
+    open-addressing hash table on (normalized subject, canonical category, normalized object), which is persisted in
+    compact binary form and read through mmap, so that each lookup is O(1) and does not load the whole table
+    """
+    def __init__(self, store_dir: str, synonyms: dict):
+        """
+        Method is utilized as an initializer of the class
+        :param store_dir: directory in which the knowledge base is kept
+        :param synonyms: dictionary of synonyms of categories, synonymous categories share the same key
+        """
+        if not os.path.exists(store_dir):
+            os.makedirs(store_dir)
+        self.path = os.path.join(store_dir, 'knowledge_base.bin')
+        self.canonical = self.set_canonical(synonyms)
+        self.file = None
+        self.table = None
+        self.capacity = 0
+        self.count = 0
+
+    @staticmethod
+    def set_canonical(synonyms: dict) -> dict:
+        """
+        Method is utilized to map each category to the canonical one: categories which are synonyms of each other
+        (e.g., award and honour) form one group and are represented by its first category in alphabetical order
+        :param synonyms: dictionary of synonyms of categories
+        :return: dictionary in which keys are categories and values are their canonical categories
+        """
+        parents = {category: category for category in synonyms}
+
+        def find(category: str) -> str:
+            while parents[category] != category:
+                parents[category] = parents[parents[category]]
+                category = parents[category]
+            return category
+
+        for category, words in synonyms.items():
+            for word in words:
+                if word in parents:
+                    first, second = sorted([find(category), find(word)])
+                    parents[second] = first
+        return {category: find(category) for category in synonyms}
+
+    def get_digest(self, subject: str, category: str, obj: str) -> bytes:
+        """
+        Method is utilized to compute the key of the fact
+        :param subject: main information of the fact
+        :param category: category of the fact
+        :param obj: secondary information of the fact
+        :return: 16-byte digest of the normalized fact
+        """
+        parts = [normalize(subject), self.canonical.get(category, category), normalize(obj)]
+        return hashlib.blake2b('\x00'.join(parts).encode('utf-8'), digest_size=16).digest()
+
+    def read_key(self) -> Optional[str]:
+        """
+        Method is utilized to read the key (hash of the source facts) of the stored knowledge base
+        :return: key of the knowledge base, None if it does not exist
+        """
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, 'rb') as kb_file:
+            header = kb_file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            return None
+        magic, _, _, key = HEADER.unpack(header)
+        return key.decode('ascii') if magic == MAGIC else None
+
+    def build(self, facts: Iterable, key: str) -> None:
+        """
+        Method is utilized to build the knowledge base from the labelled facts, unless it was already built from the
+        same facts. Facts which appear with both labels are stored as conflicting and are never settled
+        :param facts: iterable of (subject, category, object, label) tuples
+        :param key: hash of the source facts
+        :return: None
+        """
+        if self.read_key() == key:
+            return
+        labels = dict()
+        for subject, category, obj, label in facts:
+            digest = self.get_digest(subject, category, obj)
+            value = TRUE if label else FALSE
+            labels[digest] = value if labels.get(digest, value) == value else CONFLICT
+        capacity = 16
+        while capacity < 2 * len(labels):
+            capacity *= 2
+        table = bytearray(capacity * SLOT.size)
+        for digest, value in labels.items():
+            slot = int.from_bytes(digest[:8], 'little') & (capacity - 1)
+            while table[slot * SLOT.size + 16] != EMPTY:
+                slot = (slot + 1) & (capacity - 1)
+            SLOT.pack_into(table, slot * SLOT.size, digest, value)
+        with open(self.path + '.tmp', 'wb') as kb_file:
+            kb_file.write(HEADER.pack(MAGIC, capacity, len(labels), key.encode('ascii')))
+            kb_file.write(table)
+        os.replace(self.path + '.tmp', self.path)
+        self.close()
+
+    def open(self) -> None:
+        """
+        Method is utilized to map the stored knowledge base into memory
+        :return: None
+        """
+        self.file = open(self.path, 'rb')
+        self.table = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        _, self.capacity, self.count, _ = HEADER.unpack_from(self.table, 0)
+
+    def close(self) -> None:
+        """
+        Method is utilized to unmap the knowledge base
+        :return: None
+        """
+        if self.table is not None:
+            self.table.close()
+            self.file.close()
+            self.table = None
+            self.file = None
+
+    def lookup(self, subject: str, category: str, obj: str) -> Optional[bool]:
+        """
+        Method is utilized to settle the fact by the knowledge base
+        :param subject: main information of the fact
+        :param category: category of the fact
+        :param obj: secondary information of the fact
+        :return: label of the known fact, None if the fact is unknown (or it is known with both labels)
+        """
+        if self.table is None:
+            self.open()
+        digest = self.get_digest(subject, category, obj)
+        slot = int.from_bytes(digest[:8], 'little') & (self.capacity - 1)
+        while True:
+            stored, value = SLOT.unpack_from(self.table, HEADER.size + slot * SLOT.size)
+            if value == EMPTY:
+                return None
+            if stored == digest:
+                return {TRUE: True, FALSE: False}.get(value)
+            slot = (slot + 1) & (self.capacity - 1)
+
+    def __len__(self) -> int:
+        """
+        Method is utilized to compute the number of facts in the knowledge base
+        :return: number of unique facts
+        """
+        if self.table is None:
+            self.open()
+        return self.count
@@ -0,0 +1,222 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from tqdm import tqdm
+
+from infobox_store import InfoboxStore
+from metrics import METRICS
+from page_cache import PageCache, PageWriter, iter_text
+from utilities import complete_parameters
+
+
+class LiveBackend:
+    """
+    Class is utilized as a source of wikipedia information, which uses live wikipedia (or its local stand-in) through
+    the page cache
+    """
+    def __init__(self, config_parameters: dict):
+        """
+        Method is utilized as an initializer of the class
+        :param config_parameters: all required parameters for the project
+        """
+        config_parameters = complete_parameters(config_parameters)
+        self.configuration = self.set_configuration(config_parameters)
+        self.identity = self.get_identity(config_parameters)
+        self.documents = OrderedDict()
+        self.unavailable = set()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_identity(parameters: dict) -> tuple:
+        """
+        Method is utilized to identify the source without building the backend
+        :param parameters: all required parameters for the project
+        :return: tuple of the backend type and base url of the wikipedia
+        """
+        return 'live', parameters['wiki_url'].rstrip('/')
+
+    @staticmethod
+    def set_configuration(parameters: dict) -> dict:
+        """
+        Method is utilized to extract and generate task-specific parameters according to the provided parameters. HTTP
+        and HTML parsing libraries are imported here, since they are slow to import and warm runs do not need them
+        :param parameters: all required parameters for the project
+        :return: configuration dictionary that contains required parameters for the specific task
+        """
+        from extraction import PageExtractor
+        from fetcher import WikiFetcher
+        cache_dir = parameters['cache_dir'] if parameters['cache_dir'] else os.path.join(
+            parameters['output_dir'], 'page_cache'
+        )
+        return {
+            'page_cache': PageCache(cache_dir, parameters['cache_ttl'], parameters['cache_size'] * 1024 * 1024),
+            'infobox_store': InfoboxStore(cache_dir),
+            'fetcher': WikiFetcher(parameters['wiki_url'], parameters['fetch_workers'], parameters['rate_limit']),
+            'extractor': PageExtractor(),
+            'documents_size': 128
+        }
+
+    def search(self, query: str) -> list:
+        """
+        Method is utilized to search wikipedia titles which are relevant to the query
+        :param query: information that is searched
+        :return: list of titles
+        """
+        return self.configuration['fetcher'].search(query)
+
+    def map(self, function: Callable, items: Iterable) -> Iterator:
+        """
+        Method is utilized to apply the function to all items concurrently
+        :param function: function that is applied to each item
+        :param items: input items
+        :return: iterator of results in the same order as the items
+        """
+        return self.configuration['fetcher'].map(function, items)
+
+    def get_url(self, wiki_link: str) -> str:
+        """
+        Method is utilized to generate wikipedia's standard webpage link
+        :param wiki_link: information that is utilized to generate wikipedia link
+        :return: web link to the wikipedia page
+        """
+        wiki_link_page = '_'.join(wiki_link.split(' '))
+        return f"{self.configuration['fetcher'].wiki_url}/wiki/{wiki_link_page}"
+
+    def download(self, url: str) -> Optional[PageWriter]:
+        """
+        Method is utilized to download the web page into the page cache. The page is compressed and hashed while it is
+        downloaded, so that its text is not materialized. Expired pages are revalidated by the conditional request and
+        the cached copy is renewed if it was not modified. Unsuccessful responses (e.g., 404) are not cached, they are
+        remembered only until the end of the run, so that the page is requested again by the next run
+        :param url: canonical url of the page
+        :return: page writer that holds the downloaded page (without content if the cached copy was renewed), None if
+        the page could not be downloaded
+        """
+        page_cache = self.configuration['page_cache']
+        writer = PageWriter()
+        status, etag, last_modified = self.configuration['fetcher'].get(url, writer, *page_cache.get_validators(url))
+        if status == 304:
+            return writer if page_cache.refresh(url) else self.download(url)
+        if writer.content is None:
+            with self.lock:
+                self.unavailable.add(url)
+            return None
+        page_cache.store(url, writer, etag, last_modified)
+        return writer
+
+    def fetch_content(self, wiki_link: str) -> Optional[bytes]:
+        """
+        Method is utilized to read the compressed web page through the page cache, so that each page is downloaded only
+        once and it can be decompressed in chunks
+        :param wiki_link: wiki link information that wikipedia's standard page link is generated according to it
+        :return: compressed html content of the web page, None if the page could not be downloaded
+        """
+        url = self.get_url(wiki_link)
+        if url in self.unavailable:
+            return None
+        page_cache = self.configuration['page_cache']
+        content = page_cache.get_content(url)
+        METRICS.increment('page_cache_hit' if content is not None else 'page_cache_miss')
+        if content is None:
+            writer = self.download(url)
+            if writer is None:
+                return None
+            content = writer.content if writer.content is not None else page_cache.get_content(url)
+            if content is None:
+                return self.fetch_content(wiki_link)
+        return content
+
+    def read_page(self, wiki_link: str) -> Iterator:
+        """
+        Method is utilized to read the web page in decoded chunks, which are decompressed one by one
+        :param wiki_link: wiki link information that wikipedia's standard page link is generated according to it
+        :return: yields chunks of html content of the web page (nothing if the page could not be downloaded)
+        """
+        content = self.fetch_content(wiki_link)
+        if content is not None:
+            yield from iter_text(content)
+
+    def fetch_page(self, wiki_link: str) -> str:
+        """
+        Method is utilized to read the whole web page through the page cache
+        :param wiki_link: wiki link information that wikipedia's standard page link is generated according to it
+        :return: html content of the web page (empty if the page could not be downloaded)
+        """
+        return ''.join(self.read_page(wiki_link))
+
+    def prefetch(self, links: list) -> None:
+        """
+        Method is utilized to download all pages which are not cached yet concurrently, so that checking reads them
+        from the page cache (pages are only stored, they are not decompressed)
+        :param links: list of wiki links
+        :return: None
+        """
+        urls = [url for url in dict.fromkeys(self.get_url(link) for link in links)
+                if url not in self.unavailable and url not in self.configuration['page_cache']]
+        METRICS.increment('page_cache_miss', len(urls))
+        ti = tqdm(self.map(self.download, urls), total=len(urls), desc='Page fetching', leave=True)
+        for _ in ti:
+            pass
+
+    def get_document(self, wiki_link: str) -> dict:
+        """
+        Method is utilized to parse the page once and to keep the structured document of the recently used pages (per
+        page digest), so that table and page checks of the same link share the parsing until the page changes. The page
+        is decompressed and parsed chunk by chunk, so that its whole text is not held along with the soup
+        :param wiki_link: wiki link of the page
+        :return: dictionary that contains infobox data (or no_table) and list of paragraph texts
+        """
+        key = (wiki_link, self.get_digest(wiki_link))
+        with self.lock:
+            if key in self.documents:
+                self.documents.move_to_end(key)
+                METRICS.increment('documents_hit')
+                return self.documents[key]
+        METRICS.increment('documents_miss')
+        with METRICS.timer('parse'):
+            document = self.configuration['extractor'].extract_chunks(self.read_page(wiki_link))
+        with self.lock:
+            self.documents[key] = document
+            if len(self.documents) > self.configuration['documents_size']:
+                self.documents.popitem(last=False)
+        return document
+
+    def get_digest(self, wiki_link: str) -> str:
+        """
+        Method is utilized to identify the current content of the page. Expired pages are revalidated (and uncached ones
+        downloaded) first, so that the digest changes as soon as the page does
+        :param wiki_link: wiki link of the page
+        :return: SHA-1 digest of the page content
+        """
+        digest = self.configuration['page_cache'].digest(self.get_url(wiki_link))
+        if digest is None:
+            page_hash = hashlib.sha1()
+            for chunk in self.read_page(wiki_link):
+                page_hash.update(chunk.encode('utf-8'))
+            digest = page_hash.hexdigest()
+        return digest
+
+    def get_table(self, wiki_link: str) -> Any:
+        """
+        Method is utilized to collect infobox information of the page
+        :param wiki_link: wiki link of the page
+        :return: dictionary of table data if the page has infobox, otherwise no_table
+        """
+        digest = self.get_digest(wiki_link)
+        table = self.configuration['infobox_store'].get(wiki_link, digest)
+        METRICS.increment('infobox_store_hit' if table is not None else 'infobox_store_miss')
+        if table is None:
+            table = self.get_document(wiki_link)['infobox']
+            self.configuration['infobox_store'].put(wiki_link, digest, table)
+        return table
+
+    def get_paragraphs(self, wiki_link: str) -> list:
+        """
+        Method is utilized to collect texts of all paragraphs of the page
+        :param wiki_link: wiki link of the page
+        :return: list of paragraph texts
+        """
+        return self.get_document(wiki_link)['paragraphs']
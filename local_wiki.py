@@ -0,0 +1,177 @@
+import gzip
+import hashlib
+import json
+import threading
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, unquote, urlparse
+
+import brotli
+
+from utilities import normalize
+
+
+class LocalWiki:
+    """
+    Class is utilized as a local stand-in for Wikipedia: it answers search API requests and serves pages from the
+    provided data, so that fetching can be checked without network access. Like Wikipedia, pages are sent with ETag and
+    Last-Modified headers (conditional requests are answered by 304 Not Modified) and brotli or gzip-compressed if it is
+    accepted.
+    Failures (e.g., 429 or 503) can be scheduled per page title or search query
+    """
+    def __init__(self, search_results: dict, pages: dict, port: int = 0):
+        """
+        Method is utilized as an initializer of the class
+        :param search_results: dictionary in which keys are queries and values are lists of titles
+        :param pages: dictionary in which keys are page titles and values are html contents of the pages
+        :param port: port of the server (0 means any free port)
+        """
+        self.search_results = {normalize(query): titles for query, titles in search_results.items()}
+        self.pages = pages
+        self.failures = dict()
+        self.requests = {'search': 0, 'page': 0, 'not_modified': 0, 'bytes': 0}
+        self.modified = formatdate(usegmt=True)
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', port), self.set_handler())
+        self.thread = None
+
+    @property
+    def url(self) -> str:
+        """
+        Method is utilized to generate base url of the server, which can be used instead of wikipedia's url
+        :return: base url of the server
+        """
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def set_handler(self) -> type:
+        """
+        Method is utilized to generate request handler class which is bound to this object
+        :return: request handler class
+        """
+        local_wiki = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                if parsed.path == '/w/api.php':
+                    query = parse_qs(parsed.query).get('srsearch', [''])[0]
+                    local_wiki.count('search')
+                    if self.fail(normalize(query)):
+                        return
+                    titles = local_wiki.search_results.get(normalize(query), list())
+                    self.reply(200, json.dumps({'query': {'search': [{'title': each} for each in titles]}}),
+                               'application/json')
+                elif parsed.path.startswith('/wiki/'):
+                    local_wiki.count('page')
+                    title = unquote(parsed.path[len('/wiki/'):]).replace('_', ' ')
+                    if self.fail(title):
+                        return
+                    if title in local_wiki.pages:
+                        page = local_wiki.pages[title]
+                        etag = f'"{hashlib.sha1(page.encode("utf-8")).hexdigest()}"'
+                        headers = {'ETag': etag, 'Last-Modified': local_wiki.modified}
+                        if self.is_not_modified(etag):
+                            local_wiki.count('not_modified')
+                            self.reply(304, '', 'text/html; charset=utf-8', headers)
+                        else:
+                            self.reply(200, page, 'text/html; charset=utf-8', headers)
+                    else:
+                        self.reply(404, '<html><body><p>Not found</p></body></html>', 'text/html; charset=utf-8')
+                else:
+                    self.reply(404, '', 'text/plain')
+
+            def fail(self, target: str) -> bool:
+                status = local_wiki.get_failure(target)
+                if status is not None:
+                    self.reply(status, '<html><body><p>Error</p></body></html>', 'text/html; charset=utf-8',
+                               {'Retry-After': '0'})
+                return status is not None
+
+            def is_not_modified(self, etag: str) -> bool:
+                if self.headers.get('If-None-Match') is not None:
+                    return etag in [each.strip() for each in self.headers['If-None-Match'].split(',')]
+                if self.headers.get('If-Modified-Since') is not None:
+                    try:
+                        return parsedate_to_datetime(self.headers['If-Modified-Since']) >= parsedate_to_datetime(
+                            local_wiki.modified)
+                    except (TypeError, ValueError):
+                        return False
+                return False
+
+            def reply(self, status: int, body: str, content_type: str, headers: dict = None):
+                content = body.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                for key, value in (headers or dict()).items():
+                    self.send_header(key, value)
+                if status == 304:
+                    self.end_headers()
+                    return
+                accepted = [each.split(';')[0].strip() for each in self.headers.get('Accept-Encoding', '').split(',')]
+                if 'br' in accepted:
+                    content = brotli.compress(content)
+                    self.send_header('Content-Encoding', 'br')
+                elif 'gzip' in accepted:
+                    content = gzip.compress(content)
+                    self.send_header('Content-Encoding', 'gzip')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                local_wiki.count('bytes', len(content))
+                self.wfile.write(content)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def fail(self, target: str, statuses: list) -> None:
+        """
+        Method is utilized to schedule failures of the page or search query: next requests are answered by the given
+        statuses (one per request) before the target is served again
+        :param target: page title or search query
+        :param statuses: list of HTTP status codes (e.g., 429 or 503)
+        :return: None
+        """
+        with self.lock:
+            self.failures[normalize(target)] = list(statuses)
+
+    def get_failure(self, target: str) -> Optional[int]:
+        """
+        Method is utilized to take the next scheduled failure of the page or search query
+        :param target: page title or search query
+        :return: HTTP status code of the failure, None if no failure is scheduled
+        """
+        with self.lock:
+            statuses = self.failures.get(normalize(target))
+            return statuses.pop(0) if statuses else None
+
+    def count(self, request_type: str, value: int = 1) -> None:
+        """
+        Method is utilized to count requests that server received (and bytes of bodies that it sent)
+        :param request_type: type of the request (search, page or not_modified) or bytes
+        :param value: value that is added to the counter
+        :return: None
+        """
+        with self.lock:
+            self.requests[request_type] += value
+
+    def start(self) -> str:
+        """
+        Method is utilized to start the server in the background thread
+        :return: base url of the server
+        """
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self.url
+
+    def stop(self) -> None:
+        """
+        Method is utilized to stop the server
+        :return: None
+        """
+        self.server.shutdown()
+        self.server.server_close()
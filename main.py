@@ -1,16 +1,19 @@
-import nltk
+import os
 
-from fact_check import FactChecking
-from utilities import *
-nltk.download('wordnet')
-nltk.download('punkt')
+from metrics import METRICS
+from pipeline import PipelineContext
+from utilities import collect_parameters
 
 
 def __main__():
     parameters = collect_parameters()
-    fc = FactChecking(parameters)
-    fc.process_scrapping()
-    fc.process_info()
+    METRICS.configure(parameters)
+    fc = PipelineContext(parameters).fact_checker
+    if parameters['output_format'] == 'pickle':
+        fc.process_info()
+    else:
+        fc.write_predictions(parameters['output_format'])
+    METRICS.write(os.path.join(parameters['output_dir'], 'metrics.json'))
 
 
 if __name__ == '__main__':
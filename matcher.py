@@ -0,0 +1,77 @@
+from collections import deque
+
+
+class CategoryMatcher:
+    """
+    Class is utilized as a multi-pattern substring matcher (Aho-Corasick automaton). It is built once from the list of
+    patterns (e.g., categories) and finds all of them in a single pass over the text
+    """
+    def __init__(self, patterns: list):
+        """
+        Method is utilized as an initializer of the class
+        :param patterns: list of patterns that are searched
+        """
+        self.patterns = patterns
+        self.transitions = [dict()]
+        self.fail = [0]
+        self.outputs = [list()]
+        for idx, pattern in enumerate(patterns):
+            self.add_pattern(idx, pattern)
+        self.set_fail_links()
+
+    def add_pattern(self, idx: int, pattern: str) -> None:
+        """
+        Method is utilized to add the pattern to the trie of the automaton
+        :param idx: index of the pattern in the list of patterns
+        :param pattern: pattern that is added
+        :return: None
+        """
+        state = 0
+        for character in pattern:
+            if character not in self.transitions[state]:
+                self.transitions.append(dict())
+                self.fail.append(0)
+                self.outputs.append(list())
+                self.transitions[state][character] = len(self.transitions) - 1
+            state = self.transitions[state][character]
+        self.outputs[state].append(idx)
+
+    def set_fail_links(self) -> None:
+        """
+        Method is utilized to compute failure links in breadth-first order, so that each state also reports patterns
+        that end at its longest proper suffix
+        :return: None
+        """
+        queue = deque(self.transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for character, next_state in self.transitions[state].items():
+                queue.append(next_state)
+                fail_state = self.fail[state]
+                while fail_state and character not in self.transitions[fail_state]:
+                    fail_state = self.fail[fail_state]
+                self.fail[next_state] = self.transitions[fail_state].get(character, 0)
+                self.outputs[next_state] = self.outputs[next_state] + self.outputs[self.fail[next_state]]
+
+    def find(self, text: str) -> list:
+        """
+        Method is utilized to find all patterns that occur in the text
+        :param text: input text
+        :return: sorted list of indices of the patterns that occur in the text (i.e., pattern in text is True)
+        """
+        found = set(self.outputs[0])
+        state = 0
+        for character in text:
+            while state and character not in self.transitions[state]:
+                state = self.fail[state]
+            state = self.transitions[state].get(character, 0)
+            found.update(self.outputs[state])
+        return sorted(found)
+
+    def find_patterns(self, text: str) -> list:
+        """
+        Method is utilized to find all patterns that occur in the text, in the order of the list of patterns
+        :param text: input text
+        :return: list of patterns that occur in the text
+        """
+        return [self.patterns[idx] for idx in self.find(text)]
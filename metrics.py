@@ -0,0 +1,215 @@
+import cProfile
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Iterator
+
+
+class Metrics:
+    """
+    Class is utilized as a registry of counters and timers of the project: stages and external calls (search, fetching,
+    parsing, checking) are measured, so that slow runs can be attributed to their cause
+    """
+    def __init__(self, reservoir_size: int = 10000):
+        """
+        Method is utilized as an initializer of the class
+        :param reservoir_size: number of the recent observations per timer that are kept for percentiles
+        """
+        self.reservoir_size = reservoir_size
+        self.lock = threading.Lock()
+        self.counters = dict()
+        self.timers = dict()
+        self.profile_stage = None
+        self.profile_dir = None
+
+    def configure(self, parameters: dict) -> None:
+        """
+        Method is utilized to configure profiling according to the provided parameters
+        :param parameters: all required parameters for the project
+        :return: None
+        """
+        self.profile_stage = parameters.get('profile_stage')
+        self.profile_dir = parameters['output_dir']
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """
+        Method is utilized to increase the counter
+        :param name: name of the counter
+        :param value: value that is added to the counter
+        :return: None
+        """
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float) -> None:
+        """
+        Method is utilized to record the duration
+        :param name: name of the timer
+        :param seconds: duration in seconds
+        :return: None
+        """
+        with self.lock:
+            if name not in self.timers:
+                self.timers[name] = {'count': 0, 'total': 0.0, 'recent': deque(maxlen=self.reservoir_size)}
+            timer = self.timers[name]
+            timer['count'] += 1
+            timer['total'] += seconds
+            timer['recent'].append(seconds)
+
+    def drain(self) -> dict:
+        """
+        Method is utilized to take all recorded metrics and to reset them (e.g., in the worker process, whose metrics
+        are sent to the main process along with the results of each chunk)
+        :return: dictionary of counters and timers (count, total and recent observations)
+        """
+        with self.lock:
+            timers = {name: {'count': timer['count'], 'total': timer['total'], 'recent': list(timer['recent'])}
+                      for name, timer in self.timers.items()}
+            state = {'counters': self.counters, 'timers': timers}
+            self.counters = dict()
+            self.timers = dict()
+        return state
+
+    def merge(self, state: dict) -> None:
+        """
+        Method is utilized to add metrics which were recorded elsewhere (e.g., in the worker process)
+        :param state: dictionary of counters and timers which was returned by drain
+        :return: None
+        """
+        with self.lock:
+            for name, value in state['counters'].items():
+                self.counters[name] = self.counters.get(name, 0) + value
+            for name, other in state['timers'].items():
+                if name not in self.timers:
+                    self.timers[name] = {'count': 0, 'total': 0.0, 'recent': deque(maxlen=self.reservoir_size)}
+                timer = self.timers[name]
+                timer['count'] += other['count']
+                timer['total'] += other['total']
+                timer['recent'].extend(other['recent'])
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator:
+        """
+        Method is utilized to measure the duration of the block
+        :param name: name of the timer
+        :return: None
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator:
+        """
+        Method is utilized to measure the stage. The stage is also profiled, if it was chosen for profiling
+        :param name: name of the stage
+        :return: None
+        """
+        profiler = cProfile.Profile() if name == self.profile_stage else None
+        if profiler is not None:
+            profiler.enable()
+        try:
+            with self.timer(f'stage_{name}'):
+                yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                profiler.dump_stats(os.path.join(self.profile_dir, f'profile_{name}.prof'))
+
+    @staticmethod
+    def percentile(values: list, rank: float) -> float:
+        """
+        Method is utilized to compute the percentile of the sorted values (nearest-rank method)
+        :param values: sorted list of values
+        :param rank: requested percentile (e.g., 50 or 99)
+        :return: percentile of the values (0 if there is no value)
+        """
+        if not values:
+            return 0.0
+        return values[min(len(values) - 1, max(0, int(len(values) * rank / 100 + 0.5) - 1))]
+
+    def summary(self) -> dict:
+        """
+        Method is utilized to summarize all metrics. Hit rates are computed for all counters which come in pairs of
+        <name>_hit and <name>_miss, work per fact is computed for checks (e.g., average page work per checked fact)
+        :return: dictionary of counters, timers (count, total, mean and percentiles in milliseconds), hit rates and work
+        per fact
+        """
+        with self.lock:
+            counters = dict(self.counters)
+            timers = {name: (timer['count'], timer['total'], sorted(timer['recent']))
+                      for name, timer in self.timers.items()}
+        summary = {'counters': counters, 'timers': dict(), 'hit_rates': dict(), 'per_fact': dict()}
+        for name, (count, total, recent) in timers.items():
+            summary['timers'][name] = {
+                'count': count,
+                'total_s': round(total, 6),
+                'mean_ms': round(total / count * 1000, 4) if count else 0.0,
+                'p50_ms': round(self.percentile(recent, 50) * 1000, 4),
+                'p99_ms': round(self.percentile(recent, 99) * 1000, 4)
+            }
+        for name in counters:
+            if name.endswith('_hit'):
+                prefix = name[:-len('_hit')]
+                total = counters[name] + counters.get(f'{prefix}_miss', 0)
+                summary['hit_rates'][prefix] = round(counters[name] / total, 4) if total else 0.0
+        facts = counters.get('facts_checked', 0)
+        for name in ['table_checks', 'page_checks']:
+            if facts:
+                summary['per_fact'][name] = round(counters.get(name, 0) / facts, 4)
+        return summary
+
+    def to_prometheus(self, namespace: str = 'factcheck') -> str:
+        """
+        Method is utilized to export all metrics in Prometheus text format
+        :param namespace: prefix of all metric names
+        :return: metrics in Prometheus text exposition format
+        """
+        summary = self.summary()
+        lines = list()
+        for name, value in sorted(summary['counters'].items()):
+            lines.extend([f'# TYPE {namespace}_{name}_total counter', f'{namespace}_{name}_total {value}'])
+        for name, timer in sorted(summary['timers'].items()):
+            metric = f'{namespace}_{name}_seconds'
+            lines.append(f'# TYPE {metric} summary')
+            for rank in [50, 99]:
+                lines.append(f'{metric}{{quantile="{rank / 100}"}} {timer[f"p{rank}_ms"] / 1000}')
+            lines.extend([f'{metric}_sum {timer["total_s"]}', f'{metric}_count {timer["count"]}'])
+        for name, rate in sorted(summary['hit_rates'].items()):
+            lines.extend([f'# TYPE {namespace}_{name}_hit_rate gauge', f'{namespace}_{name}_hit_rate {rate}'])
+        for name, value in sorted(summary['per_fact'].items()):
+            lines.extend([f'# TYPE {namespace}_{name}_per_fact gauge', f'{namespace}_{name}_per_fact {value}'])
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path: str) -> None:
+        """
+        Method is utilized to write the summary of all metrics as json
+        :param path: path to the summary file
+        :return: None
+        """
+        with open(path, 'w') as metrics_file:
+            json.dump(self.summary(), metrics_file, indent=2)
+
+
+METRICS = Metrics()
+
+
+def timed(name: str) -> Callable:
+    """
+    Function is utilized as a decorator that measures (and optionally profiles) the stage
+    :param name: name of the stage
+    :return: decorator of the stage method
+    """
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            with METRICS.stage(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,243 @@
+import codecs
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Iterator, Optional
+
+
+def iter_text(content: bytes, chunk_size: int = 65536) -> Iterator:
+    """
+    Function is utilized to decompress the page in chunks, so that its whole text is never materialized
+    :param content: compressed page content
+    :param chunk_size: maximum size of each decompressed chunk in bytes
+    :return: yields decoded chunks of the page
+    """
+    decompressor = zlib.decompressobj()
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    while content:
+        yield decoder.decode(decompressor.decompress(content, chunk_size))
+        content = decompressor.unconsumed_tail
+    yield decoder.decode(decompressor.flush(), final=True)
+
+
+class PageWriter:
+    """
+    Class is utilized to compress and hash the page while it is downloaded, so that decoded chunks are not joined into
+    the whole page text before it is stored
+    """
+    def __init__(self):
+        """
+        Method is utilized as an initializer of the class
+        """
+        self.compressor = zlib.compressobj()
+        self.hash = hashlib.sha1()
+        self.chunks = list()
+        self.content = None
+        self.digest = None
+
+    def write(self, text: str) -> None:
+        """
+        Method is utilized to add the next decoded chunk of the page
+        :param text: decoded chunk of the page
+        :return: None
+        """
+        data = text.encode('utf-8')
+        self.hash.update(data)
+        self.chunks.append(self.compressor.compress(data))
+
+    def close(self) -> None:
+        """
+        Method is utilized to finish the page: compressed content and digest are available after it
+        :return: None
+        """
+        self.chunks.append(self.compressor.flush())
+        self.content = b''.join(self.chunks)
+        self.digest = self.hash.hexdigest()
+        self.chunks = list()
+
+
+class PageCache:
+    """
+    Class is utilized as a persistent storage of downloaded web pages. Pages are kept compressed in the SQLite database,
+    keyed by their canonical url, expire after the given time-to-live and the least recently used ones are evicted when
+    the storage exceeds its size limit. Expired pages with HTTP validators (ETag, Last-Modified) are kept, so that they
+    can be revalidated by the conditional request instead of downloading them again
+    """
+    def __init__(self, cache_dir: str, ttl: int, max_size: int):
+        """
+        Method is utilized as an initializer of the class
+        :param cache_dir: directory in which the cache database is kept
+        :param ttl: time-to-live of the page in seconds (0 means pages never expire)
+        :param max_size: maximum size of the compressed pages in bytes (0 means there is no size limit)
+        """
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+        self.ttl = ttl
+        self.max_size = max_size
+        self.lock = threading.Lock()
+        self.digests = dict()
+        self.connection = sqlite3.connect(os.path.join(cache_dir, 'pages.sqlite'), timeout=30,
+                                          check_same_thread=False)
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS pages ('
+            'url TEXT PRIMARY KEY, content BLOB NOT NULL, size INTEGER NOT NULL, '
+            'fetched REAL NOT NULL, accessed REAL NOT NULL, digest TEXT, etag TEXT, last_modified TEXT)'
+        )
+        columns = [each[1] for each in self.connection.execute('PRAGMA table_info(pages)').fetchall()]
+        for column in ['digest', 'etag', 'last_modified']:
+            if column not in columns:
+                self.connection.execute(f'ALTER TABLE pages ADD COLUMN {column} TEXT')
+        self.connection.execute('CREATE INDEX IF NOT EXISTS pages_accessed ON pages (accessed)')
+        self.connection.commit()
+
+    def get(self, url: str) -> Optional[str]:
+        """
+        Method is utilized to read the page from the cache
+        :param url: canonical url of the page
+        :return: page content if it is cached and not expired, otherwise None
+        """
+        content = self.get_content(url)
+        return zlib.decompress(content).decode('utf-8') if content is not None else None
+
+    def get_content(self, url: str) -> Optional[bytes]:
+        """
+        Method is utilized to read the compressed page from the cache, so that it can be decompressed in chunks
+        :param url: canonical url of the page
+        :return: compressed page content if it is cached and not expired, otherwise None
+        """
+        with self.lock:
+            row = self.connection.execute('SELECT content, fetched, etag, last_modified FROM pages WHERE url = ?',
+                                          (url,)).fetchone()
+            if row is None:
+                return None
+            content, fetched, etag, last_modified = row
+            now = time.time()
+            if self.ttl and now - fetched > self.ttl:
+                if etag is None and last_modified is None:
+                    self.connection.execute('DELETE FROM pages WHERE url = ?', (url,))
+                    self.connection.commit()
+                    self.digests.pop(url, None)
+                return None
+            self.connection.execute('UPDATE pages SET accessed = ? WHERE url = ?', (now, url))
+            self.connection.commit()
+        return content
+
+    def put(self, url: str, page: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """
+        Method is utilized to store the page in the cache and to evict the least recently used pages if it is required
+        :param url: canonical url of the page
+        :param page: page content
+        :param etag: ETag header of the response (if it was sent)
+        :param last_modified: Last-Modified header of the response (if it was sent)
+        :return: None
+        """
+        writer = PageWriter()
+        writer.write(page)
+        writer.close()
+        self.store(url, writer, etag, last_modified)
+
+    def store(self, url: str, writer: PageWriter, etag: Optional[str] = None,
+              last_modified: Optional[str] = None) -> None:
+        """
+        Method is utilized to store the page which was already compressed and hashed by the writer (e.g., while it was
+        downloaded) and to evict the least recently used pages if it is required
+        :param url: canonical url of the page
+        :param writer: closed page writer
+        :param etag: ETag header of the response (if it was sent)
+        :param last_modified: Last-Modified header of the response (if it was sent)
+        :return: None
+        """
+        now = time.time()
+        with self.lock:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO pages (url, content, size, fetched, accessed, digest, etag, last_modified) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (url, writer.content, len(writer.content), now, now, writer.digest, etag, last_modified)
+            )
+            self.digests[url] = (writer.digest, now)
+            self.evict()
+            self.connection.commit()
+
+    def get_validators(self, url: str) -> tuple:
+        """
+        Method is utilized to read HTTP validators of the cached (possibly expired) page
+        :param url: canonical url of the page
+        :return: tuple of ETag and Last-Modified values (None values if the page is not cached or has no validators)
+        """
+        with self.lock:
+            row = self.connection.execute('SELECT etag, last_modified FROM pages WHERE url = ?', (url,)).fetchone()
+        return tuple(row) if row is not None else (None, None)
+
+    def refresh(self, url: str) -> bool:
+        """
+        Method is utilized to renew the cached page, after the server has confirmed that it was not modified
+        :param url: canonical url of the page
+        :return: boolean variable that specifies whether the page was renewed (False if it is not cached anymore)
+        """
+        now = time.time()
+        with self.lock:
+            cursor = self.connection.execute('UPDATE pages SET fetched = ?, accessed = ? WHERE url = ?',
+                                             (now, now, url))
+            self.connection.commit()
+            self.digests.pop(url, None)
+        return cursor.rowcount > 0
+
+    def digest(self, url: str) -> Optional[str]:
+        """
+        Method is utilized to get the content hash of the cached page, so that results derived from the page can be
+        reused until the page changes. Digests are kept in memory along with the time the page was fetched, since they
+        are requested for every reused check
+        :param url: canonical url of the page
+        :return: SHA-1 digest of the page content if it is cached and not expired, otherwise None
+        """
+        with self.lock:
+            if url not in self.digests or self.expired(self.digests[url][1]):
+                row = self.connection.execute('SELECT digest, fetched FROM pages WHERE url = ?', (url,)).fetchone()
+                if row is None:
+                    return None
+                self.digests[url] = tuple(row)
+            digest, fetched = self.digests[url]
+        return None if self.expired(fetched) else digest
+
+    def expired(self, fetched: float) -> bool:
+        """
+        Method is utilized to check whether the page which was fetched at the given time is expired
+        :param fetched: time at which the page was fetched (or revalidated)
+        :return: boolean variable that specifies whether time-to-live of the page has passed or not
+        """
+        return bool(self.ttl) and time.time() - fetched > self.ttl
+
+    def evict(self) -> None:
+        """
+        Method is utilized to remove the least recently used pages until the cache fits into its size limit. Note: it
+        must be called while the lock is held
+        :return: None
+        """
+        if not self.max_size:
+            return
+        total_size = self.connection.execute('SELECT COALESCE(SUM(size), 0) FROM pages').fetchone()[0]
+        if total_size <= self.max_size:
+            return
+        rows = self.connection.execute('SELECT url, size FROM pages ORDER BY accessed ASC').fetchall()
+        removables = list()
+        for url, size in rows:
+            if total_size <= self.max_size:
+                break
+            removables.append((url,))
+            total_size -= size
+        self.connection.executemany('DELETE FROM pages WHERE url = ?', removables)
+        for url, in removables:
+            self.digests.pop(url, None)
+
+    def __contains__(self, url: str) -> bool:
+        """
+        Method is utilized to check whether the page is cached and not expired
+        :param url: canonical url of the page
+        :return: boolean variable that specifies whether the page is cached or not
+        """
+        with self.lock:
+            row = self.connection.execute('SELECT fetched FROM pages WHERE url = ?', (url,)).fetchone()
+        return row is not None and not (self.ttl and time.time() - row[0] > self.ttl)
@@ -0,0 +1,93 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Callable, Iterable, Iterator
+
+from metrics import METRICS
+from utilities import complete_parameters
+
+WORKER = dict()
+
+
+def init_worker(parameters: dict) -> None:
+    """
+    Function is utilized to build the fact checker once per worker process. Sentence processing stages are not built,
+    since workers only search and check the data they receive
+    :param parameters: all required parameters for the project
+    :return: None
+    """
+    from pipeline import PipelineContext
+    WORKER['checker'] = PipelineContext(parameters).fact_checker
+
+
+def check_chunk(chunk: list) -> list:
+    """
+    Function is utilized to check the chunk of data in the worker process
+    :param chunk: list of data with wiki matches
+    :return: list of (checking result, source) pairs in the same order as the chunk
+    """
+    return [WORKER['checker'].check_source(each_data) for each_data in chunk]
+
+
+def search_chunk(chunk: list) -> list:
+    """
+    Function is utilized to search the chunk of queries in the worker process
+    :param chunk: list of queries
+    :return: list of search results in the same order as the chunk
+    """
+    backend = WORKER['checker'].configuration['context'].backend
+    return list(backend.map(backend.search, chunk))
+
+
+def run_chunk(function: Callable, chunk: list) -> tuple:
+    """
+    Function is utilized to run the chunk function in the worker process and to collect metrics which were recorded
+    meanwhile, since metrics of the worker process are not shared with the main process
+    :param function: function that is applied to the chunk (check_chunk or search_chunk)
+    :param chunk: list of items
+    :return: tuple of results of the chunk and metrics of the worker which were recorded since its previous chunk
+    """
+    results = function(chunk)
+    return results, METRICS.drain()
+
+
+class ParallelRunner:
+    """
+    Class is utilized to split the work into chunks and to run them across the pool of worker processes
+    """
+    def __init__(self, config_parameters: dict):
+        """
+        Method is utilized as an initializer of the class
+        :param config_parameters: all required parameters for the project
+        """
+        config_parameters = complete_parameters(config_parameters)
+        self.parameters = config_parameters
+        self.workers = config_parameters['workers']
+        self.chunk_size = max(config_parameters['chunk_size'], 1)
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Method is utilized to check whether the work must be run in parallel or not
+        :return: boolean variable that specifies whether more than one worker was requested
+        """
+        return self.workers > 1
+
+    def map(self, function: Callable, items: Iterable) -> Iterator:
+        """
+        Method is utilized to apply the chunk function (check_chunk or search_chunk) to all items in worker processes
+        :param function: function that is applied to each chunk
+        :param items: input items
+        :return: iterator of results in the same order as the items, available as soon as their chunk is done (metrics
+        of workers are merged into metrics of the main process)
+        """
+        items = list(items)
+        chunks = [items[idx: idx + self.chunk_size] for idx in range(0, len(items), self.chunk_size)]
+        if not chunks:
+            return
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(chunks)),
+                                 mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=init_worker, initargs=(self.parameters,)) as executor:
+            for results, metrics in executor.map(run_chunk, repeat(function), chunks):
+                METRICS.merge(metrics)
+                yield from results
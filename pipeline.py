@@ -0,0 +1,120 @@
+import os
+from functools import cached_property
+from typing import Any
+
+from utilities import complete_parameters
+
+
+class PipelineContext:
+    """
+    Class is utilized as a shared context of the pipeline: each stage is built lazily, exactly once, and the same
+    instance is handed to all of its consumers (e.g., reader is shared by categorization and sentence processing)
+    """
+    def __init__(self, config_parameters: dict):
+        """
+        Method is utilized as an initializer of the class
+        :param config_parameters: all required parameters for the project
+        """
+        self.parameters = complete_parameters(config_parameters)
+
+    @cached_property
+    def stopwords(self) -> list:
+        """
+        Method is utilized to load stopwords (once) along with the contractions that tokenizer generates
+        :return: list of stopwords
+        """
+        from utilities import require_resources
+        require_resources('corpora/stopwords')
+        from nltk.corpus import stopwords
+        sw = stopwords.words('english')
+        sw.extend(["'re", "'s", "'ve"])
+        return sw
+
+    @cached_property
+    def reader(self) -> Any:
+        """
+        Method is utilized to build the dataset reader
+        :return: ReadDataset object
+        """
+        from reader import ReadDataset
+        return ReadDataset(self.parameters)
+
+    @cached_property
+    def categorizer(self) -> Any:
+        """
+        Method is utilized to build the category extractor
+        :return: CategorizeDataset object
+        """
+        from categorize import CategorizeDataset
+        return CategorizeDataset(self.parameters, context=self)
+
+    @cached_property
+    def sentences(self) -> Any:
+        """
+        Method is utilized to build the sentence processor
+        :return: ProcessSentences object
+        """
+        from process_sentences import ProcessSentences
+        return ProcessSentences(self.parameters, context=self)
+
+    @cached_property
+    def backend(self) -> Any:
+        """
+        Method is utilized to build the source of wikipedia information
+        :return: live or dump backend object
+        """
+        from fact_check import FactChecking
+        return FactChecking.set_backend(self.parameters)
+
+    @cached_property
+    def identity(self) -> tuple:
+        """
+        Method is utilized to identify the source of wikipedia information without building the backend, so that stage
+        keys of the warm run are computed without importing and opening the backend
+        :return: identity of the backend
+        """
+        from fact_check import FactChecking
+        return FactChecking.get_identity(self.parameters)
+
+    @cached_property
+    def resolver(self) -> Any:
+        """
+        Method is utilized to build the entity resolver of the current backend
+        :return: EntityResolver object
+        """
+        from resolver import EntityResolver
+        return EntityResolver(self.parameters, self.identity)
+
+    @cached_property
+    def knowledge_base(self) -> Any:
+        """
+        Method is utilized to build the knowledge base from the processed facts of the training set. It is used only
+        for other fact sets, since the training set would be settled by its own labels
+        :return: KnowledgeBase object, None if it is disabled or training set is not available
+        """
+        training = os.path.join(self.parameters['input_dir'], 'training.tsv')
+        if not self.parameters['knowledge_base'] or self.parameters['fact_set'] == 'training' or \
+                not os.path.exists(training):
+            return None
+        from artifacts import fingerprint
+        from fact_check import FactChecking
+        from knowledge_base import KnowledgeBase
+        sentences = PipelineContext(dict(self.parameters, fact_set='training')).sentences
+        synonyms = FactChecking.set_synonyms()
+        knowledge_base = KnowledgeBase(os.path.join(self.parameters['output_dir'], 'knowledge_base'), synonyms)
+        key = fingerprint(sentences.stage_key, synonyms)
+        if knowledge_base.read_key() != key:
+            dataset = sentences.dataset
+            labels = (label == '1.0' for label in dataset.column('label'))
+            knowledge_base.build(zip(dataset.column('main_info'), dataset.column('category'),
+                                     dataset.column('secondary_info'), labels), key)
+        return knowledge_base
+
+    @cached_property
+    def fact_checker(self) -> Any:
+        """
+        Method is utilized to build the fact checker
+        :return: FactChecking object
+        """
+        from fact_check import FactChecking
+        return FactChecking(self.parameters, context=self)
@@ -0,0 +1,60 @@
+from collections import OrderedDict
+from typing import Callable
+
+from metrics import METRICS
+
+
+class CheckPlanner:
+    """
+    Class is utilized to plan checks of the fact from the cheapest to the most expensive one: infobox lookups of both
+    wiki links come before paragraph scans, and the plan stops at the first hit. Outcome of each check is kept per
+    (link, page digest, info, category) in the bounded LRU, so that facts which share an entity reuse it instead of
+    checking again, until the page changes
+    """
+    STEPS = (('table', 'main'), ('table', 'secondary'), ('page', 'main'), ('page', 'secondary'))
+
+    def __init__(self, checks: dict, get_digest: Callable, memo_size: int):
+        """
+        Method is utilized as an initializer of the class
+        :param checks: dictionary in which keys are kinds of checks (table and page) and values are functions that
+        receive the dictionary of wiki link, info and category and return the boolean result of the check
+        :param get_digest: function that receives the wiki link and returns the digest of the current page content
+        :param memo_size: maximum number of outcomes that are kept in memory
+        """
+        self.checks = checks
+        self.get_digest = get_digest
+        self.memo_size = memo_size
+        self.memo = OrderedDict()
+
+    def get_outcome(self, kind: str, info_dict: dict) -> bool:
+        """
+        Method is utilized to run the check, unless its outcome is already known for the current content of the page
+        :param kind: kind of the check: table or page
+        :param info_dict: dictionary that contains wiki link, info and category
+        :return: boolean result of the check
+        """
+        key = (kind, info_dict['wiki_link'], self.get_digest(info_dict['wiki_link']), info_dict['info'],
+               info_dict['category'])
+        if key in self.memo:
+            METRICS.increment('plan_outcome_hit')
+            self.memo.move_to_end(key)
+            return self.memo[key]
+        METRICS.increment('plan_outcome_miss')
+        METRICS.increment(f'{kind}_checks')
+        outcome = self.checks[kind](info_dict)
+        self.memo[key] = outcome
+        if len(self.memo) > self.memo_size:
+            self.memo.popitem(last=False)
+        return outcome
+
+    def run(self, check_dict: dict) -> str:
+        """
+        Method is utilized to check the fact by following the plan until the first hit
+        :param check_dict: dictionary that contains info dictionaries of main and secondary wiki links
+        :return: source of the match: table, page or none
+        """
+        for kind, info_type in self.STEPS:
+            info_dict = check_dict[info_type]
+            if info_dict['wiki_link'] != 'no_match' and self.get_outcome(kind, info_dict):
+                return kind
+        return 'none'
@@ -1,89 +1,117 @@
-from reader import ReadDataset
-from categorize import CategorizeDataset
-from nltk.tokenize import word_tokenize
+from functools import cached_property
 from string import punctuation
-from utilities import check_dir
-import pickle
+from utilities import check_dir, complete_parameters
+from matcher import CategoryMatcher
+from artifacts import StageArtifact, fingerprint
+from pipeline import PipelineContext
+from metrics import timed
+from records import FactTable
 import os
 
 class ProcessSentences:
     """
     Class is utilized to extract scrapping relevant data, since the project relies on Wikipedia information
     """
-    def __init__(self, config_parameters: dict):
+    def __init__(self, config_parameters: dict, context: PipelineContext = None):
         """
         Method is utilized as an initializer of the class
         :param config_parameters: all required parameters for the project
+        :param context: shared pipeline context (new context is created if it is not provided)
         """
-        self.configuration = self.set_configuration(config_parameters)
-        self.dataset = self.read_data()
+        config_parameters = complete_parameters(config_parameters)
+        context = context if context is not None else PipelineContext(config_parameters)
+        self.configuration = self.set_configuration(config_parameters, context)
+        self.stage_key = fingerprint(self.configuration['reader'].stage_key, self.configuration['categories'],
+                                     'fact_table')
 
-    def set_configuration(self, parameters: dict):
+    def set_configuration(self, parameters: dict, context: PipelineContext):
         """
         Method is utilized to extract and generate task-specific parameters according to the provided parameters
         :param parameters: all required parameters for the project
+        :param context: shared pipeline context, which provides reader and category extractor
         :return: configuration dictionary that contains required parameters for the specific task
         """
         configuration = dict()
         check_dir(parameters['output_dir'])
         processed_dir = os.path.join(parameters['output_dir'], f"processed_{parameters['fact_set']}.pickle")
-        category_extractor = CategorizeDataset(parameters)
-        configuration['reader'] = ReadDataset(parameters)
+        category_extractor = context.categorizer
+        configuration['reader'] = context.reader
+        configuration['tokenize'] = context.reader.configuration['tokenize']
         configuration['categories'] = category_extractor.categories
-        configuration['sw'] = category_extractor.configuration['sw']
+        configuration['matcher'] = CategoryMatcher(category_extractor.categories)
         configuration['processed_dir'] = processed_dir
+        configuration['structure_config'] = fingerprint('process_structure',
+                                                        context.reader.configuration['tokenizer_config'])
         return configuration
 
-    def read_data(self) -> dict:
+    @cached_property
+    def dataset(self) -> FactTable:
+        """
+        Method is utilized to read the processed facts only when they are requested (e.g., not for the warm run whose
+        predictions are loaded from the artifact)
+        :return: table of the extracted information
+        """
+        return self.read_data()
+
+    @timed('read_data')
+    def read_data(self) -> FactTable:
         """
         Method is utilized to read and extract relevant information for scrapping
-        :return: dictionary of the extracted information
-        """
-        if not os.path.exists(self.configuration['processed_dir']):
-            dataset = {
-                'id': list(),
-                'label': list(),
-                'data': list(),
-                'category': list(),
-                'main_info': list(),
-                'secondary_info': list()
-            }
-
-            data = self.configuration['reader'].dataset
-            for idx, each in enumerate(data['data']):
-                label = data['label'][idx]
-                data_id = data['id'][idx]
-                for k in self.configuration['categories']:
-                    if k in each:
-                        main_info, secondary_info = self.process_structure(each, k)
-                        dataset['main_info'].append(main_info)
-                        dataset['secondary_info'].append(secondary_info)
-                        dataset['category'].append(k)
-                        dataset['id'].append(data_id)
-                        dataset['label'].append(label)
-                        dataset['data'].append(each)
-            with open(self.configuration['processed_dir'], 'wb') as data:
-                pickle.dump(dataset, data)
-        with open(self.configuration['processed_dir'], 'rb') as data:
-            dataset = pickle.load(data)
+        :return: table of the extracted information
+        """
+        artifact = StageArtifact(self.configuration['processed_dir'])
+        dataset = artifact.load(self.stage_key)
+        if dataset is None:
+            processed = artifact.rows(self.configuration['structure_config'])
+            rows = dict()
+            dataset = FactTable()
+
+            matcher = self.configuration['matcher']
+            for row in self.configuration['reader'].iter_rows(ngrams=False):
+                each = row['data']
+                tokens = row['unigrams']
+                label = row['label']
+                data_id = row['id']
+                row_key = (each, tuple(matcher.find_patterns(each)))
+                if row_key not in processed:
+                    processed[row_key] = [(k, *self.process_structure(each, k, tokens)) for k in row_key[1]]
+                rows[row_key] = processed[row_key]
+                for k, main_info, secondary_info in rows[row_key]:
+                    dataset.append(id=data_id, data=each, label=label, category=k, main_info=main_info,
+                                   secondary_info=secondary_info)
+            artifact.save(self.stage_key, self.configuration['structure_config'], dataset, rows)
 
         return dataset
 
-    def process_structure(self, sentence: str, category: str) -> tuple:
+    def parse(self, sentence: str) -> list:
+        """
+        Method is utilized to extract scrapping relevant data from the single raw sentence (e.g., one that was received
+        by the fact-checking server)
+        :param sentence: input sentence
+        :return: list of (category, main info, secondary info) tuples, one per category found in the sentence
+        """
+        categories = self.configuration['matcher'].find_patterns(sentence)
+        tokens = self.configuration['tokenize'](sentence) if categories else None
+        return [(k, *self.process_structure(sentence, k, tokens)) for k in categories]
+
+    def process_structure(self, sentence: str, category: str, tokens: list = None) -> tuple:
         """
         Method is utilized to process sentences according to the provided categories
         :param sentence: provided input data
         :param category: category that was extracted from the sentence
+        :param tokens: tokens of the sentence, which were computed by the reader (sentence is tokenized, if they are not
+        provided). When the last token is the stripped punctuation, the rest of tokens are reused as they are
         :return: tuple that contains main and secondary information from the provided sentence
         """
         category_parts = category.split(' ')
         key = category_parts[1] if len(category_parts) == 2 else category
 
-        tokens = word_tokenize(sentence)
+        tokens = tokens if tokens is not None else self.configuration['tokenize'](sentence)
         if tokens[-1] in punctuation:
-            sentence = sentence[0: -1]
+            stripped = sentence[0: -1]
+            tokens = tokens[:-1] if sentence[-1] == tokens[-1] else self.configuration['tokenize'](stripped)
+            sentence = stripped
 
-        tokens = word_tokenize(sentence)
         if tokens[-1] == key:
             main_info, secondary_info = self.process_last(sentence, category)
         else:
@@ -122,15 +150,14 @@ class ProcessSentences:
     def __iter__(self):
         """
         Method is utilized to transform the class to generator
-        :return: yields all relevant information from the dataset
+        :return: yields all relevant information from the dataset as views of its rows
         """
-        for idx, _ in enumerate(self.dataset['data']):
-            yield {k: v[idx] for k, v in self.dataset.items()}
+        yield from self.dataset
 
     def __len__(self) -> int:
         """
         Method is utilized to compute the length of the dataset
         :return: length of the dataset
         """
-        return len(self.dataset['data'])
+        return len(self.dataset)
 
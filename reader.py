@@ -1,8 +1,11 @@
 import os
-import pickle
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-from utilities import *
+from functools import cached_property
+from typing import Any, Iterator
+from utilities import check_dir, complete_parameters
+from token_store import TokenStore
+from tokenizer import get_tokenizer
+from artifacts import StageArtifact, fingerprint, file_fingerprint
+from metrics import timed
 
 class ReadDataset:
     """
@@ -13,9 +16,10 @@ class ReadDataset:
         Method is utilized as an initializer of the class
         :param config_parameters: all required parameters for the project
         """
-
+        config_parameters = complete_parameters(config_parameters)
         self.configuration = self.set_configuration(config_parameters)
-        self.dataset = self.get_dataset()
+        self.stage_key = fingerprint(self.configuration['ds_type'], self.configuration['tokenizer_config'],
+                                     file_fingerprint(self.configuration['input_dir']))
 
     @staticmethod
     def set_configuration(parameters: dict) -> dict:
@@ -27,44 +31,100 @@ class ReadDataset:
         check_dir(parameters['output_dir'])
         dataset_dir = os.path.join(parameters['input_dir'], f"{parameters['fact_set']}.tsv")
         raw_dataset = os.path.join(parameters['output_dir'], f"{parameters['fact_set']}_raw.pickle")
+        tokenize, tokenizer_config = get_tokenizer(parameters['tokenizer'])
         return {
             'ds_type': parameters['fact_set'],
             'input_dir': dataset_dir,
-            'raw_dir': raw_dataset
+            'raw_dir': raw_dataset,
+            'reader_mode': parameters['reader_mode'],
+            'tokenize': tokenize,
+            'tokenizer_config': tokenizer_config,
+            'token_store': TokenStore(parameters['output_dir'], parameters['fact_set'])
         }
 
+    @cached_property
+    def dataset(self) -> Any:
+        """
+        Method is utilized to read the dataset only when rows are requested, so that runs whose later stages are loaded
+        from artifacts do not read it at all
+        :return: dictionary of the dataset in pickle mode, None in stream mode (rows are read from the token store)
+        """
+        return self.get_dataset() if self.configuration['reader_mode'] == 'pickle' else self.build_store()
+
+    @timed('get_dataset')
     def get_dataset(self) -> dict:
         """
         Method is utilized as a main collector of the data
         :return: dictionary that contains all required information related to data
         """
-        data = open(self.configuration['input_dir'], 'r')
-        if not os.path.exists(self.configuration['raw_dir']):
-            all_tokens = list()
+        artifact = StageArtifact(self.configuration['raw_dir'])
+        raw_dict = artifact.load(self.stage_key)
+        if raw_dict is None:
+            tokenized = artifact.rows(self.configuration['tokenizer_config'])
+            rows = dict()
             raw_dict = {'id': list(), 'data': list(), 'label': list(), 'unigrams': list(), 'bigrams': list(),
                         'trigrams': list()}
-            sw = stopwords.words('english')
-            sw.extend(["'s", "'ve", "'re"])
+            with open(self.configuration['input_dir'], 'r') as dataset_file:
+                for each_line in dataset_file:
+                    data = each_line.split('\t')
+                    raw_dict['id'].append(data[0])
+                    raw_dict['data'].append(data[1])
+                    raw_dict['label'].append(
+                        data[2].replace('\n', '') if self.configuration['ds_type'] == 'training' else 'None'
+                    )
+                    tokens = tokenized[data[1]] if data[1] in tokenized else self.configuration['tokenize'](data[1])
+                    rows[data[1]] = tokens
+                    raw_dict['unigrams'].append(tokens)
+                    raw_dict['bigrams'].append(self.collect_ngrams(tokens, gram_size=2))
+                    raw_dict['trigrams'].append(self.collect_ngrams(tokens, gram_size=3))
 
-            for each_line in data:
-                data = each_line.split('\t')
-                raw_dict['id'].append(data[0])
-                raw_dict['data'].append(data[1])
-                raw_dict['label'].append(
-                    data[2].replace('\n', '') if self.configuration['ds_type'] == 'training' else 'None'
-                )
-                tokens = word_tokenize(data[1])
-                raw_dict['unigrams'].append(tokens)
-                all_tokens.extend(tokens)
-                raw_dict['bigrams'].append(self.collect_ngrams(tokens, gram_size=2))
-                raw_dict['trigrams'].append(self.collect_ngrams(tokens, gram_size=3))
-
-            with open(self.configuration['raw_dir'], 'wb') as data:
-                pickle.dump(raw_dict, data)
-        with open(self.configuration['raw_dir'], 'rb') as data:
-            raw_dict = pickle.load(data)
+            artifact.save(self.stage_key, self.configuration['tokenizer_config'], raw_dict, rows)
         return raw_dict
 
+    @timed('build_store')
+    def build_store(self) -> None:
+        """
+        Method is utilized to tokenize the dataset into the columnar token store (only when the dataset changes, and
+        only its changed rows), instead of materializing all n-grams of the dataset in memory
+        :return: None, since data is streamed by iter_rows
+        """
+        token_store = self.configuration['token_store']
+        if token_store.read_key().get('key') != self.stage_key:
+            with open(self.configuration['input_dir'], 'r') as data:
+                token_store.build((each_line.split('\t')[1] for each_line in data), self.configuration['tokenize'],
+                                  self.stage_key, self.configuration['tokenizer_config'])
+        return None
+
+    def iter_rows(self, ngrams: bool = True) -> Iterator:
+        """
+        Method is utilized to yield rows of the dataset one by one. In stream mode, tokens are read from the token store
+        and n-grams are computed on demand, so that only one row is kept in memory
+        :param ngrams: specifies whether bigrams and trigrams are required or not
+        :return: yields dictionary of id, data, label and tokens (and n-grams) of each row
+        """
+        if self.dataset is not None:
+            for idx in range(len(self.dataset['id'])):
+                row = {key: self.dataset[key][idx] for key in ['id', 'data', 'label', 'unigrams']}
+                if ngrams:
+                    row['bigrams'] = self.dataset['bigrams'][idx]
+                    row['trigrams'] = self.dataset['trigrams'][idx]
+                yield row
+            return
+        with open(self.configuration['input_dir'], 'r') as data:
+            for idx, each_line in enumerate(data):
+                data = each_line.split('\t')
+                tokens = self.configuration['token_store'].get_tokens(idx)
+                row = {
+                    'id': data[0],
+                    'data': data[1],
+                    'label': data[2].replace('\n', '') if self.configuration['ds_type'] == 'training' else 'None',
+                    'unigrams': tokens
+                }
+                if ngrams:
+                    row['bigrams'] = self.collect_ngrams(tokens, gram_size=2)
+                    row['trigrams'] = self.collect_ngrams(tokens, gram_size=3)
+                yield row
+
     @staticmethod
     def collect_ngrams(sentence: str, gram_size: int) -> list:
         """
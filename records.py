@@ -0,0 +1,230 @@
+from array import array
+from typing import Any, Iterator
+
+FIELDS = ('id', 'data', 'label', 'category', 'main_info', 'secondary_info', 'wiki_match_main', 'wiki_match_secondary',
+          'prediction', 'source')
+
+
+class FactRecord:
+    """
+    Class is utilized as a detached compact record of the fact (e.g., the one that is sent to the worker process).
+    Values are kept in slots, while item access (record['main_info']) keeps it interchangeable with dictionary rows
+    """
+    __slots__ = FIELDS
+
+    def __init__(self, *values: Any):
+        """
+        Method is utilized as an initializer of the class
+        :param values: values of the fields in the order of FIELDS (missing trailing values are None)
+        """
+        for field, value in zip(FIELDS, values + (None,) * (len(FIELDS) - len(values))):
+            setattr(self, field, value)
+
+    def __getitem__(self, key: str) -> Any:
+        """
+        Method is utilized to read the field as the item of the dictionary row
+        :param key: name of the field
+        :return: value of the field
+        """
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """
+        Method is utilized to write the field as the item of the dictionary row
+        :param key: name of the field
+        :param value: value of the field
+        :return: None
+        """
+        if key not in FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def keys(self) -> tuple:
+        """
+        Method is utilized to list the fields, so that the record can be copied into the dictionary (dict(record))
+        :return: names of the fields
+        """
+        return FIELDS
+
+    def __reduce__(self) -> tuple:
+        """
+        Method is utilized to pickle the record as the tuple of its values
+        :return: class and tuple of field values
+        """
+        return FactRecord, tuple(getattr(self, field) for field in FIELDS)
+
+
+class FactView:
+    """
+    Class is utilized as a zero-copy row of the fact table: it keeps only the table and the row index, values are read
+    from and written to the columns of the table
+    """
+    __slots__ = ('table', 'idx')
+
+    def __init__(self, table: 'FactTable', idx: int):
+        """
+        Method is utilized as an initializer of the class
+        :param table: fact table
+        :param idx: index of the row
+        """
+        self.table = table
+        self.idx = idx
+
+    def __getitem__(self, key: str) -> Any:
+        """
+        Method is utilized to read the field of the row
+        :param key: name of the field
+        :return: value of the field
+        """
+        return self.table.get(key, self.idx)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """
+        Method is utilized to write the field of the row
+        :param key: name of the field
+        :param value: value of the field
+        :return: None
+        """
+        self.table.set(key, self.idx, value)
+
+    def keys(self) -> tuple:
+        """
+        Method is utilized to list the fields, so that the row can be copied into the dictionary (dict(row))
+        :return: names of the fields
+        """
+        return FIELDS
+
+    def __reduce__(self) -> tuple:
+        """
+        Method is utilized to pickle the row as the detached record, so that the whole table is not pickled with it
+        :return: class and tuple of field values
+        """
+        return FactRecord, tuple(self.table.get(field, self.idx) for field in FIELDS)
+
+
+class FactTable:
+    """
+    Class is utilized as an array-backed table of processed facts. Each column is the array of 32-bit codes into the
+    shared list of distinct values (strings, labels, predictions), so that repeated values (entities, categories,
+    titles, sentences of several categories) are stored once and a fact costs a few bytes per field
+    """
+    def __init__(self):
+        """
+        Method is utilized as an initializer of the class
+        """
+        self.values = [None]
+        self.codes = {None: 0}
+        self.columns = {field: array('I') for field in FIELDS}
+        self.size = 0
+
+    def encode(self, value: Any) -> int:
+        """
+        Method is utilized to compute the code of the value, new values are added to the list of values
+        :param value: value of the field
+        :return: code of the value
+        """
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def append(self, **values: Any) -> None:
+        """
+        Method is utilized to add the row to the table
+        :param values: values of the fields, missing fields are None
+        :return: None
+        """
+        for field, column in self.columns.items():
+            column.append(self.encode(values.get(field)))
+        self.size += 1
+
+    def get(self, key: str, idx: int) -> Any:
+        """
+        Method is utilized to read the value of the cell
+        :param key: name of the field
+        :param idx: index of the row
+        :return: value of the cell
+        """
+        try:
+            column = self.columns[key]
+        except KeyError:
+            raise KeyError(key) from None
+        return self.values[column[idx]]
+
+    def set(self, key: str, idx: int, value: Any) -> None:
+        """
+        Method is utilized to write the value of the cell
+        :param key: name of the field
+        :param idx: index of the row
+        :param value: value of the cell
+        :return: None
+        """
+        self.columns[key][idx] = self.encode(value)
+
+    def column(self, key: str) -> Iterator:
+        """
+        Method is utilized to iterate over values of the column
+        :param key: name of the field
+        :return: iterator of the values of the column
+        """
+        values = self.values
+        return (values[code] for code in self.columns[key])
+
+    def copy(self) -> 'FactTable':
+        """
+        Method is utilized to copy the table, so that the copy can be modified independently
+        :return: copy of the table
+        """
+        table = FactTable()
+        table.values = list(self.values)
+        table.codes = dict(self.codes)
+        table.columns = {field: array('I', column) for field, column in self.columns.items()}
+        table.size = self.size
+        return table
+
+    def __getstate__(self) -> dict:
+        """
+        Method is utilized to pickle the table without the index of codes, which is rebuilt from the values
+        :return: state of the table
+        """
+        return {'values': self.values, 'columns': self.columns, 'size': self.size}
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Method is utilized to restore the pickled table
+        :param state: state of the table
+        :return: None
+        """
+        self.values = state['values']
+        self.codes = {value: code for code, value in enumerate(self.values)}
+        self.columns = state['columns']
+        self.size = state['size']
+
+    def __getitem__(self, idx: int) -> FactView:
+        """
+        Method is utilized to access the row
+        :param idx: index of the row
+        :return: view of the row
+        """
+        if not -self.size <= idx < self.size:
+            raise IndexError(idx)
+        return FactView(self, idx % self.size)
+
+    def __iter__(self) -> Iterator:
+        """
+        Method is utilized to iterate over rows of the table without copying their values
+        :return: iterator of views of the rows
+        """
+        for idx in range(self.size):
+            yield FactView(self, idx)
+
+    def __len__(self) -> int:
+        """
+        Method is utilized to compute the number of rows
+        :return: number of rows
+        """
+        return self.size
@@ -0,0 +1,159 @@
+import difflib
+import json
+import os
+import sqlite3
+import threading
+from typing import Callable, Iterable, Optional
+
+from artifacts import fingerprint
+from metrics import METRICS
+from utilities import complete_parameters, normalize
+
+
+class EntityResolver:
+    """
+    Class is utilized to resolve entities (main and secondary information) to wikipedia titles. Queries are normalized
+    and deduplicated, each unique entity is searched once and its top title is persisted across runs
+    """
+    def __init__(self, config_parameters: dict, identity: tuple):
+        """
+        Method is utilized as an initializer of the class
+        :param config_parameters: all required parameters for the project
+        :param identity: identity of the backend, resolutions of different sources are kept apart
+        """
+        config_parameters = complete_parameters(config_parameters)
+        self.configuration = self.set_configuration(config_parameters)
+        self.source = fingerprint(identity)
+        self.lock = threading.Lock()
+        self.titles = None
+        self.connection = sqlite3.connect(os.path.join(self.configuration['store_dir'], 'resolutions.sqlite'),
+                                          timeout=30, check_same_thread=False)
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS resolutions ('
+            'source TEXT NOT NULL, query TEXT NOT NULL, titles TEXT NOT NULL, PRIMARY KEY (source, query))'
+        )
+        self.connection.commit()
+
+    @staticmethod
+    def set_configuration(parameters: dict) -> dict:
+        """
+        Method is utilized to extract and generate task-specific parameters according to the provided parameters
+        :param parameters: all required parameters for the project
+        :return: configuration dictionary that contains required parameters for the specific task
+        """
+        store_dir = parameters['cache_dir'] if parameters['cache_dir'] else os.path.join(
+            parameters['output_dir'], 'page_cache'
+        )
+        if not os.path.exists(store_dir):
+            os.makedirs(store_dir)
+        return {
+            'store_dir': store_dir,
+            'title_index': parameters['title_index'],
+            'title_cutoff': 0.92
+        }
+
+    def get(self, query: str) -> Optional[list]:
+        """
+        Method is utilized to read the stored resolution of the query
+        :param query: normalized query
+        :return: list with the top title (empty list if nothing was found), None if query was not resolved yet
+        """
+        with self.lock:
+            row = self.connection.execute('SELECT titles FROM resolutions WHERE source = ? AND query = ?',
+                                          (self.source, query)).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def put(self, query: str, titles: list) -> None:
+        """
+        Method is utilized to store the resolution of the query. Changes are committed by commit method
+        :param query: normalized query
+        :param titles: list of found titles, only the top one is kept
+        :return: None
+        """
+        with self.lock:
+            self.connection.execute('INSERT OR REPLACE INTO resolutions VALUES (?, ?, ?)',
+                                    (self.source, query, json.dumps(titles[:1])))
+            if self.titles is not None and titles:
+                self.titles.setdefault(normalize(titles[0]), titles[0])
+
+    def commit(self) -> None:
+        """
+        Method is utilized to commit stored resolutions
+        :return: None
+        """
+        with self.lock:
+            self.connection.commit()
+
+    def get_titles(self) -> dict:
+        """
+        Method is utilized to build (once) the local title index from all titles which were resolved before
+        :return: dictionary in which keys are normalized titles and values are titles
+        """
+        if self.titles is None:
+            with self.lock:
+                rows = self.connection.execute('SELECT titles FROM resolutions WHERE source = ?',
+                                               (self.source,)).fetchall()
+            self.titles = dict()
+            for row in rows:
+                for title in json.loads(row[0]):
+                    self.titles.setdefault(normalize(title), title)
+        return self.titles
+
+    def match_title(self, query: str) -> Optional[str]:
+        """
+        Method is utilized to find the query in the local title index: the known title which is exactly the query,
+        otherwise the closest known title whose similarity to the query reaches the cutoff (e.g., typo or punctuation)
+        :param query: normalized query
+        :return: known title, None if there is no title close enough
+        """
+        titles = self.get_titles()
+        if query in titles:
+            return titles[query]
+        with self.lock:
+            candidates = list(titles)
+        matches = difflib.get_close_matches(query, candidates, n=1, cutoff=self.configuration['title_cutoff'])
+        if not matches:
+            return None
+        METRICS.increment('resolver_fuzzy')
+        return titles[matches[0]]
+
+    def lookup(self, query: str) -> Optional[list]:
+        """
+        Method is utilized to resolve the query without any search call: either from stored resolutions or (if it is
+        enabled) from the local title index, when the query is a known title or close to one
+        :param query: normalized query
+        :return: list with the top title (or empty list), None if query must be searched
+        """
+        titles = self.get(query)
+        if titles is None and self.configuration['title_index']:
+            title = self.match_title(query)
+            titles = [title] if title is not None else None
+        METRICS.increment('resolver_hit' if titles is not None else 'resolver_miss')
+        return titles
+
+    def resolve_all(self, queries: Iterable, search: Callable) -> Iterable:
+        """
+        Method is utilized to resolve all queries. Unique unresolved entities are searched once by the given search
+        function and results are yielded as soon as they are available
+        :param queries: list of queries
+        :param search: function that receives list of queries and returns iterator of their search results in order
+        :return: iterator of (query, list with the top title) pairs of all queries
+        """
+        groups = dict()
+        for query in queries:
+            groups.setdefault(normalize(query), list()).append(query)
+        pending = list()
+        for normalized, group in groups.items():
+            titles = self.lookup(normalized)
+            if titles is None:
+                pending.append(normalized)
+                continue
+            for query in group:
+                yield query, titles
+        try:
+            for normalized, results in zip(pending, search([groups[each][0] for each in pending])):
+                self.put(normalized, results)
+                for query in groups[normalized]:
+                    yield query, results[:1]
+        finally:
+            self.commit()
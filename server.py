@@ -0,0 +1,317 @@
+import json
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from metrics import METRICS, Metrics
+from pipeline import PipelineContext
+from utilities import collect_parameters, complete_parameters
+
+
+class LatencyTracker:
+    """
+    Class is utilized to keep latencies of the recent requests and to report their percentiles
+    """
+    def __init__(self, size: int = 10000):
+        """
+        Method is utilized as an initializer of the class
+        :param size: number of the recent latencies that are kept
+        """
+        self.latencies = deque(maxlen=size)
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def add(self, seconds: float) -> None:
+        """
+        Method is utilized to record the latency of the request
+        :param seconds: latency of the request in seconds
+        :return: None
+        """
+        with self.lock:
+            self.latencies.append(seconds)
+            self.requests += 1
+
+    def percentile(self, rank: float) -> float:
+        """
+        Method is utilized to compute the percentile of the recent latencies (nearest-rank method)
+        :param rank: requested percentile (e.g., 50 or 99)
+        :return: latency in milliseconds (0 if there was no request yet)
+        """
+        with self.lock:
+            latencies = sorted(self.latencies)
+        return Metrics.percentile(latencies, rank) * 1000
+
+    def summary(self) -> dict:
+        """
+        Method is utilized to summarize the latencies
+        :return: dictionary that contains number of requests, p50 and p99 latencies in milliseconds
+        """
+        return {'requests': self.requests, 'p50_ms': round(self.percentile(50), 3),
+                'p99_ms': round(self.percentile(99), 3)}
+
+
+class CheckHTTPServer(ThreadingHTTPServer):
+    """
+    Class is utilized as a threading HTTP server whose listen backlog is large enough for bursts of concurrent requests
+    (the default backlog of 5 connections resets the others)
+    """
+    request_queue_size = 128
+
+
+class FactCheckService:
+    """
+    Class is utilized to check raw fact sentences on request. Categories, synonyms, resolutions and pages are kept warm
+    in memory, and concurrent requests are micro-batched, so that searches and page lookups are shared within a batch
+    """
+    def __init__(self, config_parameters: dict, context: PipelineContext = None):
+        """
+        Method is utilized as an initializer of the class
+        :param config_parameters: all required parameters for the project
+        :param context: shared pipeline context (new context is created if it is not provided)
+        """
+        config_parameters = complete_parameters(config_parameters)
+        context = context if context is not None else PipelineContext(config_parameters)
+        self.configuration = self.set_configuration(config_parameters, context)
+        self.requests = queue.Queue()
+        self.latency = LatencyTracker()
+        self.batches = 0
+        self.thread = None
+
+    @staticmethod
+    def set_configuration(parameters: dict, context: PipelineContext) -> dict:
+        """
+        Method is utilized to extract and generate task-specific parameters according to the provided parameters
+        :param parameters: all required parameters for the project
+        :param context: shared pipeline context, which provides sentence processor and fact checker
+        :return: configuration dictionary that contains required parameters for the specific task
+        """
+        return {
+            'sentences': context.sentences,
+            'fact_checker': context.fact_checker,
+            'batch_size': max(parameters['batch_size'], 1),
+            'batch_window': parameters['batch_window'] / 1000
+        }
+
+    def start(self) -> None:
+        """
+        Method is utilized to start the batching loop in the background thread
+        :return: None
+        """
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """
+        Method is utilized to stop the batching loop, once the requests which were already received are answered
+        :return: None
+        """
+        self.requests.put(None)
+        self.thread.join()
+
+    def check(self, sentences: list) -> list:
+        """
+        Method is utilized to check the sentences. It can be called from many threads: the call is blocked until the
+        batch that contains the sentences is checked
+        :param sentences: list of raw fact sentences
+        :return: list of checking results in the same order as the sentences
+        """
+        start = time.perf_counter()
+        future = Future()
+        self.requests.put((sentences, future))
+        results = future.result()
+        self.latency.add(time.perf_counter() - start)
+        return results
+
+    def collect_batch(self) -> list:
+        """
+        Method is utilized to collect requests which arrive within the batch window (or until the batch is full)
+        :return: list of (sentences, future) pairs, None marks the end of the loop
+        """
+        batch = [self.requests.get()]
+        size = len(batch[0][0]) if batch[0] is not None else 0
+        deadline = time.perf_counter() + self.configuration['batch_window']
+        while batch[-1] is not None and size < self.configuration['batch_size']:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.requests.get(timeout=remaining))
+            except queue.Empty:
+                break
+            size += len(batch[-1][0]) if batch[-1] is not None else 0
+        return batch
+
+    def run(self) -> None:
+        """
+        Method is utilized as the batching loop: each batch of requests is checked at once and results are handed back
+        to the waiting requests
+        :return: None
+        """
+        running = True
+        while running:
+            batch = self.collect_batch()
+            if batch[-1] is None:
+                running = False
+                batch = batch[:-1]
+            if not batch:
+                continue
+            try:
+                results = self.check_batch([sentence for sentences, _ in batch for sentence in sentences])
+            except Exception as exception:
+                for _, future in batch:
+                    future.set_exception(exception)
+                continue
+            self.batches += 1
+            for sentences, future in batch:
+                future.set_result(results[:len(sentences)])
+                results = results[len(sentences):]
+
+    def check_batch(self, sentences: list) -> list:
+        """
+        Method is utilized to check all sentences of the batch at once, so that entities, pages and facts which are
+        shared by the sentences are resolved, fetched and checked only once
+        :param sentences: list of raw fact sentences
+        :return: list of checking results in the same order as the sentences
+        """
+        parsed = list()
+        for sentence in sentences:
+            try:
+                structure = self.configuration['sentences'].parse(sentence)
+                parsed.append([{'category': category, 'main_info': main_info, 'secondary_info': secondary_info}
+                               for category, main_info, secondary_info in structure])
+            except Exception:
+                parsed.append(None)
+        facts = [data for batch_facts in parsed if batch_facts for data in batch_facts]
+        checked = self.configuration['fact_checker'].check_facts(facts)
+
+        results = list()
+        for sentence, batch_facts in zip(sentences, parsed):
+            if batch_facts is None:
+                results.append({'sentence': sentence, 'error': 'structure of the sentence is not supported'})
+            else:
+                batch_facts = [next(checked) for _ in batch_facts]
+                results.append({
+                    'sentence': sentence,
+                    'prediction': any(data['prediction'] for data in batch_facts),
+                    'facts': batch_facts
+                })
+        return results
+
+    def get_stats(self) -> dict:
+        """
+        Method is utilized to collect statistics of the service
+        :return: dictionary that contains latency percentiles, number of requests and number of batches
+        """
+        stats = self.latency.summary()
+        stats['batches'] = self.batches
+        return stats
+
+
+class FactCheckServer:
+    """
+    Class is utilized as a long-running HTTP/JSON server around the fact-checking service. POST /check receives
+    {"sentences": [...]} (or {"sentence": "..."}), GET /stats reports p50/p99 latencies and GET /metrics exports all
+    metrics in Prometheus text format
+    """
+    def __init__(self, config_parameters: dict, context: PipelineContext = None):
+        """
+        Method is utilized as an initializer of the class
+        :param config_parameters: all required parameters for the project
+        :param context: shared pipeline context (new context is created if it is not provided)
+        """
+        config_parameters = complete_parameters(config_parameters)
+        self.service = FactCheckService(config_parameters, context)
+        self.server = CheckHTTPServer((config_parameters['host'], config_parameters['port']), self.set_handler())
+        self.thread = None
+
+    @property
+    def url(self) -> str:
+        """
+        Method is utilized to generate base url of the server
+        :return: base url of the server
+        """
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def set_handler(self) -> type:
+        """
+        Method is utilized to generate request handler class which is bound to this object
+        :return: request handler class
+        """
+        service = self.service
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                if self.path == '/stats':
+                    self.reply(200, service.get_stats())
+                elif self.path == '/metrics':
+                    self.reply(200, METRICS.to_prometheus(), 'text/plain; version=0.0.4')
+                else:
+                    self.reply(404, {'error': 'not found'})
+
+            def do_POST(self):
+                if self.path != '/check':
+                    self.reply(404, {'error': 'not found'})
+                    return
+                try:
+                    request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+                    sentences = request['sentences'] if 'sentences' in request else [request['sentence']]
+                    if not all(isinstance(sentence, str) for sentence in sentences):
+                        raise TypeError
+                except (ValueError, KeyError, TypeError):
+                    self.reply(400, {'error': 'request must be {"sentences": [...]} or {"sentence": "..."}'})
+                    return
+                self.reply(200, {'results': service.check(sentences)})
+
+            def reply(self, status: int, body: Any, content_type: str = 'application/json'):
+                content = (json.dumps(body) if content_type == 'application/json' else body).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> str:
+        """
+        Method is utilized to start the service and the server in the background threads
+        :return: base url of the server
+        """
+        self.service.start()
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self.url
+
+    def stop(self) -> None:
+        """
+        Method is utilized to stop the server and the service
+        :return: None
+        """
+        self.server.shutdown()
+        self.server.server_close()
+        self.service.stop()
+
+
+def __main__():
+    parameters = collect_parameters()
+    METRICS.configure(parameters)
+    server = FactCheckServer(parameters)
+    print(f'Fact-checking server is listening on {server.start()}')
+    try:
+        server.thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    __main__()
@@ -0,0 +1,103 @@
+import argparse
+import json
+import os
+from typing import Optional
+
+from artifacts import fingerprint
+from utilities import normalize, require_resources
+
+
+def load_expansion(synonyms: dict, path: str) -> dict:
+    """
+    Function is utilized to expand synonyms of each category by WordNet lemmas of the most common sense of each
+    synonym. Expansion is computed once and cached to disk, since it depends only on the synonyms vocabulary
+    :param synonyms: dictionary of synonyms of categories
+    :param path: path to the cached expansion (json file)
+    :return: dictionary in which keys are categories and values are lists of additional synonyms
+    """
+    key = fingerprint(synonyms)
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as expansion_file:
+            cached = json.load(expansion_file)
+        if cached['key'] == key:
+            return cached['expansion']
+    require_resources('corpora/wordnet')
+    from nltk.corpus import wordnet
+    expansion = dict()
+    for category, words in synonyms.items():
+        lemmas = list()
+        for word in words:
+            for synset in wordnet.synsets(word.replace(' ', '_'))[:1]:
+                lemmas.extend(lemma.replace('_', ' ').lower() for lemma in synset.lemma_names())
+        expansion[category] = [lemma for lemma in dict.fromkeys(lemmas) if lemma not in words]
+    with open(path + '.tmp', 'w', encoding='utf-8') as expansion_file:
+        json.dump({'key': key, 'expansion': expansion}, expansion_file, indent=2)
+    os.replace(path + '.tmp', path)
+    return expansion
+
+
+class SynonymIndex:
+    """
+    Class is utilized as a compiled lookup structure of synonyms: the inverted index maps each normalized synonym form
+    (e.g., an infobox key) to the set of categories it stands for, so that the table is matched against the category in
+    one pass over its keys (normalized forms of seen infobox keys are kept, since their vocabulary is small).
+    Categories which are not in the vocabulary are matched only by their own name
+    """
+    def __init__(self, synonyms: dict, expansion: Optional[dict] = None):
+        """
+        Method is utilized as an initializer of the class
+        :param synonyms: dictionary of synonyms of categories
+        :param expansion: dictionary of additional synonyms of categories (e.g., WordNet expansion)
+        """
+        expansion = expansion if expansion is not None else dict()
+        self.forms = {category: tuple(dict.fromkeys(words + expansion.get(category, list())))
+                      for category, words in synonyms.items()}
+        self.index = dict()
+        for category, forms in self.forms.items():
+            for form in forms:
+                self.index.setdefault(normalize(form), set()).add(category)
+        self.index = {form: frozenset(categories) for form, categories in self.index.items()}
+        self.keys = dict()
+
+    def get_forms(self, category: str) -> tuple:
+        """
+        Method is utilized to collect all synonym forms of the category
+        :param category: category which was extracted from the input sentence
+        :return: tuple of synonym forms (only the category itself, if it is not in the vocabulary)
+        """
+        return self.forms.get(category, (category,))
+
+    def match(self, table_dict: dict, category: str) -> tuple:
+        """
+        Method is utilized to find the first key of the table which stands for the category
+        :param table_dict: dictionary which contains table data: keys are labels, values are information
+        :param category: category which was extracted from the input sentence
+        :return: tuple of matching result and the key that was matched (None if there is no match)
+        """
+        keys = self.keys
+        index = self.index
+        target = None if category in self.forms else normalize(category)
+        for key in table_dict:
+            normalized = keys.get(key)
+            if normalized is None:
+                normalized = keys[key] = normalize(key)
+            if normalized == target if target is not None else category in index.get(normalized, ()):
+                return True, key
+        return False, None
+
+
+def __main__():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--output_dir', default='output', required=False, type=str)
+    arguments = parser.parse_args()
+    from fact_check import FactChecking
+    if not os.path.exists(arguments.output_dir):
+        os.makedirs(arguments.output_dir)
+    path = os.path.join(arguments.output_dir, 'synonyms_wordnet.json')
+    expansion = load_expansion(FactChecking.set_synonyms(), path)
+    print(f'{sum(len(words) for words in expansion.values())} synonyms were added to {len(expansion)} categories: '
+          f'{path}')
+
+
+if __name__ == '__main__':
+    __main__()
@@ -0,0 +1,20 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def pytest_configure(config) -> None:
+    config.addinivalue_line('markers', 'nltk(*resources): test requires NLTK resources, it is skipped without them')
+
+
+def pytest_runtest_setup(item) -> None:
+    import nltk
+    for marker in item.iter_markers('nltk'):
+        for resource in marker.args:
+            try:
+                nltk.data.find(resource)
+            except LookupError:
+                pytest.skip(f'NLTK resource {resource} is not available')
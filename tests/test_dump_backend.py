@@ -0,0 +1,74 @@
+import bz2
+from xml.sax.saxutils import escape
+
+import pytest
+
+from dump_backend import DumpBackend
+
+EINSTEIN = """{{Short description|German-born physicist}}
+{{Infobox scientist
+| name = Albert Einstein
+| birth_place = [[Ulm]], [[Kingdom of Württemberg|Württemberg]]
+| awards = {{plainlist|
+* [[Nobel Prize in Physics]] (1921)
+* [[Copley Medal]] {{small|(1925)}}}}
+| spouse = [[Mileva Marić]]<ref name="spouse">{{cite book|title=Einstein|year=2007}}</ref>
+| signature = <!-- hidden -->
+}}
+'''Albert Einstein''' was a [[physicist]] born in [[Ulm]].<ref name="x">{{cite web|url=http://example.org}}</ref>
+
+He received the [[Nobel Prize in Physics]] in 1921.<ref>Nobel Foundation</ref>
+== Life ==
+* Item of the list
+[[Category:Physicists]]
+"""
+PAGES = [
+    ('Albert Einstein', 0, None, EINSTEIN),
+    ('Einstein', 0, 'Albert Einstein', '#REDIRECT [[Albert Einstein]]'),
+    ('Nobel Prize in Physics', 0, None,
+     "The '''Nobel Prize in Physics''' is awarded by the [[Royal Swedish Academy]]."),
+    ('Talk:Albert Einstein', 1, None, '{{Infobox talk|topic = Physics}}\nDiscussion of the article.')
+]
+
+
+@pytest.fixture(scope='module')
+def backend(tmp_path_factory) -> DumpBackend:
+    directory = tmp_path_factory.mktemp('dump')
+    pages = [f'<page><title>{escape(title)}</title><ns>{ns}</ns>'
+             + (f'<redirect title="{escape(redirect)}" />' if redirect else '')
+             + f'<revision><text>{escape(text)}</text></revision></page>' for title, ns, redirect, text in PAGES]
+    xml = '<mediawiki xmlns="http://www.mediawiki.org/xml/export-0.10/">' + ''.join(pages) + '</mediawiki>'
+    dump_path = directory / 'dump.xml.bz2'
+    dump_path.write_bytes(bz2.compress(xml.encode('utf-8')))
+    return DumpBackend({'dump_path': str(dump_path), 'output_dir': str(directory / 'output')})
+
+
+def test_search(backend: DumpBackend) -> None:
+    assert backend.search('Albert Einstein') == ['Albert Einstein']
+    assert backend.search('einstein') == ['Albert Einstein']
+    assert backend.search('nobel physics') == ['Nobel Prize in Physics']
+    assert backend.search('Talk:Albert Einstein') == []
+    assert backend.search('Marie Curie') == []
+
+
+def test_get_table(backend: DumpBackend) -> None:
+    table = {
+        'name': 'Albert Einstein',
+        'birth place': 'Ulm, Württemberg',
+        'awards': 'Nobel Prize in Physics (1921) Copley Medal (1925)',
+        'spouse': 'Mileva Marić'
+    }
+    assert backend.get_table('Albert Einstein') == table
+    assert backend.get_table('Einstein') == table
+    assert backend.get_table('Nobel Prize in Physics') == 'no_table'
+    assert backend.get_table('Talk:Albert Einstein') == 'no_table'
+
+
+def test_get_paragraphs(backend: DumpBackend) -> None:
+    paragraphs = ['Albert Einstein was a physicist born in Ulm.', 'He received the Nobel Prize in Physics in 1921.']
+    assert backend.get_paragraphs('Albert Einstein') == paragraphs
+    assert backend.get_paragraphs('Einstein') == paragraphs
+    assert backend.get_paragraphs('Nobel Prize in Physics') == [
+        'The Nobel Prize in Physics is awarded by the Royal Swedish Academy.'
+    ]
+    assert backend.get_paragraphs('Talk:Albert Einstein') == []
@@ -0,0 +1,25 @@
+import pickle
+
+import pytest
+
+from artifacts import StageArtifact
+from evaluation import load_predictions
+
+PREDICTIONS = {'id': [1, 2], 'data': ['a', 'b'], 'label': [True, False], 'prediction': [True, True]}
+
+
+@pytest.mark.parametrize('stage_artifact', [False, True])
+def test_load_predictions(tmp_path, stage_artifact: bool) -> None:
+    path = str(tmp_path / 'predictions.pickle')
+    if stage_artifact:
+        StageArtifact(path).save('key', 'config', PREDICTIONS, dict())
+    else:
+        with open(path, 'wb') as predictions_file:
+            pickle.dump(PREDICTIONS, predictions_file)
+    assert load_predictions(path) == {
+        'id': [1, 2],
+        'label': [True, False],
+        'category': ['unknown', 'unknown'],
+        'prediction': [True, True],
+        'source': ['none', 'none']
+    }
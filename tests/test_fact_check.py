@@ -0,0 +1,63 @@
+import json
+import os
+import pickle
+
+import pytest
+
+from benchmark import synthetic_fixtures, synthetic_rows
+from evaluation import load_predictions
+from fact_check import FactChecking
+from local_wiki import LocalWiki
+from tokenizer import get_punkt_resource
+from utilities import collect_parameters
+
+pytestmark = pytest.mark.nltk('corpora/stopwords', get_punkt_resource())
+
+
+@pytest.fixture()
+def parameters(tmp_path) -> dict:
+    fixtures = synthetic_fixtures()
+    wiki = LocalWiki(fixtures['search'], fixtures['pages'])
+    wiki.start()
+    with open(tmp_path / 'training.tsv', 'w') as dataset_file:
+        dataset_file.writelines('\t'.join(row) + '\n' for row in synthetic_rows(40))
+    parameters = collect_parameters([])
+    parameters.update({'input_dir': str(tmp_path), 'output_dir': str(tmp_path), 'fact_set': 'training',
+                       'wiki_url': wiki.url, 'rate_limit': 0, 'cache_ttl': 0})
+    yield parameters
+    wiki.stop()
+
+
+def test_streamed_predictions_leave_fact_table_unchanged(parameters: dict) -> None:
+    fact_checker = FactChecking(parameters)
+    dataset = fact_checker.configuration['context'].sentences.dataset
+    snapshot = dataset.copy()
+    path = fact_checker.write_predictions('jsonl')
+    predictions = fact_checker.process_info()
+    assert dataset.values == snapshot.values and dataset.columns == snapshot.columns
+    assert set(dataset.column('prediction')) == {None}
+    with open(path, encoding='utf-8') as predictions_file:
+        streamed = [json.loads(line) for line in predictions_file]
+    assert [each['prediction'] for each in streamed] == predictions['prediction']
+    assert [each['id'] for each in streamed] == list(dataset.column('id'))
+
+
+def test_predictions_are_written_as_plain_dictionary(parameters: dict) -> None:
+    predictions = FactChecking(parameters).process_info()
+    path = os.path.join(parameters['output_dir'], 'predictions.pickle')
+    with open(path, 'rb') as predictions_file:
+        assert pickle.load(predictions_file) == predictions
+    assert set(predictions) == {'id', 'data', 'label', 'category', 'prediction', 'source'}
+    artifact_path = os.path.join(parameters['output_dir'], 'predictions_artifact.pickle')
+    assert load_predictions(artifact_path) == load_predictions(path)
+
+    os.remove(path)
+    assert FactChecking(parameters).process_info() == predictions
+    with open(path, 'rb') as predictions_file:
+        assert pickle.load(predictions_file) == predictions
+
+
+def test_parameters_of_earlier_versions_are_completed(tmp_path) -> None:
+    fact_checker = FactChecking({'input_dir': str(tmp_path), 'output_dir': str(tmp_path), 'fact_set': 'training'})
+    assert fact_checker.configuration['stream_size'] == collect_parameters([])['batch_size']
+    assert fact_checker.configuration['context'].parameters['knowledge_base'] is False
@@ -0,0 +1,130 @@
+import gzip
+import hashlib
+import time
+import zlib
+from types import SimpleNamespace
+from typing import Callable
+
+import brotli
+import pytest
+import requests
+
+import page_cache
+from benchmark import synthetic_fixtures
+from live_backend import LiveBackend
+from local_wiki import LocalWiki
+from page_cache import PageWriter
+from utilities import collect_parameters
+
+PAGE = ('<html><body><table class="infobox"><tr><th>Born</th><td>Ulm</td></tr></table>'
+        + ''.join(f'<p>Albert Einstein was born in Ulm ({idx}).</p>' for idx in range(200)) + '</body></html>')
+
+
+@pytest.fixture()
+def wiki() -> LocalWiki:
+    local_wiki = LocalWiki({'Albert Einstein': ['Albert Einstein']}, {'Albert Einstein': PAGE})
+    local_wiki.start()
+    yield local_wiki
+    local_wiki.stop()
+
+
+@pytest.fixture()
+def clock(monkeypatch) -> SimpleNamespace:
+    clock = SimpleNamespace(offset=0.0)
+    monkeypatch.setattr(page_cache, 'time', SimpleNamespace(time=lambda: time.time() + clock.offset))
+    return clock
+
+
+@pytest.fixture()
+def backend(wiki: LocalWiki, tmp_path) -> LiveBackend:
+    parameters = collect_parameters([])
+    parameters.update({'output_dir': str(tmp_path), 'wiki_url': wiki.url, 'rate_limit': 0, 'cache_ttl': 60})
+    live_backend = LiveBackend(parameters)
+    live_backend.configuration['fetcher'].backoff = 0.01
+    return live_backend
+
+
+def test_not_modified_page_is_refreshed_without_body(wiki: LocalWiki, backend: LiveBackend, clock) -> None:
+    assert backend.fetch_page('Albert Einstein') == PAGE
+    body_bytes = wiki.requests['bytes']
+    clock.offset = 120
+    url = backend.get_url('Albert Einstein')
+    assert url not in backend.configuration['page_cache']
+    assert backend.fetch_page('Albert Einstein') == PAGE
+    assert wiki.requests['page'] == 2 and wiki.requests['not_modified'] == 1
+    assert wiki.requests['bytes'] == body_bytes
+    assert url in backend.configuration['page_cache']
+
+
+def test_changed_page_is_downloaded_again(wiki: LocalWiki, backend: LiveBackend, clock) -> None:
+    digest = backend.get_digest('Albert Einstein')
+    assert digest == hashlib.sha1(PAGE.encode('utf-8')).hexdigest()
+    assert backend.get_table('Albert Einstein') == {'born': 'Ulm'}
+    wiki.pages['Albert Einstein'] = PAGE.replace('Ulm', 'Munich')
+    clock.offset = 120
+    assert backend.get_digest('Albert Einstein') == hashlib.sha1(PAGE.replace('Ulm', 'Munich').encode()).hexdigest()
+    assert backend.get_table('Albert Einstein') == {'born': 'Munich'}
+    assert wiki.requests['page'] == 2 and wiki.requests['not_modified'] == 0
+
+
+@pytest.mark.parametrize('encoding, compress', [('gzip', gzip.compress), ('br', brotli.compress)])
+def test_compressed_body_is_decoded(wiki: LocalWiki, backend: LiveBackend, encoding: str, compress: Callable) -> None:
+    fetcher = backend.configuration['fetcher']
+    assert encoding in fetcher.session.headers['Accept-Encoding'].split(',')
+    fetcher.session.headers['Accept-Encoding'] = encoding
+    writer = PageWriter()
+    status, etag, _ = fetcher.get(backend.get_url('Albert Einstein'), writer)
+    assert status == 200 and etag == f'"{hashlib.sha1(PAGE.encode("utf-8")).hexdigest()}"'
+    assert wiki.requests['bytes'] == len(compress(PAGE.encode('utf-8'))) < len(PAGE)
+    assert zlib.decompress(writer.content).decode('utf-8') == PAGE
+    assert writer.digest == hashlib.sha1(PAGE.encode('utf-8')).hexdigest()
+
+
+def test_unsuccessful_responses_are_not_cached(wiki: LocalWiki, backend: LiveBackend) -> None:
+    cache = backend.configuration['page_cache']
+    assert backend.fetch_page('Marie Curie') == ''
+    assert cache.get_content(backend.get_url('Marie Curie')) is None
+    wiki.fail('Albert Einstein', [503] * 4)
+    with pytest.raises(requests.HTTPError):
+        backend.fetch_page('Albert Einstein')
+    assert cache.get_content(backend.get_url('Albert Einstein')) is None
+    wiki.fail('Albert Einstein', [429, 503])
+    assert backend.fetch_page('Albert Einstein') == PAGE
+    assert cache.get(backend.get_url('Albert Einstein')) == PAGE
+
+
+def test_throttled_search_is_retried(wiki: LocalWiki, backend: LiveBackend) -> None:
+    wiki.fail('Albert Einstein', [429, 503])
+    assert backend.search('Albert Einstein') == ['Albert Einstein']
+    assert wiki.requests['search'] == 3
+    wiki.fail('Albert Einstein', [503] * 4)
+    with pytest.raises(requests.HTTPError):
+        backend.search('Albert Einstein')
+    assert backend.search('Albert Einstein') == ['Albert Einstein']
+
+
+def test_concurrent_requests_match_serial_requests(tmp_path) -> None:
+    fixtures = synthetic_fixtures()
+    titles = sorted(fixtures['pages'])
+    local_wiki = LocalWiki(fixtures['search'], fixtures['pages'])
+    local_wiki.start()
+    results = dict()
+    try:
+        for workers in [1, 8]:
+            parameters = collect_parameters([])
+            parameters.update({'output_dir': str(tmp_path / str(workers)), 'wiki_url': local_wiki.url,
+                               'rate_limit': 0, 'fetch_workers': workers})
+            live_backend = LiveBackend(parameters)
+            live_backend.configuration['fetcher'].backoff = 0.01
+            local_wiki.fail(titles[0], [503])
+            local_wiki.fail(titles[-1], [429])
+            searches = list(live_backend.map(live_backend.search, titles))
+            local_wiki.fail(titles[1], [503])
+            live_backend.prefetch(titles)
+            results[workers] = (searches, [live_backend.fetch_page(title) for title in titles],
+                                [live_backend.get_digest(title) for title in titles])
+    finally:
+        local_wiki.stop()
+    assert results[1] == results[8]
+    assert results[8][0] == [[title] for title in titles]
+    assert results[8][1] == [fixtures['pages'][title] for title in titles]
@@ -0,0 +1,98 @@
+import os
+
+import pytest
+
+from benchmark import synthetic_fixtures, synthetic_rows
+from fact_check import FactChecking
+from journal import HEADER, Journal
+from local_wiki import LocalWiki
+from tokenizer import get_punkt_resource
+from utilities import collect_parameters
+
+RECORDS = [('Albert Einstein', ['Albert Einstein']), ('Ulm', ['Ulm']), ('Marie Curie', ['Marie Curie'])]
+
+
+@pytest.fixture()
+def journal(tmp_path) -> Journal:
+    journal = Journal(str(tmp_path / 'stage.journal'))
+    assert journal.open('config') == list()
+    for record in RECORDS:
+        journal.append(record)
+    journal.file.close()
+    return journal
+
+
+def test_torn_last_record_is_cut_off(journal: Journal) -> None:
+    size = os.path.getsize(journal.path)
+    with open(journal.path, 'r+b') as journal_file:
+        journal_file.truncate(size - 5)
+    assert journal.open('config') == RECORDS[:-1]
+    journal.append(RECORDS[-1])
+    journal.file.close()
+    assert journal.replay() == ['config'] + RECORDS
+    assert os.path.getsize(journal.path) == size
+
+
+def test_corrupted_last_record_is_cut_off(journal: Journal) -> None:
+    size = os.path.getsize(journal.path)
+    with open(journal.path, 'r+b') as journal_file:
+        journal_file.seek(size - 1)
+        last = journal_file.read(1)
+        journal_file.seek(size - 1)
+        journal_file.write(bytes([last[0] ^ 0xFF]))
+    assert journal.replay() == ['config'] + RECORDS[:-1]
+    assert os.path.getsize(journal.path) < size - HEADER.size
+    assert journal.open('config') == RECORDS[:-1]
+    journal.append(('Pierre Curie', ['Pierre Curie']))
+    journal.file.close()
+    assert journal.replay() == ['config'] + RECORDS[:-1] + [('Pierre Curie', ['Pierre Curie'])]
+
+
+def test_journal_of_other_configuration_is_discarded(journal: Journal) -> None:
+    assert journal.open('other config') == list()
+    journal.file.close()
+    assert journal.replay() == ['other config']
+
+
+@pytest.mark.nltk('corpora/stopwords', get_punkt_resource())
+def test_process_info_resumes_from_journal(tmp_path, monkeypatch) -> None:
+    fixtures = synthetic_fixtures()
+    wiki = LocalWiki(fixtures['search'], fixtures['pages'])
+    wiki.start()
+    with open(tmp_path / 'training.tsv', 'w') as dataset_file:
+        dataset_file.writelines('\t'.join(row) + '\n' for row in synthetic_rows(60))
+    parameters = collect_parameters([])
+    parameters.update({'input_dir': str(tmp_path), 'fact_set': 'training', 'wiki_url': wiki.url, 'rate_limit': 0,
+                       'cache_ttl': 0, 'knowledge_base': False})
+    check_source = FactChecking.check_source
+    checked = list()
+
+    def counting_check_source(fact_checker: FactChecking, data: dict) -> tuple:
+        checked.append(fact_checker.get_row_key(data))
+        return check_source(fact_checker, data)
+
+    def crashing_check_source(fact_checker: FactChecking, data: dict) -> tuple:
+        if len(checked) == 10:
+            raise RuntimeError('crash')
+        return counting_check_source(fact_checker, data)
+
+    try:
+        complete = FactChecking({**parameters, 'output_dir': str(tmp_path / 'complete')}).process_info()
+        parameters['output_dir'] = str(tmp_path / 'resumed')
+        monkeypatch.setattr(FactChecking, 'check_source', crashing_check_source)
+        with pytest.raises(RuntimeError):
+            FactChecking(parameters).process_info()
+        journaled = set(checked)
+        assert len(Journal(os.path.join(parameters['output_dir'], 'predictions.journal')).replay()) == 11
+
+        checked.clear()
+        monkeypatch.setattr(FactChecking, 'check_source', counting_check_source)
+        fact_checker = FactChecking(parameters)
+        resumed = fact_checker.process_info()
+        rows = [fact_checker.get_row_key(each_data) for each_data in fact_checker.process_scrapping()]
+    finally:
+        wiki.stop()
+    assert 0 < len(checked) < len(rows)
+    assert checked == [row_key for row_key in rows if row_key not in journaled]
+    assert resumed == complete
+    assert not os.path.exists(os.path.join(parameters['output_dir'], 'predictions.journal'))
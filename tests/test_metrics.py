@@ -0,0 +1,16 @@
+from metrics import Metrics
+
+
+def test_drain_and_merge() -> None:
+    worker, parent = Metrics(), Metrics()
+    worker.increment('facts_checked', 3)
+    worker.increment('match_table')
+    worker.observe('check', 0.5)
+    parent.increment('facts_checked', 2)
+    parent.merge(worker.drain())
+    assert worker.summary()['counters'] == {}
+    assert worker.summary()['timers'] == {}
+    summary = parent.summary()
+    assert summary['counters'] == {'facts_checked': 5, 'match_table': 1}
+    assert summary['timers']['check']['count'] == 1
+    assert summary['timers']['check']['total_s'] == 0.5
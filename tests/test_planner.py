@@ -0,0 +1,21 @@
+from planner import CheckPlanner
+
+
+def test_outcome_is_checked_again_after_page_changes() -> None:
+    pages = {'Albert Einstein': 'Einstein was born in Ulm.'}
+    digests = {'Albert Einstein': 'a'}
+    calls = list()
+
+    def check_page(info_dict: dict) -> bool:
+        calls.append(info_dict['wiki_link'])
+        return info_dict['info'] in pages[info_dict['wiki_link']]
+
+    planner = CheckPlanner({'table': lambda info_dict: False, 'page': check_page}, digests.get, 16)
+    info_dict = {'wiki_link': 'Albert Einstein', 'info': 'Munich', 'category': 'birth place'}
+    assert planner.get_outcome('page', info_dict) is False
+    assert planner.get_outcome('page', info_dict) is False
+    assert calls == ['Albert Einstein']
+    pages['Albert Einstein'] = 'Einstein was born in Munich.'
+    digests['Albert Einstein'] = 'b'
+    assert planner.get_outcome('page', info_dict) is True
+    assert calls == ['Albert Einstein', 'Albert Einstein']
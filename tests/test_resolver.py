@@ -0,0 +1,49 @@
+import pytest
+
+from resolver import EntityResolver
+from utilities import collect_parameters
+
+TITLES = {'albert einstein': ['Albert Einstein'], 'nobel prize in physics': ['Nobel Prize in Physics'],
+          'john smith': ['John Smith'], 'unknown entity': list()}
+
+
+@pytest.fixture()
+def searched() -> list:
+    return list()
+
+
+def search(searched: list):
+    def search_all(queries: list) -> list:
+        searched.extend(queries)
+        return [TITLES.get(' '.join(query.split()).lower(), list()) for query in queries]
+    return search_all
+
+
+def get_resolver(tmp_path, title_index: bool) -> EntityResolver:
+    parameters = collect_parameters([])
+    parameters.update({'output_dir': str(tmp_path), 'title_index': title_index})
+    return EntityResolver(parameters, ('live', 'test'))
+
+
+def test_unique_entities_are_searched_once(tmp_path, searched: list) -> None:
+    resolver = get_resolver(tmp_path, False)
+    queries = ['Albert Einstein', 'albert  einstein ', 'Nobel Prize in Physics', 'Albert Einstein', 'Unknown entity']
+    assert dict(resolver.resolve_all(queries, search(searched))) == {
+        'Albert Einstein': ['Albert Einstein'], 'albert  einstein ': ['Albert Einstein'],
+        'Nobel Prize in Physics': ['Nobel Prize in Physics'], 'Unknown entity': list()
+    }
+    assert searched == ['Albert Einstein', 'Nobel Prize in Physics', 'Unknown entity']
+    resolved = dict(get_resolver(tmp_path, False).resolve_all(['ALBERT EINSTEIN', 'Unknown entity'], search(searched)))
+    assert resolved == {'ALBERT EINSTEIN': ['Albert Einstein'], 'Unknown entity': list()}
+    assert len(searched) == 3
+
+
+def test_title_index_matches_close_titles(tmp_path, searched: list) -> None:
+    list(get_resolver(tmp_path, False).resolve_all(['Albert Einstein', 'John Smith'], search(searched)))
+    resolver = get_resolver(tmp_path, True)
+    queries = ['Albert Einstien', 'Albert Einstein.', 'John Smyth', 'Marie Curie']
+    assert dict(resolver.resolve_all(queries, search(searched))) == {
+        'Albert Einstien': ['Albert Einstein'], 'Albert Einstein.': ['Albert Einstein'],
+        'John Smyth': list(), 'Marie Curie': list()
+    }
+    assert searched == ['Albert Einstein', 'John Smith', 'John Smyth', 'Marie Curie']
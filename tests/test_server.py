@@ -0,0 +1,85 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from benchmark import synthetic_fixtures, synthetic_rows
+from local_wiki import LocalWiki
+from process_sentences import ProcessSentences
+from server import FactCheckServer
+from tokenizer import get_punkt_resource
+from utilities import collect_parameters
+
+ROWS = synthetic_rows(40)
+
+
+def post(url: str, body: bytes) -> tuple:
+    request = urllib.request.Request(f'{url}/check', data=body, method='POST')
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+@pytest.fixture()
+def server(tmp_path, monkeypatch) -> str:
+    fixtures = synthetic_fixtures()
+    wiki = LocalWiki(fixtures['search'], fixtures['pages'])
+    wiki.start()
+    with open(tmp_path / 'training.tsv', 'w') as dataset_file:
+        dataset_file.writelines('\t'.join(row) + '\n' for row in ROWS)
+    parameters = collect_parameters([])
+    parameters.update({'input_dir': str(tmp_path), 'output_dir': str(tmp_path), 'fact_set': 'training',
+                       'wiki_url': wiki.url, 'rate_limit': 0, 'cache_ttl': 0, 'knowledge_base': False, 'port': 0,
+                       'batch_window': 50.0})
+    parse = ProcessSentences.parse
+
+    def failing_parse(sentences: ProcessSentences, sentence: str) -> list:
+        if sentence == 'Broken sentence.':
+            raise KeyError(sentence)
+        return parse(sentences, sentence)
+
+    monkeypatch.setattr(ProcessSentences, 'parse', failing_parse)
+    fact_check_server = FactCheckServer(parameters)
+    yield fact_check_server.start()
+    fact_check_server.stop()
+    wiki.stop()
+
+
+@pytest.mark.nltk('corpora/stopwords', get_punkt_resource())
+def test_concurrent_requests_are_batched_in_order(server: str) -> None:
+    sentences = [sentence for _, sentence, _ in ROWS]
+    responses = [None] * len(sentences)
+
+    def check(idx: int) -> None:
+        responses[idx] = post(server, json.dumps({'sentences': [sentences[idx], 'Broken sentence.']}).encode())
+
+    threads = [threading.Thread(target=check, args=(idx,)) for idx in range(len(sentences))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    serial = post(server, json.dumps({'sentences': sentences}).encode())
+
+    assert serial[0] == 200
+    for idx, (status, body) in enumerate(responses):
+        assert status == 200
+        assert [result['sentence'] for result in body['results']] == [sentences[idx], 'Broken sentence.']
+        assert body['results'][0] == serial[1]['results'][idx]
+        assert body['results'][1] == {'sentence': 'Broken sentence.',
+                                      'error': 'structure of the sentence is not supported'}
+    with urllib.request.urlopen(f'{server}/stats') as response:
+        stats = json.loads(response.read())
+    assert stats['requests'] == len(sentences) + 1
+    assert stats['batches'] < stats['requests']
+    assert 0 < stats['p50_ms'] <= stats['p99_ms']
+
+
+@pytest.mark.nltk('corpora/stopwords', get_punkt_resource())
+@pytest.mark.parametrize('body', [b'not json', b'{"sentences": [1, 2]}', b'{"text": "Ulm"}'])
+def test_malformed_request_is_rejected(server: str, body: bytes) -> None:
+    status, response = post(server, body)
+    assert status == 400 and 'error' in response
@@ -0,0 +1,53 @@
+import os
+
+import pytest
+
+from tokenizer import get_punkt_resource, punkt_tokenize, regex_tokenize
+
+pytestmark = pytest.mark.nltk(get_punkt_resource())
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SENTENCES = [
+    "Albert Einstein's award is Nobel Prize in Physics.",
+    "Nobel Prize in Physics is Albert Einstein's award.",
+    "Chelsea F.C.'s squad is Frank Lampard.",
+    "Jean-Paul Sartre's birth place is Paris.",
+    "Ulm is Albert Einstein's birth place",
+    "Marie Curie's spouse is Pierre Curie .",
+    "Star Wars (film)'s director is George Lucas.",
+    "\"Heroes\" (David Bowie album)'s author is David Bowie.",
+    "Guns N' Roses' member is Slash.",
+    "Cannot's author is gonna be Lemme.",
+    "Xi Jinping's country is China.  ",
+    "St. Petersburg is Fyodor Dostoevsky's death place.",
+    "The Lord of the Rings: The Return of the King's director is Peter Jackson."
+]
+
+
+def dataset_sentences() -> list:
+    """
+    Function is utilized to read all sentences of the training and test datasets, which are searched in FACT_DATA_DIR
+    (dataset directory of the repository by default)
+    :return: list of sentences (empty if there is no dataset)
+    """
+    input_dir = os.environ.get('FACT_DATA_DIR', os.path.join(ROOT, 'dataset'))
+    sentences = list()
+    for fact_set in ['training', 'test']:
+        path = os.path.join(input_dir, f'{fact_set}.tsv')
+        if os.path.exists(path):
+            with open(path, 'r') as dataset_file:
+                sentences.extend(each_line.split('\t')[1] for each_line in dataset_file if each_line.strip())
+    return sentences
+
+
+@pytest.mark.parametrize('sentence', SENTENCES)
+def test_regex_tokenize(sentence: str) -> None:
+    assert regex_tokenize(sentence) == punkt_tokenize(sentence)
+
+
+def test_regex_tokenize_dataset() -> None:
+    sentences = dataset_sentences()
+    if not sentences:
+        pytest.skip('dataset is not available (set FACT_DATA_DIR to the directory of training.tsv and test.tsv)')
+    mismatches = [sentence for sentence in dict.fromkeys(sentences)
+                  if regex_tokenize(sentence) != punkt_tokenize(sentence)]
+    assert mismatches == []
@@ -0,0 +1,19 @@
+import nltk
+import pytest
+
+from utilities import normalize, require_resources
+
+
+def test_failed_download_names_resource(monkeypatch) -> None:
+    def find(resource: str) -> None:
+        raise LookupError(resource)
+
+    monkeypatch.setattr(nltk.data, 'find', find)
+    monkeypatch.setattr(nltk, 'download', lambda package, quiet: False)
+    with pytest.raises(LookupError, match='corpora/stopwords'):
+        require_resources('corpora/stopwords')
+
+
+@pytest.mark.parametrize('text', ['Albert Einstein', ' albert  einstein\n', 'Albert_Einstein', 'ALBERT EINSTEIN'])
+def test_normalize(text: str) -> None:
+    assert normalize(text) == 'albert einstein'
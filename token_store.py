@@ -0,0 +1,142 @@
+import hashlib
+import json
+import mmap
+import os
+from array import array
+from typing import Callable, Iterable
+
+
+class TokenStore:
+    """
+    Class is utilized as a compact columnar storage of tokenized sentences: vocabulary, token-id array, row offsets and
+    row digests are kept in separate files, and arrays are read through mmap without loading them into memory
+    """
+    def __init__(self, store_dir: str, name: str):
+        """
+        Method is utilized as an initializer of the class
+        :param store_dir: directory in which the store files are kept
+        :param name: name of the store (e.g., fact set)
+        """
+        self.paths = {
+            'vocab': os.path.join(store_dir, f'{name}_tokens.vocab.json'),
+            'ids': os.path.join(store_dir, f'{name}_tokens.ids'),
+            'offsets': os.path.join(store_dir, f'{name}_tokens.offsets'),
+            'digests': os.path.join(store_dir, f'{name}_tokens.digests'),
+            'key': os.path.join(store_dir, f'{name}_tokens.key.json')
+        }
+        self.vocab = None
+        self.ids = None
+        self.offsets = None
+        self.digests = None
+
+    def exists(self) -> bool:
+        """
+        Method is utilized to check whether the store was built before
+        :return: boolean variable that specifies existence of all store files
+        """
+        return all(os.path.exists(path) for path in self.paths.values())
+
+    def read_key(self) -> dict:
+        """
+        Method is utilized to read hashes of inputs and configuration that the store was built for
+        :return: dictionary of key and config hashes (empty if the store does not exist)
+        """
+        if not self.exists():
+            return dict()
+        with open(self.paths['key'], 'r') as key_file:
+            return json.load(key_file)
+
+    @staticmethod
+    def get_digest(sentence: str) -> bytes:
+        """
+        Method is utilized to compute the digest of the sentence, which identifies the row across builds
+        :param sentence: input sentence
+        :return: 16-byte digest
+        """
+        return hashlib.blake2b(sentence.encode('utf-8'), digest_size=16).digest()
+
+    def build(self, sentences: Iterable, tokenize: Callable, key: str, config: str) -> None:
+        """
+        Method is utilized to build the store from sentences, writing token ids in chunks. Tokens of sentences which
+        exist in the previous store (built with the same configuration) are reused instead of tokenizing them again
+        :param sentences: iterable of sentences
+        :param tokenize: function that tokenizes the sentence
+        :param key: hash of inputs and configuration of the store
+        :param config: hash of configuration (i.e., tokenizer) of the store
+        :return: None
+        """
+        previous = dict()
+        if self.read_key().get('config') == config:
+            self.open()
+            previous = {bytes(self.digests[idx * 16: (idx + 1) * 16]): idx for idx in range(len(self))}
+
+        vocab = dict()
+        offsets = array('Q', [0])
+        chunk = array('I')
+        with open(f"{self.paths['ids']}.tmp", 'wb') as ids_file, \
+                open(f"{self.paths['digests']}.tmp", 'wb') as digests_file:
+            for sentence in sentences:
+                digest = self.get_digest(sentence)
+                tokens = self.get_tokens(previous[digest]) if digest in previous else tokenize(sentence)
+                for token in tokens:
+                    chunk.append(vocab.setdefault(token, len(vocab)))
+                offsets.append(offsets[-1] + len(tokens))
+                digests_file.write(digest)
+                if len(chunk) >= 65536:
+                    chunk.tofile(ids_file)
+                    chunk = array('I')
+            chunk.tofile(ids_file)
+        with open(f"{self.paths['offsets']}.tmp", 'wb') as offsets_file:
+            offsets.tofile(offsets_file)
+        with open(f"{self.paths['vocab']}.tmp", 'w') as vocab_file:
+            json.dump(list(vocab), vocab_file)
+        with open(f"{self.paths['key']}.tmp", 'w') as key_file:
+            json.dump({'key': key, 'config': config}, key_file)
+
+        self.vocab = self.ids = self.offsets = self.digests = None
+        for path in self.paths.values():
+            os.replace(f'{path}.tmp', path)
+
+    def open(self) -> None:
+        """
+        Method is utilized to map the store files into memory
+        :return: None
+        """
+        with open(self.paths['vocab'], 'r') as vocab_file:
+            self.vocab = json.load(vocab_file)
+        self.ids = self.map_array(self.paths['ids'], 'I')
+        self.offsets = self.map_array(self.paths['offsets'], 'Q')
+        self.digests = self.map_array(self.paths['digests'], 'B')
+
+    @staticmethod
+    def map_array(path: str, type_code: str) -> memoryview:
+        """
+        Method is utilized to map the binary array file into memory
+        :param path: path to the array file
+        :param type_code: type code of array items
+        :return: memoryview of the array (empty array if the file is empty)
+        """
+        if not os.path.getsize(path):
+            return memoryview(array(type_code))
+        with open(path, 'rb') as array_file:
+            mapped = mmap.mmap(array_file.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(mapped).cast(type_code)
+
+    def get_tokens(self, idx: int) -> list:
+        """
+        Method is utilized to read tokens of the sentence
+        :param idx: index of the sentence
+        :return: list of tokens
+        """
+        if self.ids is None:
+            self.open()
+        return [self.vocab[token_id] for token_id in self.ids[self.offsets[idx]: self.offsets[idx + 1]]]
+
+    def __len__(self) -> int:
+        """
+        Method is utilized to compute the number of sentences in the store
+        :return: number of sentences
+        """
+        if self.offsets is None:
+            self.open()
+        return len(self.offsets) - 1
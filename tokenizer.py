@@ -0,0 +1,69 @@
+import re
+from functools import lru_cache
+from typing import Callable
+
+from artifacts import fingerprint
+from utilities import require_resources
+
+WORD = r"\w+(?:-\w+)*(?:'s)?"
+SIMPLE = re.compile(rf"\s*{WORD}(?:\s+{WORD})*\.?\s*")
+TOKEN = re.compile(r"\w+(?:-\w+)*|'s|\.")
+CONTRACTIONS = re.compile(r"(?i)\b(?:cannot|d'ye|gimme|gonna|gotta|lemme|more'n|wanna)\b")
+
+
+@lru_cache(maxsize=None)
+def load_punkt() -> Callable:
+    """
+    Function is utilized to load word_tokenize of NLTK only when the first sentence is tokenized (NLTK is slow to
+    import), punkt models are downloaded only if they are missing
+    :return: word_tokenize function
+    """
+    from nltk.tokenize import word_tokenize
+    require_resources(get_punkt_resource())
+    return word_tokenize
+
+
+def get_punkt_resource() -> str:
+    """
+    Function is utilized to name punkt models which word_tokenize of the installed NLTK requires
+    :return: path of the resource: tokenizers/punkt_tab (NLTK 3.8.2 and newer) or tokenizers/punkt
+    """
+    from nltk.tokenize import punkt
+    return 'tokenizers/punkt_tab' if hasattr(punkt, 'PunktTokenizer') else 'tokenizers/punkt'
+
+
+def punkt_tokenize(sentence: str) -> list:
+    """
+    Function is utilized to tokenize the sentence by word_tokenize of NLTK
+    :param sentence: input sentence
+    :return: list of tokens
+    """
+    return load_punkt()(sentence)
+
+
+def regex_tokenize(sentence: str) -> list:
+    """
+    Function is utilized to tokenize the sentence by compiled regular expressions, which are tuned to the grammar of
+    fact sentences (e.g., X's category is Y.): words (with hyphens), possessive 's and the final period. Sentences out
+    of this grammar (quotes, brackets, inner periods, other punctuation) are tokenized by word_tokenize, so that tokens
+    are the same in both modes
+    :param sentence: input sentence
+    :return: list of tokens
+    """
+    if SIMPLE.fullmatch(sentence) is None or CONTRACTIONS.search(sentence) is not None:
+        return punkt_tokenize(sentence)
+    return TOKEN.findall(sentence)
+
+
+def get_tokenizer(name: str) -> tuple:
+    """
+    Function is utilized to choose the tokenizer according to the provided name
+    :param name: punkt (word_tokenize of NLTK) or regex
+    :return: tuple of tokenizer function and hash of its configuration
+    """
+    tokenizers = {
+        'punkt': (punkt_tokenize, fingerprint('word_tokenize')),
+        'regex': (regex_tokenize, fingerprint('regex_tokenize', SIMPLE.pattern, TOKEN.pattern, CONTRACTIONS.pattern))
+    }
+    return tokenizers[name]
+
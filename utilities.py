@@ -2,30 +2,68 @@ import argparse
 import os
 
 
-def collect_arguments() -> argparse.Namespace:
+def collect_arguments(arguments: list = None) -> argparse.Namespace:
     """
     Function is utilized user-defined parameters
+    :param arguments: list of command line arguments (sys.argv is used, if it is not provided)
     :return: Namespace object that includes all arguments
     """
     parser = argparse.ArgumentParser()
     parser.add_argument('--input_dir', default='dataset', required=False, type=str)
     parser.add_argument('--output_dir', default='output', required=False, type=str)
     parser.add_argument('--fact_set', default='training', choices=['training', 'test'], required=False, type=str)
-    return parser.parse_args()
+    parser.add_argument('--reader_mode', default='pickle', choices=['pickle', 'stream'], required=False, type=str)
+    parser.add_argument('--tokenizer', default='punkt', choices=['punkt', 'regex'], required=False, type=str)
+    parser.add_argument('--category_threshold', default=140, required=False, type=int)
+    parser.add_argument('--uppercase_threshold', default=12, required=False, type=int)
+    parser.add_argument('--workers', default=1, required=False, type=int)
+    parser.add_argument('--chunk_size', default=32, required=False, type=int)
+    parser.add_argument('--backend', default='live', choices=['live', 'dump'], required=False, type=str)
+    parser.add_argument('--dump_path', default=None, required=False, type=str)
+    parser.add_argument('--cache_dir', default=None, required=False, type=str)
+    parser.add_argument('--cache_ttl', default=30 * 24 * 60 * 60, required=False, type=int)
+    parser.add_argument('--cache_size', default=512, required=False, type=int)
+    parser.add_argument('--wiki_url', default='https://en.wikipedia.org', required=False, type=str)
+    parser.add_argument('--fetch_workers', default=8, required=False, type=int)
+    parser.add_argument('--rate_limit', default=20.0, required=False, type=float)
+    parser.add_argument('--title_index', default=False, required=False, action='store_true')
+    parser.add_argument('--host', default='127.0.0.1', required=False, type=str)
+    parser.add_argument('--port', default=8080, required=False, type=int)
+    parser.add_argument('--batch_size', default=64, required=False, type=int)
+    parser.add_argument('--batch_window', default=5.0, required=False, type=float)
+    parser.add_argument('--knowledge_base', default=False, required=False, action=argparse.BooleanOptionalAction)
+    parser.add_argument('--synonym_expansion', default=False, required=False, action=argparse.BooleanOptionalAction)
+    parser.add_argument('--profile_stage', default=None, required=False, type=str,
+                        choices=['get_dataset', 'build_store', 'categorize', 'read_data', 'process_scrapping',
+                                 'process_info', 'write_predictions'])
+    parser.add_argument('--output_format', default='pickle', choices=['pickle', 'jsonl', 'tsv'], required=False,
+                        type=str)
+    return parser.parse_args(arguments)
 
 
-def collect_parameters() -> dict:
+def collect_parameters(arguments: list = None) -> dict:
     """
     Function is utilized to generate dictionary of parameters
+    :param arguments: list of command line arguments (sys.argv is used, if it is not provided)
     :return: all required parameters for the project
     """
-    arguments = collect_arguments()
+    arguments = collect_arguments(arguments)
     parameters = dict()
     for argument in vars(arguments):
         parameters[argument] = getattr(arguments, argument)
     return parameters
 
 
+def complete_parameters(parameters: dict) -> dict:
+    """
+    Function is utilized to complete the parameters with default values of all arguments which were not provided, so
+    that dictionaries of earlier versions (e.g., only input_dir, output_dir and fact_set) are still accepted
+    :param parameters: provided parameters for the project
+    :return: all required parameters for the project
+    """
+    return {**collect_parameters([]), **parameters}
+
+
 def check_dir(directory: str) -> None:
     """
     Function is utilized to check the existence of the provided path
@@ -34,3 +72,32 @@ def check_dir(directory: str) -> None:
     """
     if not os.path.exists(directory):
         os.makedirs(directory)
+
+
+def normalize(text: str) -> str:
+    """
+    Function is utilized to put the name (e.g., query, title, entity, synonym form or infobox key) into standard shape,
+    so that the same name written differently (case, extra whitespaces, underscores of wikipedia titles) gets one key
+    :param text: name which is normalized
+    :return: case-folded name with single spaces instead of underscores and whitespaces
+    """
+    return ' '.join(text.replace('_', ' ').split()).casefold()
+
+
+def require_resources(*resources: str) -> None:
+    """
+    Function is utilized to download NLTK resources only when they are not available locally, so that runs do not
+    depend on the network once resources were downloaded (e.g., offline machines)
+    :param resources: paths of the resources (e.g., corpora/stopwords), last part of the path is the name of the package
+    :return: None
+    :raises LookupError: if the resource is not available and it could not be downloaded
+    """
+    import nltk
+    for resource in resources:
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            package = resource.split('/')[-1]
+            if not nltk.download(package, quiet=True):
+                raise LookupError(f"NLTK resource {resource} is not available and it could not be downloaded, "
+                                  f"download it by nltk.download('{package}') or point NLTK_DATA to it")